@@ -10,5 +10,12 @@ def event(Object, EventName):
     """ Decorate a function to be the handler of Object when EventName happens.
 
     The decorated function must have the exact signature as specified by the definition of EventName, which must appear in the Object class or one of its parent classes. Lists of objects and/or events can be passed in to apply the same handler to multiple events.
+
+    Raises:
+        - AttributeError if EventName is not defined by the Object class
+        - TypeError if the decorated function does not match the event signature
     """
-    pass
+    def decorator(Function):
+        system.EventDispatcher.Register(Object, EventName, Function)
+        return Function
+    return decorator
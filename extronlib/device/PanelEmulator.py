@@ -0,0 +1,236 @@
+import threading
+import system
+
+
+class PanelEmulator():
+    """ In-process stand-in for a touch panel.
+
+    A UIDevice created with the DeviceAlias of an emulator sends its updates to the emulator instead of a device. The emulator keeps the page, the popups and the last value of every control property, and Press(), Release(), Turn() and Slide() feed input back to the controls of the UIDevice as the device would. Updates and input are handled synchronously in the calling thread, so a program's UI logic can be exercised at thousands of events per second without hardware.
+
+    Note:
+        - The emulator must be created before the UIDevice that uses it.
+        - Popup durations follow extronlib.system.Scheduler.
+        - HidePopupGroup() only knows the groups passed as PopupGroups.
+
+    ---
+
+    Arguments:
+        - DeviceAlias (string) - Device Alias the UIDevice will use (e.g. 'Podium TLP')
+        - (optional) PopupGroups (dict) - popup group number to list of popup names or numbers
+
+    ---
+
+    Parameters:
+        - DeviceAlias - Returns (string) - the Device Alias
+        - Page - Returns (int, string) - the page shown, or None
+        - Popups - Returns (list) - the popups shown, in the order they were shown
+    """
+    _Emulators: dict = {}
+
+    def __init__(self, DeviceAlias: str, PopupGroups: dict=None) -> None:
+        """ PanelEmulator class constructor. Use PanelEmulator.Create() to register the emulator.
+
+        Arguments:
+            - DeviceAlias (string) - Device Alias the UIDevice will use (e.g. 'Podium TLP')
+            - (optional) PopupGroups (dict) - popup group number to list of popup names or numbers
+        """
+        self.DeviceAlias = DeviceAlias
+        self.Page = None
+        self._Groups = {group: list(popups) for group, popups in (PopupGroups or {}).items()}
+        self._Popups = {}
+        self._Controls = {}
+        self._Device = None
+        self._Lock = threading.RLock()
+        self._Writes = 0
+        self._Commands = 0
+        self._Inputs = 0
+        self._Handlers = {
+            'ShowPage': self._ShowPage,
+            'ShowPopup': self._ShowPopup,
+            'HidePopup': self._HidePopup,
+            'HidePopupGroup': self._HidePopupGroup,
+            'HideAllPopups': self._HideAllPopups,
+        }
+
+    @property
+    def Popups(self) -> list:
+        with self._Lock:
+            return list(self._Popups)
+
+    @classmethod
+    def Create(cls, DeviceAlias: str, PopupGroups: dict=None) -> 'PanelEmulator':
+        """ Create an emulator for DeviceAlias.
+
+        Arguments:
+            - DeviceAlias (string) - Device Alias the UIDevice will use (e.g. 'Podium TLP')
+            - (optional) PopupGroups (dict) - popup group number to list of popup names or numbers
+
+        Returns
+            - the emulator (PanelEmulator)
+
+        Raises:
+            - ValueError if an emulator for DeviceAlias already exists
+        """
+        if DeviceAlias in cls._Emulators:
+            raise ValueError('{} already exists'.format(DeviceAlias))
+        emulator = cls._Emulators[DeviceAlias] = cls(DeviceAlias, PopupGroups)
+        return emulator
+
+    @classmethod
+    def Get(cls, DeviceAlias: str) -> 'PanelEmulator':
+        """ Returns the emulator created for DeviceAlias, or None. """
+        return cls._Emulators.get(DeviceAlias)
+
+    def Attach(self, Device) -> None:
+        """ Bind a UIDevice to this emulator.
+
+        Arguments:
+            - Device (extronlib.device.UIDevice) - device using the emulator
+        """
+        self._Device = Device
+        Device._Panel = self
+        system.EventDispatcher.Emit(Device, 'Online', 'Online')
+
+    def Close(self) -> None:
+        """ Disconnect the UIDevice and forget the emulator. """
+        self._Emulators.pop(self.DeviceAlias, None)
+        with self._Lock:
+            for entry in self._Popups.values():
+                if entry is not None:
+                    system.Scheduler.Cancel(entry)
+            self._Popups.clear()
+        device = self._Device
+        if device is not None:
+            device._Panel = None
+            self._Device = None
+            system.EventDispatcher.Emit(device, 'Offline', 'Offline')
+
+    def GetControl(self, ID) -> dict:
+        """ Returns the last value received for each property of a control.
+
+        Arguments:
+            - ID (int, string) - control ID or Name
+
+        Returns
+            - dict of property name ('State', 'Text', 'Visible', 'Enable', 'Level', 'Range', 'Fill') to value (dict). Slide() sets 'Fill', and Turn() adds its steps to 'Turned'.
+        """
+        with self._Lock:
+            return dict(self._Controls.get(ID, ()))
+
+    def GetStatistics(self) -> dict:
+        """ Returns emulator counters.
+
+        Returns
+            - dict with the following keys:
+                - 'Writes' (int) - updates received from the UIDevice
+                - 'Commands' (int) - commands in those updates
+                - 'Inputs' (int) - presses, releases, turns and slides fed to the UIDevice
+        """
+        with self._Lock:
+            return {'Writes': self._Writes, 'Commands': self._Commands, 'Inputs': self._Inputs}
+
+    def Press(self, ID) -> None:
+        """ Press a button (or touch a slider) as a user would.
+
+        Arguments:
+            - ID (int, string) - control ID or Name
+        """
+        self._Input(ID, 'Pressed')
+
+    def Release(self, ID) -> None:
+        """ Release a button (or let go of a slider) as a user would.
+
+        Arguments:
+            - ID (int, string) - control ID or Name
+        """
+        self._Input(ID, 'Released')
+
+    def Slide(self, ID, value: float) -> None:
+        """ Move a slider as a user would.
+
+        Arguments:
+            - ID (int, string) - control ID or Name
+            - value (float) - new value
+        """
+        with self._Lock:
+            self._Property(ID)['Fill'] = value
+        self._Input(ID, 'Changed', value)
+
+    def Turn(self, ID, steps: int) -> None:
+        """ Turn a knob as a user would.
+
+        Arguments:
+            - ID (int) - control ID
+            - steps (int) - signed steps; positive is clockwise
+        """
+        with self._Lock:
+            properties = self._Property(ID)
+            properties['Turned'] = properties.get('Turned', 0) + steps
+        self._Input(ID, 'Turned', steps)
+
+    def Write(self, commands: list) -> None:
+        """ Apply one update from the UIDevice.
+
+        Arguments:
+            - commands (list of tuples) - (command, arguments...) as produced by UIDevice
+        """
+        with self._Lock:
+            self._Writes += 1
+            self._Commands += len(commands)
+            handlers = self._Handlers
+            controls = self._Controls
+            for command in commands:
+                handler = handlers.get(command[0])
+                if handler is not None:
+                    handler(*command[1:])
+                else:
+                    # Control update: ('SetState', ID, value) is kept as the 'State' property of ID.
+                    properties = controls.get(command[1])
+                    if properties is None:
+                        properties = controls[command[1]] = {}
+                    properties[command[0][3:]] = command[2]
+
+    def _Property(self, ID) -> dict:
+        properties = self._Controls.get(ID)
+        if properties is None:
+            properties = self._Controls[ID] = {}
+        return properties
+
+    def _Input(self, ID, Action: str, Value=None) -> None:
+        with self._Lock:
+            self._Inputs += 1
+            device = self._Device
+        if device is not None:
+            device._Input(ID, Action, Value)
+
+    def _ShowPage(self, page) -> None:
+        self.Page = page
+
+    def _ShowPopup(self, popup, duration: float=0) -> None:
+        entry = self._Popups.pop(popup, None)
+        if entry is not None:
+            system.Scheduler.Cancel(entry)
+        if duration:
+            deadline = system.Scheduler.Now() + duration
+            entry = system.Scheduler.Schedule(deadline, self._Expire, popup, deadline)
+        self._Popups[popup] = entry
+
+    def _HidePopup(self, popup) -> None:
+        entry = self._Popups.pop(popup, None)
+        if entry is not None:
+            system.Scheduler.Cancel(entry)
+
+    def _HidePopupGroup(self, group: int) -> None:
+        for popup in self._Groups.get(group, ()):
+            self._HidePopup(popup)
+
+    def _HideAllPopups(self) -> None:
+        for popup in list(self._Popups):
+            self._HidePopup(popup)
+
+    def _Expire(self, popup, deadline: float) -> None:
+        with self._Lock:
+            # The popup may have been shown again while this entry was due; only hide the showing this entry timed.
+            entry = self._Popups.get(popup)
+            if entry is not None and entry[0] == deadline:
+                del self._Popups[popup]
@@ -1,4 +1,8 @@
+import threading
+from contextlib import contextmanager
 from typing import Union
+import system
+from PanelEmulator import PanelEmulator
 
 
 class UIDevice():
@@ -7,6 +11,10 @@ class UIDevice():
     Note:
         - DeviceAlias must be a valid device Device Alias of an Extron device in the system.
         - If the part number is provided, the device will trigger a warning message in the program log if it does not match the connected device.
+        - Page, popup and control updates made inside a Batch() are sent to the device as one update when the batch ends.
+        - The last value sent for each control property is remembered, and updates that would not change it are not sent (see GetStatistics()).
+        - Off the processor, a panel can be simulated with PanelEmulator.Create() (see PanelEmulator.py) before the UIDevice.
+        - The ui_wrapper controls created on a device are indexed by ID or Name; use GetControl() and GetControls() rather than building lookup tables.
     
     ---
 
@@ -25,6 +33,7 @@ class UIDevice():
         - `DisplayTimer` - Returns (int) - Return display timer timeout seconds
         - `DisplayTimerEnabled` - Returns (bool) - current state of the display timer
         - `FirmwareVersion` - Returns (string) - the firmware version of this device
+        - `FlushInterval` - (float) - time in seconds over which control updates are coalesced before they are sent. 0 sends each change immediately.
         - `Hostname` - Returns (string) - the hostname of this device
         - `IPAddress` - Returns (string) - IP address of this device
         - `InactivityTime` - Returns (string) - Seconds since last activity. Note 0 = Active, Nonzero = Time of inactivity.
@@ -105,6 +114,8 @@ class UIDevice():
     """Return display timer timeout seconds"""
     DisplayTimerEnabled: bool
     FirmwareVersion: str
+    FlushInterval: float = 0.0
+    """time in seconds over which control updates are coalesced before they are sent. 0 sends each change immediately."""
     HDCPStatusChanged = None
     """
     ## Event: 
@@ -399,7 +410,57 @@ class UIDevice():
             - DeviceAlias (string) - Device Alias of the Extron device
             - (optional) PartNumber  (string) - device’s part number
         """
-        ...
+        self.DeviceAlias = DeviceAlias
+        self.PartNumber = PartNumber
+        self._Panel = None
+        self._Lock = threading.RLock()
+        self._Batch = None
+        self._Depth = 0
+        self._Shadow = {}
+        self._Dirty = {}
+        self._FlushEntry = None
+        self._Sent = 0
+        self._Suppressed = 0
+        self._Controls = {}
+        emulator = PanelEmulator.Get(DeviceAlias)
+        if emulator is not None:
+            emulator.Attach(self)
+
+    @contextmanager
+    def Batch(self):
+        """ Collect page, popup and control updates and send them as one update.
+
+        Calls that cancel each other out are dropped: only the last ShowPage() is kept, only the last ShowPopup() or HidePopup() of each popup is kept, HideAllPopups() drops the popup calls made before it, and a repeated HidePopupGroup() or HideAllPopups() replaces the earlier one. The order of the remaining calls is preserved.
+
+        Note:
+            - Batches may be nested. The update is sent when the outermost batch ends.
+            - Updates made by other threads while a batch is open join the batch.
+
+        ---
+
+        Example:
+        ```
+        with PodiumTLP.Batch():
+            PodiumTLP.ShowPage('Main')
+            PodiumTLP.HideAllPopups()
+            PodiumTLP.ShowPopup('Source Select')
+        ```
+        """
+        with self._Lock:
+            if self._Depth == 0:
+                self._Batch = []
+            self._Depth += 1
+        try:
+            yield self
+        finally:
+            with self._Lock:
+                self._Depth -= 1
+                if self._Depth:
+                    return
+                commands = self._Compact(self._Batch)
+                self._Batch = None
+                if commands:
+                    self._Send(commands)
 
     def Click(self, count: int=1, interval: float=None) -> None:
         """ Play default buzzer sound on applicable device
@@ -435,6 +496,37 @@ class UIDevice():
         """
         ...
 
+    def GetControl(self, ID: Union[int, str]):
+        """ Returns the ui_wrapper control created on this device with the given ID or Name, or None.
+
+        Arguments:
+            - ID (int, string) - ID or Name of the control
+        """
+        return self._Controls.get(ID)
+
+    def GetControls(self, IDs: list=None) -> list:
+        """ Bulk lookup of the ui_wrapper controls created on this device.
+
+        Arguments:
+            - (optional) IDs (list of ints or strings) - IDs or Names of the controls. All controls if omitted.
+
+        Returns
+            - the controls, in the order of IDs (list)
+
+        Raises:
+            - KeyError if no control has one of the IDs
+
+        ---
+
+        Example:
+        ```
+        Sources = PodiumTLP.GetControls(range(101, 109))
+        ```
+        """
+        if IDs is None:
+            return list(self._Controls.values())
+        return [self._Controls[ID] for ID in IDs]
+
     def  GetInputPresence(self, videoInput: str) -> bool:
         """ Return the current input presence status for the given input.
 
@@ -493,6 +585,18 @@ class UIDevice():
         """
         return ''
 
+    def GetStatistics(self) -> dict:
+        """ Returns control update counters.
+
+        Returns
+            - dict with the following keys:
+                - 'Sent' (int) - control updates sent to the device
+                - 'Suppressed' (int) - control updates not sent because they did not change anything or were replaced within FlushInterval
+                - 'Pending' (int) - control updates waiting for the end of FlushInterval
+        """
+        with self._Lock:
+            return {'Sent': self._Sent, 'Suppressed': self._Suppressed, 'Pending': len(self._Dirty)}
+
     def  GetVolume(self, name: str) -> int:
         """ Return current volume level for the given channel
 
@@ -527,7 +631,7 @@ class UIDevice():
 
     def HideAllPopups(self) -> None:
         """ Dismiss all popup pages """
-        ...
+        self._Write(('HideAllPopups',))
 
     def HidePopup(self, popup: Union[int, str]) -> None:
         """ Hide popup page
@@ -535,7 +639,7 @@ class UIDevice():
         Arguments:
             - popup (int, string) - popup page number or name
         """
-        ...
+        self._Write(('HidePopup', popup))
 
     def HidePopupGroup(self, group: int) -> None:
         """ Hide all popup pages in a popup group
@@ -552,7 +656,7 @@ class UIDevice():
             PodiumTLP.HidePopupGroup(1)
         ```
         """
-        ...
+        self._Write(('HidePopupGroup', group))
 
     def PlaySound(self, filename: str) -> None:
         """ Play a sound file identified by the filename
@@ -836,7 +940,7 @@ class UIDevice():
         Arguments:
             - page (int, string) - absolute page number or name
         """
-        ...
+        self._Write(('ShowPage', page))
 
     def ShowPopup(self, popup: Union[int, str], duration: float=0) -> None:
         """ Display pop-up page for a period of time.
@@ -848,7 +952,7 @@ class UIDevice():
         Note: 
             - If a pop-up is already showing for a finite period of time, calling this method again with the same pop-up will replace the remaining period with the new period.
         """
-        ...
+        self._Write(('ShowPopup', popup, duration))
 
     def Sleep(self):
         """ Force the device to sleep immediately """
@@ -861,3 +965,117 @@ class UIDevice():
     def Wake(self):
         """ Force the device to wake up immediately """
         ...
+
+    def _Write(self, *commands: tuple) -> None:
+        # Single path for device updates. Commands are tuples of the method name and its arguments.
+        with self._Lock:
+            if self._Batch is not None:
+                self._Batch.extend(commands)
+                return
+            self._Send(list(commands))
+
+    def _Update(self, ID, Command: str, value) -> None:
+        # Control property update; only the latest value per (ID, Command) within FlushInterval is sent.
+        key = (ID, Command)
+        with self._Lock:
+            pending = key in self._Dirty
+            if pending:
+                self._Suppressed += 1
+            if key in self._Shadow and self._Shadow[key] == value:
+                self._Suppressed += 1
+                if pending:
+                    del self._Dirty[key]
+                return
+            self._Dirty[key] = value
+            if self.FlushInterval <= 0:
+                self._Flush()
+            elif self._FlushEntry is None:
+                self._FlushEntry = system.Scheduler.Schedule(system.Scheduler.Now() + self.FlushInterval, self._Flush)
+
+    def _Apply(self, updates: list) -> None:
+        # Send (ID, Command, value) updates now, bypassing FlushInterval; used for timed effects such as blinking.
+        with self._Lock:
+            commands = []
+            for ID, command, value in updates:
+                key = (ID, command)
+                self._Dirty.pop(key, None)
+                if key in self._Shadow and self._Shadow[key] == value:
+                    self._Suppressed += 1
+                    continue
+                self._Shadow[key] = value
+                commands.append((command, ID, value))
+            if commands:
+                self._Sent += len(commands)
+                self._Write(*commands)
+
+    def _Flush(self) -> None:
+        with self._Lock:
+            self._FlushEntry = None
+            if not self._Dirty:
+                return
+            commands = [(command, ID, value) for (ID, command), value in self._Dirty.items()]
+            self._Shadow.update(self._Dirty)
+            self._Dirty.clear()
+            self._Sent += len(commands)
+            self._Write(*commands)
+
+    def _Reported(self, ID, Command: str, value) -> None:
+        # The device shows value already (e.g. a dragged slider): record it as sent and drop an older pending update.
+        with self._Lock:
+            key = (ID, Command)
+            self._Dirty.pop(key, None)
+            self._Shadow[key] = value
+
+    def _Register(self, control) -> None:
+        # Called by the ui_wrapper controls; indexes them for GetControl() and routes device input to them.
+        self._Controls[control.ID] = control
+
+    def _Input(self, ID, Action: str, Value=None) -> None:
+        # Route input reported by the device: 'Pressed' and 'Released' (buttons, sliders), 'Changed' (sliders), 'Turned' (knobs).
+        control = self._Controls.get(ID)
+        if control is None:
+            return
+        if hasattr(control, '_Slide'):
+            control._Slide(Action, Value)
+        elif Action == 'Turned' and hasattr(control, '_Turn'):
+            control._Turn(Value)
+        elif Action == 'Pressed' and hasattr(control, '_Press'):
+            control._Press()
+        elif Action == 'Released' and hasattr(control, '_Release'):
+            control._Release()
+
+    def _Send(self, commands: list) -> None:
+        if self._Panel is not None:
+            self._Panel.Write(commands)
+
+    def _Compact(self, commands: list) -> list:
+        kept = []
+        popups = {}
+        groups = {}
+        page = None
+        hideall = None
+        for command in commands:
+            name = command[0]
+            if name == 'ShowPage':
+                if page is not None:
+                    kept[page] = None
+                page = len(kept)
+            elif name in ('ShowPopup', 'HidePopup'):
+                previous = popups.get(command[1])
+                if previous is not None:
+                    kept[previous] = None
+                popups[command[1]] = len(kept)
+            elif name == 'HidePopupGroup':
+                previous = groups.get(command[1])
+                if previous is not None:
+                    kept[previous] = None
+                groups[command[1]] = len(kept)
+            elif name == 'HideAllPopups':
+                for index in [hideall, *popups.values(), *groups.values()]:
+                    if index is not None:
+                        kept[index] = None
+                popups.clear()
+                groups.clear()
+                hideall = len(kept)
+            kept.append(command)
+        return [command for command in kept if command is not None]
@@ -12,22 +12,36 @@ class ClientObject():
     Parameters:
         - Hostname - Returns (string) - Hostname DNS name of the connection. Can be the IP Address
         - IPAddress - Returns (string) - the IP Address of the connected device
+        - Dropped - Returns (int) - number of EthernetServerInterfaceEx.Broadcast() messages skipped because the client was too slow
         - ServicePort - Returns (int) - ServicePort port on which the client will listen for data
+
+    Note: Data waiting to be written to the client is bounded by the server's ClientBufferSize. Send() raises IOError rather than buffer more, so a slow client cannot exhaust memory. Data is accepted or refused as a whole, so data larger than ClientBufferSize is always refused.
     """
     Hostname: str
     """Hostname DNS name of the connection. Can be the IP Address"""
     IPAddress: str
     """the IP Address of the connected device"""
+    Dropped: int
+    """number of Broadcast() messages skipped because the client was too slow"""
     ServicePort: int
     """ServicePort port on which the client will listen for data"""
 
     def __init__(self):
         """ ClientObject class constructor. """
-        ...
+        self.Hostname = ''
+        self.IPAddress = ''
+        self.ServicePort = 0
+        self.Dropped = 0
+        self._Server = None
+        self._Key = None
+        self._Socket = None
+        self._Stream = None
+        self._Framer = None
 
     def Disconnect(self):
         """ Closes the connection gracefully on client. """
-        ...
+        if self._Server is not None:
+            self._Server.Disconnect(self)
 
     def Send(self, data: Union[bytes, str]) -> None:
         """ Send string to the client.
@@ -41,4 +55,34 @@ class ClientObject():
 
         >>> client.Send(b'Hello.\n')
         """
-        ...
+        if isinstance(data, str):
+            data = data.encode('iso-8859-1')
+        elif not isinstance(data, (bytes, bytearray, memoryview)):
+            raise TypeError('data must be bytes or str')
+        if self._Server.Protocol == 'UDP':
+            sock = self._Socket
+            if sock is None:
+                raise IOError('{} is not connected'.format(self.IPAddress))
+            sock.sendto(data, (self.IPAddress, self.ServicePort))
+            return
+        stream = self._Stream
+        if stream is None:
+            raise IOError('{} is not connected'.format(self.IPAddress))
+        if not stream.Write(data):
+            raise IOError('output buffer of {} is full'.format(self.IPAddress))
+
+    def SetFramer(self, Framer) -> None:
+        """ Deliver complete frames from this client to the server's ReceiveData instead of raw fragments.
+
+        Arguments:
+            - Framer (Framer) - framer for this client (see Framer.py), or None to deliver data as received
+
+        >>> client.SetFramer(DelimiterFramer(b'\r\n'))
+        """
+        self._Framer = Framer
+
+    def _Receive(self, data):
+        self._Server._Receive(self, data)
+
+    def _Closed(self, stream):
+        self.Disconnect()
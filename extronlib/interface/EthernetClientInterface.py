@@ -1,3 +1,16 @@
+import select
+import socket
+import threading
+from IOLoop import IOLoop
+from KeepAlive import KeepAlive
+from ReceiveBuffer import ReceiveBuffer
+from Reconnect import Reconnect
+from SendQueue import SendQueue
+from SSHSession import SSHSession
+from StreamTransport import StreamTransport
+import system
+
+
 class EthernetClientInterface():
     """ This class provides an interface to a client ethernet socket. This class allows the user to send data over the ethernet port in a synchronous or asynchronous manner.
 
@@ -28,6 +41,11 @@ class EthernetClientInterface():
             - Note:
                 - The maximum amount of data per ReceiveData event that will be passed into the handler is 1024 bytes. For payloads greater than 1024 bytes, multiple events will be triggered.
                 - When UDP protocol is used, the data will be truncated to 1024 bytes.
+        - ReceiveDataBatch - (Event) UDP only. Receives the datagrams read in one pass instead of one ReceiveData event per datagram. The callback takes two arguments. The first one is the EthernetClientInterface instance triggering the event and the second one is a list of bytes strings. When a handler is assigned, ReceiveData is not triggered for UDP data.
+
+    Note: All instances share one I/O loop (IOLoop.py); no thread is created per connection. Event handlers run on the I/O thread.
+
+    Note: Protocol 'SSH' requires the paramiko package. Interfaces with the same Hostname, IPPort and Credentials share one authenticated session (see SSHSession.py), so reconnecting does not repeat the key exchange.
     """
     Hostname = ''
     IPAddress = ''
@@ -38,6 +56,10 @@ class EthernetClientInterface():
     Connected = None
     Disconnected = None
     ReceiveData = None
+    ReceiveDataBatch = None
+
+    UDP_BATCH_SIZE = 64
+    _Pool = None
 
     def __init__(self, Hostname, IPPort, Protocol='TCP', ServicePort=0, Credentials=None):
         """ EthernetClientInterface class constructor.
@@ -54,6 +76,16 @@ class EthernetClientInterface():
         self.Protocol = Protocol
         self.ServicePort = ServicePort
         self.Credentials = Credentials
+        self.IPAddress = ''
+        self._Socket = None
+        self._Stream = None
+        self._Lock = threading.RLock()
+        self._Response = ReceiveBuffer()
+        self._Queue = None
+        self._Framer = None
+        self._SendCount = 0
+        if Protocol == 'UDP':
+            self._OpenUDP()
 
     def Connect(self, timeout=None):
         """ Connect to the server
@@ -66,28 +98,102 @@ class EthernetClientInterface():
         
         Note: Does not apply to UDP connections.
         """
-        pass
+        if self.Protocol == 'UDP':
+            return 'ConnectedAlready'
+        if self.Protocol not in ('TCP', 'SSH') or (self.Protocol == 'SSH' and not SSHSession.Available()):
+            return 'ProtocolUnavailable: {}'.format(self.Protocol)
+        with self._Lock:
+            if self._Stream is not None:
+                return 'ConnectedAlready'
+        try:
+            if self.Protocol == 'SSH':
+                if not self.Credentials:
+                    return 'AuthenticationFailed'
+                sock = SSHSession.Open(self.Hostname, self.IPPort, self.Credentials, timeout)
+            else:
+                sock = socket.create_connection((self.Hostname, self.IPPort), timeout)
+        except socket.timeout:
+            return 'TimedOut'
+        except socket.gaierror:
+            return 'HostError'
+        except OSError as error:
+            return error.strerror or str(error)
+        except Exception as error:
+            # paramiko reports authentication and protocol failures with its own exceptions.
+            return str(error) or type(error).__name__
+        sock.setblocking(False)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.IPAddress = sock.getpeername()[0]
+        stream = StreamTransport(sock, self._Receive, self._Closed)
+        with self._Lock:
+            if self._Stream is not None:
+                # Another Connect() (e.g. the reconnect supervisor's) finished first; keep its connection.
+                sock.close()
+                return 'ConnectedAlready'
+            self._Stream = stream
+        stream.Start()
+        system.EventDispatcher.Emit(self, 'Connected', 'Connected')
+        return 'Connected'
+
+    def DisableSendQueue(self):
+        """ Send data immediately again, dropping any queued commands. """
+        if self._Queue is not None:
+            self._Queue.Clear()
+            self._Queue = None
 
     def Disconnect(self):
         """ Disconnect the socket
 
-        Note: Does not apply to UDP connections.
+        Note:
+            - Does not apply to UDP connections.
+            - Stops the reconnect supervisor started by StartReconnect().
+        """
+        if self.Protocol != 'UDP':
+            Reconnect.Stop(self)
+            stream = self._Stream
+            if stream is not None:
+                stream.Close()
+
+    def EnableSendQueue(self, MinGap=0.0, MaxInFlight=None, Lanes=('High', 'Normal', 'Low'), Timeout=1.0):
+        """ Route Send() through a command queue (see SendQueue.py).
+
+        Arguments:
+            - (optional) MinGap (float) - minimum time in seconds between the starts of consecutive commands
+            - (optional) MaxInFlight (int) - maximum number of commands awaiting a response (None == Unlimited)
+            - (optional) Lanes (list of strings) - priority lanes, highest priority first
+            - (optional) Timeout (float) - time in seconds after which a command without response no longer counts as in flight
+
+        Returns
+            - the queue (SendQueue)
         """
-        pass
+        self._Queue = SendQueue(self._Write, MinGap, MaxInFlight, Lanes, Timeout)
+        return self._Queue
 
-    def Send(self, data):
+    def Send(self, data, Lane=None, Coalesce=False):
         """ Send string over ethernet port if it’s open
 
         Arguments:
             - data (bytes, string) - string to send out
+            - (optional) Lane (string) - priority lane, when the send queue is enabled
+            - (optional) Coalesce (bool) - drop data if identical data is already queued, when the send queue is enabled
         
         Raises:
             - TypeError
             - IOError
         """
-        pass
+        if isinstance(data, str):
+            data = data.encode('iso-8859-1')
+        elif not isinstance(data, (bytes, bytearray, memoryview)):
+            raise TypeError('data must be bytes or str')
+        queue = self._Queue
+        if queue is None:
+            self._Write(data)
+        elif self.Protocol != 'UDP' and self._Stream is None:
+            raise IOError('{}:{} is not connected'.format(self.Hostname, self.IPPort))
+        else:
+            queue.Put(bytes(data), Lane, Coalesce)
 
-    def SendAndWait(self, data, timeout, delimiter):
+    def SendAndWait(self, data, timeout, delimiter=None):
         """ Send data to the controlled device and wait (blocking) for response. It returns after timeout seconds expires or immediately if the optional condition is satisfied.
         
         Note: In addition to data and timeout, the method accepts an optional delimiter, which is used to compare against the received response. It supports any one of the following conditions:
@@ -105,7 +211,41 @@ class EthernetClientInterface():
         Returns:
             - Response received data (may be empty) (bytes)
         """
-        pass
+        return self._Response.SendAndWait(self.Send, data, timeout, delimiter, self._Pump if IOLoop.InLoop() else None)
+
+    def SendBatch(self, data):
+        """ Send several strings at once. Over UDP each string is sent as its own datagram, all under one lock; otherwise each string goes through Send().
+
+        Arguments:
+            - data (list of bytes or strings) - strings to send out
+
+        Raises:
+            - TypeError
+            - IOError
+        """
+        data = [item.encode('iso-8859-1') if isinstance(item, str) else item for item in data]
+        if not all(isinstance(item, (bytes, bytearray, memoryview)) for item in data):
+            raise TypeError('data must be a list of bytes or str')
+        if self.Protocol != 'UDP' or self._Queue is not None:
+            for item in data:
+                self.Send(item)
+            return
+        with self._Lock:
+            sock = self._Socket
+            if sock is None:
+                raise IOError('{}:{} is not connected'.format(self.Hostname, self.IPPort))
+            address = (self.Hostname, self.IPPort)
+            for item in data:
+                sock.sendto(item, address)
+            self._SendCount += len(data)
+
+    def SetFramer(self, Framer):
+        """ Deliver complete frames to ReceiveData instead of raw fragments.
+
+        Arguments:
+            - Framer (Framer) - framer for this connection (see Framer.py), or None to deliver data as received
+        """
+        self._Framer = Framer
 
     def StartKeepAlive(self, interval, data):
         """ Repeatedly sends data at the given interval
@@ -114,9 +254,122 @@ class EthernetClientInterface():
             - interval (float) - Time in seconds between transmissions
             - data (bytes, string) - data bytes to send
         """
-        pass
+        if isinstance(data, str):
+            data = data.encode('iso-8859-1')
+        KeepAlive.Start(self, interval, data)
+
+    def StartReconnect(self, MinDelay=1.0, MaxDelay=60.0, timeout=5.0):
+        """ Reconnect automatically whenever the connection is lost (see Reconnect.py). Connects right away if not connected.
+
+        Arguments:
+            - (optional) MinDelay (float) - upper bound in seconds of the delay before the first attempt after a drop
+            - (optional) MaxDelay (float) - upper bound in seconds of the delay between attempts
+            - (optional) timeout (float) - time in seconds each attempt may take
+
+        Note: Does not apply to UDP connections.
+        """
+        if self.Protocol != 'UDP':
+            Reconnect.Start(self, MinDelay, MaxDelay, timeout)
 
     def StopKeepAlive(self):
         """ Stop the currently running keep alive routine
         """
-        pass
+        KeepAlive.Stop(self)
+
+    def StopReconnect(self):
+        """ Stop reconnecting automatically. The current connection is left as it is.
+        """
+        Reconnect.Stop(self)
+
+    def _Write(self, data):
+        with self._Lock:
+            if self.Protocol == 'UDP':
+                self._Socket.sendto(data, (self.Hostname, self.IPPort))
+            elif self._Stream is None:
+                raise IOError('{}:{} is not connected'.format(self.Hostname, self.IPPort))
+            else:
+                self._Stream.Write(data)
+            # Counted only once written, so a failed keep-alive is not mistaken for traffic (see KeepAlive).
+            self._SendCount += 1
+
+    def _OpenUDP(self):
+        if EthernetClientInterface._Pool is None:
+            # Only the I/O thread reads, so one pool serves every UDP interface.
+            EthernetClientInterface._Pool = [memoryview(bytearray(IOLoop.CHUNK_SIZE)) for _ in range(self.UDP_BATCH_SIZE)]
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.bind(('', self.ServicePort))
+        sock.setblocking(False)
+        self.ServicePort = sock.getsockname()[1]
+        self._Socket = sock
+        IOLoop.Register(sock, self._OnDatagrams)
+
+    def _OnDatagrams(self):
+        sock = self._Socket
+        pool = self._Pool
+        while sock is not None:
+            batch = []
+            try:
+                for buffer in pool:
+                    size = sock.recv_into(buffer)
+                    batch.append(bytes(buffer[:size]))
+            except (BlockingIOError, ConnectionRefusedError):
+                pass
+            except OSError:
+                sock = None
+            if batch:
+                self._ReceiveBatch(batch)
+            if len(batch) < len(pool):
+                return
+
+    def _Pump(self, timeout):
+        if self.Protocol != 'UDP':
+            stream = self._Stream
+            if stream is not None:
+                stream.Pump(timeout)
+            return
+        readable, _, _ = select.select([self._Socket], [], [], timeout)
+        if readable:
+            self._OnDatagrams()
+
+    def _Receive(self, data):
+        for frame in self._Unclaimed(data):
+            IOLoop.Deliver(system.EventDispatcher.Emit, self, 'ReceiveData', frame)
+
+    def _ReceiveBatch(self, batch):
+        frames = []
+        for data in batch:
+            frames += self._Unclaimed(data)
+        if not frames:
+            return
+        if system.EventDispatcher.GetHandler(self, 'ReceiveDataBatch') is not None:
+            IOLoop.Deliver(system.EventDispatcher.Emit, self, 'ReceiveDataBatch', frames)
+        else:
+            for frame in frames:
+                IOLoop.Deliver(system.EventDispatcher.Emit, self, 'ReceiveData', frame)
+
+    def _Unclaimed(self, data):
+        # A send queue counts each frame as one response; without a framer, each chunk or datagram.
+        queue = self._Queue
+        if self._Framer is None:
+            if queue is not None:
+                queue.Complete()
+            data = self._Response.Feed(data)
+            return (data,) if data else ()
+        data = self._Response.Feed(data)
+        frames = self._Framer.Feed(data) if data else []
+        if queue is not None and frames:
+            queue.Complete(len(frames))
+        return frames
+
+    def _Closed(self, stream):
+        with self._Lock:
+            if self._Stream is not stream:
+                return
+            self._Stream = None
+        self._Response.Cancel()
+        if self._Queue is not None:
+            self._Queue.Clear()
+        if self._Framer is not None:
+            self._Framer.Reset()
+        system.EventDispatcher.Emit(self, 'Disconnected', 'Disconnected')
+        Reconnect._Lost(self)
@@ -1,3 +1,10 @@
+import socket
+from ClientObject import ClientObject
+from IOLoop import IOLoop
+from StreamTransport import StreamTransport
+import system
+
+
 class EthernetServerInterfaceEx():
     """ This class provides an interface to an Ethernet server that allows a user-defined amount of client connections. After instantiation, the server is started by calling StartListen(). This class allows the user to send data over the Ethernet port in an asynchronous manner using Send() and ReceiveData after a client has connected.
 
@@ -12,6 +19,7 @@ class EthernetServerInterfaceEx():
     ---
 
     Parameters:
+        - ClientBufferSize - (int) - maximum number of bytes waiting to be written to one client before ClientObject.Send() raises IOError
         - Clients - Returns (list of ClientObject) - List of connected clients.
         - IPPort - Returns (int) - IP Port number of the listening service
         - Interface - Returns (string) - name of interface on which the server is listening ('Any', 'LAN' of 'AVLAN')
@@ -24,13 +32,17 @@ class EthernetServerInterfaceEx():
         - Connected - (Event) Triggers when socket connection is established. The callback takes two arguments. The first one is the ClientObject instance triggering the event and the second one is a string ('Connected').
         - Disconnected - (Event) Triggers when the socket connection is broken. The callback takes two arguments. The first one is the ClientObject instance triggering the event and the second one is a string ('Disconnected').
         - ReceiveData - (Event) Receive Data event handler used for asynchronous transactions. The callback takes two arguments. The first one is the ClientObject instance triggering the event and the second one is a bytes string.
+
+    Note: Call SetFramer() on a ClientObject, e.g. from the Connected handler, to receive complete frames from that client.
+
+    Note: The server is serviced by the shared IOLoop. Clients are kept in a table keyed by socket (TCP) or address (UDP), so finding the client for incoming data or removing a client is O(1).
     """
 
     IPPort = 0
     Protocol = ''
     Interface = ''
     MaxClients = None
-    Clients = []
+    ClientBufferSize = 65536
     Connected = None
     Disconnected = None
     ReceiveData = None
@@ -49,6 +61,57 @@ class EthernetServerInterfaceEx():
         self.Protocol = Protocol
         self.Interface = Interface
         self.MaxClients = MaxClients
+        self._Clients = {}
+        self._Socket = None
+        self._Entry = None
+
+    @property
+    def Clients(self):
+        return list(self._Clients.values())
+
+    def Broadcast(self, data, filter=None):
+        """ Send the same data to every connected client, or to the clients selected by filter.
+
+        The data is encoded once and the same buffer is written to every socket. A client whose output buffer cannot take the data is skipped, not waited for, and its Dropped count is incremented. Data larger than ClientBufferSize is dropped for every TCP client.
+
+        Arguments:
+            - data (bytes, string) - string to send out
+            - (optional) filter (function) - called with each ClientObject; the client receives the data only if it returns True
+
+        Returns
+            - the clients that did not receive the data (list of ClientObject)
+
+        Raises:
+            - TypeError
+
+        >>> dropped = Server.Broadcast(b'Room=Occupied\r\n')
+        """
+        if isinstance(data, str):
+            data = data.encode('iso-8859-1')
+        elif isinstance(data, (bytearray, memoryview)):
+            data = bytes(data)
+        elif not isinstance(data, bytes):
+            raise TypeError('data must be bytes or str')
+        dropped = []
+        udp = self.Protocol == 'UDP'
+        for client in list(self._Clients.values()):
+            if filter is not None and not filter(client):
+                continue
+            try:
+                if udp:
+                    sock = client._Socket
+                    if sock is None:
+                        continue
+                    sock.sendto(data, (client.IPAddress, client.ServicePort))
+                    continue
+                stream = client._Stream
+                if stream is None or stream.Write(data):
+                    continue
+            except (BlockingIOError, IOError):
+                pass
+            client.Dropped += 1
+            dropped.append(client)
+        return dropped
 
     def Disconnect(self, client):
         """ Closes the connection gracefully on specified client.
@@ -56,7 +119,15 @@ class EthernetServerInterfaceEx():
         Arguments:
             - client (ClientObject) - handle to client object        
         """
-        pass
+        if self._Clients.pop(client._Key, None) is None:
+            return
+        stream = client._Stream
+        client._Socket = client._Stream = None
+        if stream is not None:
+            stream.Close()
+        if client._Framer is not None:
+            client._Framer.Reset()
+        self._Emit('Disconnected', client, 'Disconnected')
 
     def StartListen(self, timeout=0):
         """ Start the listener
@@ -79,9 +150,100 @@ class EthernetServerInterfaceEx():
 
         Note: If 'Listening' not in result, the server will not be listening.
         """
-        pass
+        if self._Socket is not None:
+            return 'ListeningAlready'
+        kind = socket.SOCK_DGRAM if self.Protocol == 'UDP' else socket.SOCK_STREAM
+        sock = socket.socket(socket.AF_INET, kind)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.bind(('', self.IPPort))
+        except OSError:
+            sock.close()
+            return 'PortUnavailable'
+        if kind == socket.SOCK_STREAM:
+            sock.listen(socket.SOMAXCONN)
+        sock.setblocking(False)
+        self._Socket = sock
+        IOLoop.Register(sock, self._OnAccept if kind == socket.SOCK_STREAM else self._OnDatagram)
+        if timeout:
+            self._Entry = system.Scheduler.Schedule(system.Scheduler.Now() + timeout, self.StopListen)
+        return 'Listening'
 
-    def StopListen(self, client):
+    def StopListen(self, client=None):
         """ Stop the listener
+
+        Arguments:
+            - (optional) client (ClientObject) - ignored; accepted for compatibility with earlier releases
+
+        Note: Connected clients stay connected.
         """
-        pass
+        if self._Entry is not None:
+            system.Scheduler.Cancel(self._Entry)
+            self._Entry = None
+        sock = self._Socket
+        if sock is None:
+            return
+        self._Socket = None
+        if self.Protocol == 'UDP':
+            for client in self.Clients:
+                self.Disconnect(client)
+        IOLoop.Unregister(sock)
+        sock.close()
+
+    def _OnAccept(self):
+        listener = self._Socket
+        while listener is not None:
+            try:
+                sock, address = listener.accept()
+            except BlockingIOError:
+                return
+            except OSError:
+                return
+            if self.MaxClients is not None and len(self._Clients) >= self.MaxClients:
+                sock.close()
+                continue
+            sock.setblocking(False)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            client = self._NewClient(sock.fileno(), address)
+            client._Stream = StreamTransport(sock, client._Receive, client._Closed, self.ClientBufferSize)
+            self._Clients[client._Key] = client
+            client._Stream.Start()
+            self._Emit('Connected', client, 'Connected')
+
+    def _OnDatagram(self):
+        sock = self._Socket
+        while sock is not None:
+            try:
+                data, address = sock.recvfrom(IOLoop.CHUNK_SIZE)
+            except BlockingIOError:
+                return
+            except OSError:
+                return
+            client = self._Clients.get(address)
+            if client is None:
+                if self.MaxClients is not None and len(self._Clients) >= self.MaxClients:
+                    continue
+                client = self._Clients[address] = self._NewClient(address, address)
+                client._Socket = sock
+                self._Emit('Connected', client, 'Connected')
+            self._Receive(client, data)
+
+    def _NewClient(self, key, address):
+        client = ClientObject()
+        client.Hostname = client.IPAddress = address[0]
+        client.ServicePort = address[1]
+        client._Server = self
+        client._Key = key
+        return client
+
+    def _Receive(self, client, data):
+        if client._Framer is None:
+            self._Emit('ReceiveData', client, data)
+        else:
+            for frame in client._Framer.Feed(data):
+                self._Emit('ReceiveData', client, frame)
+
+    def _Emit(self, EventName, client, value):
+        handler = system.EventDispatcher.GetHandler(self, EventName)
+        if handler is not None:
+            IOLoop.Deliver(handler, client, value)
@@ -0,0 +1,256 @@
+from abc import ABC, abstractmethod
+
+
+class Framer(ABC):
+    """ Base class of the ReceiveData framers.
+
+    A framer attached with SetFramer() to an EthernetClientInterface, SerialInterface, ClientObject or SummitConnect turns the received stream into complete frames, so each ReceiveData event carries exactly one frame instead of an arbitrary fragment.
+
+    Received data is appended to one bytearray and each frame is cut out of it once. The consumed part is removed once per received chunk, so reassembly is linear in the amount of data rather than quadratic.
+
+    Note:
+        - Frames include their delimiter or header, as received.
+        - A framer keeps the state of one stream. Attach a separate instance to each interface.
+        - Data still waiting for its end is discarded when it grows past MaxSize, and when the connection closes.
+        - Subclasses implement _Match().
+
+    ---
+
+    Arguments:
+        - (optional) MaxSize (int) - maximum number of bytes held while waiting for the end of a frame
+
+    ---
+
+    Parameters:
+        - MaxSize - Returns (int) - maximum number of bytes held while waiting for the end of a frame
+        - Overflows - Returns (int) - number of times incomplete data was discarded for exceeding MaxSize
+    """
+
+    def __init__(self, MaxSize: int=65536) -> None:
+        """ Framer class constructor.
+
+        Arguments:
+            - (optional) MaxSize (int) - maximum number of bytes held while waiting for the end of a frame
+        """
+        self.MaxSize = MaxSize
+        self.Overflows = 0
+        self._Buffer = bytearray()
+        self._Scanned = 0
+
+    def Feed(self, data: bytes) -> list:
+        """ Add received data to the stream.
+
+        Arguments:
+            - data (bytes) - received data
+
+        Returns
+            - the frames completed by data (list of bytes)
+        """
+        buffer = self._Buffer
+        buffer += data
+        frames = []
+        start = 0
+        while start < len(buffer):
+            end = self._Match(buffer, start)
+            if end < 0:
+                break
+            frames.append(bytes(buffer[start:end]))
+            start = end
+        if start:
+            del buffer[:start]
+            self._Scanned = max(0, self._Scanned - start)
+        if len(buffer) > self.MaxSize:
+            self.Reset()
+            self.Overflows += 1
+        return frames
+
+    def Reset(self) -> None:
+        """ Discard data waiting for the end of a frame. """
+        self._Buffer.clear()
+        self._Scanned = 0
+
+    @abstractmethod
+    def _Match(self, buffer: bytearray, start: int) -> int:
+        """ Returns the end of the frame beginning at start, or -1 if it is incomplete. """
+
+
+class DelimiterFramer(Framer):
+    """ Frames ending with a delimiter, e.g. b'\\r\\n'.
+
+    Only data not searched before, plus len(Delimiter) - 1 bytes of overlap, is searched when a chunk arrives.
+
+    ---
+
+    Arguments:
+        - Delimiter (bytes, string) - sequence ending each frame
+        - (optional) MaxSize (int) - maximum number of bytes held while waiting for the end of a frame
+    """
+
+    def __init__(self, Delimiter=b'\r\n', MaxSize: int=65536) -> None:
+        """ DelimiterFramer class constructor.
+
+        Arguments:
+            - Delimiter (bytes, string) - sequence ending each frame
+            - (optional) MaxSize (int) - maximum number of bytes held while waiting for the end of a frame
+
+        Raises:
+            - ValueError if Delimiter is empty
+        """
+        super().__init__(MaxSize)
+        if isinstance(Delimiter, str):
+            Delimiter = Delimiter.encode('iso-8859-1')
+        if not Delimiter:
+            raise ValueError('Delimiter must not be empty')
+        self.Delimiter = bytes(Delimiter)
+
+    def _Match(self, buffer: bytearray, start: int) -> int:
+        delimiter = self.Delimiter
+        index = buffer.find(delimiter, max(start, self._Scanned - len(delimiter) + 1))
+        if index < 0:
+            self._Scanned = len(buffer)
+            return -1
+        self._Scanned = index + len(delimiter)
+        return self._Scanned
+
+
+class FixedLengthFramer(Framer):
+    """ Frames of a fixed number of bytes.
+
+    ---
+
+    Arguments:
+        - Length (int) - number of bytes in each frame
+    """
+
+    def __init__(self, Length: int) -> None:
+        """ FixedLengthFramer class constructor.
+
+        Arguments:
+            - Length (int) - number of bytes in each frame
+
+        Raises:
+            - ValueError if Length is not positive
+        """
+        if Length < 1:
+            raise ValueError('Length must be positive')
+        super().__init__(Length)
+        self.Length = Length
+
+    def _Match(self, buffer: bytearray, start: int) -> int:
+        end = start + self.Length
+        return end if end <= len(buffer) else -1
+
+
+class LengthFramer(Framer):
+    """ Frames starting with a binary length header.
+
+    ---
+
+    Arguments:
+        - (optional) Size (int) - number of bytes in the length header
+        - (optional) ByteOrder (string) - 'big' or 'little'
+        - (optional) Offset (int) - number of bytes preceding the length header
+        - (optional) Inclusive (bool) - True if the length counts the header and the bytes preceding it, False if it counts only the bytes following it
+        - (optional) MaxSize (int) - maximum number of bytes held while waiting for the end of a frame
+    """
+
+    def __init__(self, Size: int=2, ByteOrder: str='big', Offset: int=0, Inclusive: bool=False, MaxSize: int=65536) -> None:
+        """ LengthFramer class constructor.
+
+        Arguments:
+            - (optional) Size (int) - number of bytes in the length header
+            - (optional) ByteOrder (string) - 'big' or 'little'
+            - (optional) Offset (int) - number of bytes preceding the length header
+            - (optional) Inclusive (bool) - True if the length counts the header and the bytes preceding it, False if it counts only the bytes following it
+            - (optional) MaxSize (int) - maximum number of bytes held while waiting for the end of a frame
+
+        Raises:
+            - ValueError
+        """
+        super().__init__(MaxSize)
+        if ByteOrder not in ('big', 'little'):
+            raise ValueError("ByteOrder must be 'big' or 'little'")
+        self.Size = Size
+        self.ByteOrder = ByteOrder
+        self.Offset = Offset
+        self.Inclusive = Inclusive
+
+    def _Match(self, buffer: bytearray, start: int) -> int:
+        header = start + self.Offset + self.Size
+        if header > len(buffer):
+            return -1
+        length = int.from_bytes(buffer[header - self.Size:header], self.ByteOrder)
+        end = (start if self.Inclusive else header) + length
+        if end < header:
+            # A length shorter than the header is corrupt and cannot be resynchronised; drop what is buffered.
+            del buffer[start:]
+            return -1
+        return end if end <= len(buffer) else -1
+
+
+class RegexFramer(Framer):
+    """ Frames ending where a regular expression matches.
+
+    Each frame runs from the end of the previous frame to the end of the match. A regular expression cannot resume a partial match, so the incomplete part is searched again, in place, when data arrives.
+
+    ---
+
+    Arguments:
+        - Pattern (regular expression object) - compiled bytes pattern
+        - (optional) MaxSize (int) - maximum number of bytes held while waiting for the end of a frame
+    """
+
+    def __init__(self, Pattern, MaxSize: int=65536) -> None:
+        """ RegexFramer class constructor.
+
+        Arguments:
+            - Pattern (regular expression object) - compiled bytes pattern
+            - (optional) MaxSize (int) - maximum number of bytes held while waiting for the end of a frame
+        """
+        super().__init__(MaxSize)
+        self.Pattern = Pattern
+
+    def _Match(self, buffer: bytearray, start: int) -> int:
+        match = self.Pattern.search(buffer, start)
+        if match is None or match.end() == start:
+            return -1
+        return match.end()
+
+
+class SISFramer(DelimiterFramer):
+    """ Frames of the Extron Simple Instruction Set.
+
+    Responses and unsolicited messages end with b'\\r\\n'. Empty lines are dropped, and login prompts, which have no line ending, are framed as soon as they are complete.
+
+    ---
+
+    Arguments:
+        - (optional) MaxSize (int) - maximum number of bytes held while waiting for the end of a frame
+    """
+    PROMPTS: tuple = (b'Password:', b'Login:')
+
+    def __init__(self, MaxSize: int=65536) -> None:
+        """ SISFramer class constructor.
+
+        Arguments:
+            - (optional) MaxSize (int) - maximum number of bytes held while waiting for the end of a frame
+        """
+        super().__init__(b'\r\n', MaxSize)
+
+    def Feed(self, data: bytes) -> list:
+        """ Add received data to the stream.
+
+        Arguments:
+            - data (bytes) - received data
+
+        Returns
+            - the frames completed by data, without empty lines (list of bytes)
+        """
+        return [frame for frame in super().Feed(data) if frame != b'\r\n']
+
+    def _Match(self, buffer: bytearray, start: int) -> int:
+        end = super()._Match(buffer, start)
+        if end < 0 and buffer.endswith(self.PROMPTS):
+            self._Scanned = len(buffer)
+            return len(buffer)
+        return end
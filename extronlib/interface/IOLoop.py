@@ -0,0 +1,284 @@
+import heapq
+import select
+import selectors
+import socket
+import threading
+import time
+import traceback
+from collections import deque
+from itertools import count
+
+
+class IOLoop():
+    """ Single I/O loop shared by every socket interface.
+
+    All registered sockets are serviced by one background thread, so the number of threads does not grow with the number of connected devices or clients. Read and write callbacks, and the event handlers they fire, run on that thread.
+
+    On Linux the loop uses edge-triggered epoll, so a busy socket is reported once per burst of data instead of on every pass. Elsewhere it falls back to a level-triggered selector.
+
+    Note:
+        - Callbacks must not block. Long running work belongs in a Wait or Timer.
+        - Readable callbacks must read until the socket would block, and writable callbacks must write until the socket would block or nothing is left. Otherwise an edge-triggered socket is not reported again. Event handlers fired from such a loop are called through Deliver(), so one that raises does not end the loop.
+        - Register(), Modify(), Unregister(), Call(), CallLater() and Cancel() may be used from any thread.
+        - CallLater() runs in real time, whatever the mode of extronlib.system.Scheduler. It is meant for transport timing (pacing, polling, idle timeouts), which must not stop when a test freezes the virtual clock.
+
+    ---
+
+    Parameters:
+        - CHUNK_SIZE - (int) - maximum number of bytes passed to a ReceiveData handler per event
+    """
+    CHUNK_SIZE: int = 1024
+
+    _Poller = None
+    _Handlers: dict = {}
+    _Lock = threading.RLock()
+    _Thread: threading.Thread = None
+    _Calls: deque = deque()
+    _Timers: list = []
+    _Sequence = count()
+    _WakeReader: socket.socket = None
+    _WakeWriter: socket.socket = None
+
+    @classmethod
+    def Register(cls, Socket, Readable: callable, Writable: callable=None) -> None:
+        """ Start watching Socket.
+
+        Arguments:
+            - Socket (socket) - non-blocking socket, file descriptor or object with fileno()
+            - Readable (function) - called without arguments when Socket has data to read
+            - (optional) Writable (function) - called without arguments when Socket can accept more data
+        """
+        with cls._Lock:
+            cls._Start()
+            fd = cls._FileNo(Socket)
+            cls._Handlers[fd] = (Readable, Writable)
+            cls._Poller.Register(fd, Writable is not None)
+            cls._Wake()
+
+    @classmethod
+    def Modify(cls, Socket, Readable: callable, Writable: callable=None) -> None:
+        """ Change the callbacks of a watched Socket. Passing Writable=None stops write notifications.
+
+        Arguments:
+            - Socket (socket) - a registered socket
+            - Readable (function) - called without arguments when Socket has data to read
+            - (optional) Writable (function) - called without arguments when Socket can accept more data
+        """
+        with cls._Lock:
+            fd = cls._FileNo(Socket)
+            cls._Handlers[fd] = (Readable, Writable)
+            cls._Poller.Modify(fd, Writable is not None)
+            cls._Wake()
+
+    @classmethod
+    def Unregister(cls, Socket) -> None:
+        """ Stop watching Socket. Unknown sockets are ignored. Must be called before Socket is closed.
+
+        Arguments:
+            - Socket (socket) - a registered socket
+        """
+        with cls._Lock:
+            fd = cls._FileNo(Socket)
+            if cls._Handlers.pop(fd, None) is not None:
+                cls._Poller.Unregister(fd)
+
+    @classmethod
+    def Call(cls, Function: callable, *args) -> None:
+        """ Execute Function(*args) on the I/O thread.
+
+        Arguments:
+            - Function (function) - code to execute
+            - args - arguments passed to Function
+        """
+        with cls._Lock:
+            cls._Start()
+            cls._Calls.append((Function, args))
+            cls._Wake()
+
+    @classmethod
+    def CallLater(cls, delay: float, Function: callable, *args) -> list:
+        """ Execute Function(*args) on the I/O thread after delay seconds of real time.
+
+        Arguments:
+            - delay (float) - time in seconds to wait
+            - Function (function) - code to execute
+            - args - arguments passed to Function
+
+        Returns
+            - handle for Cancel() (list)
+        """
+        with cls._Lock:
+            cls._Start()
+            entry = [time.monotonic() + delay, next(cls._Sequence), Function, args]
+            heapq.heappush(cls._Timers, entry)
+            cls._Wake()
+            return entry
+
+    @classmethod
+    def Cancel(cls, Entry: list) -> None:
+        """ Stop an entry created by CallLater() from executing.
+
+        Arguments:
+            - Entry (list) - handle returned by CallLater()
+        """
+        with cls._Lock:
+            Entry[2] = None
+            Entry[3] = ()
+
+    @classmethod
+    def Ready(cls, Socket) -> None:
+        """ Report Socket as writable. For socket-like objects whose write readiness cannot be polled, such as SSH channels.
+
+        Arguments:
+            - Socket (socket) - a registered socket
+        """
+        cls.Call(cls._Writable, cls._FileNo(Socket))
+
+    @classmethod
+    def Deliver(cls, Function: callable, *args) -> None:
+        """ Execute Function(*args), printing an exception it raises instead of propagating it.
+
+        Arguments:
+            - Function (function) - event handler, or code firing one
+            - args - arguments passed to Function
+        """
+        try:
+            Function(*args)
+        except Exception:
+            traceback.print_exc()
+
+    @classmethod
+    def InLoop(cls) -> bool:
+        """ Returns True when called from the I/O thread. """
+        return threading.current_thread() is cls._Thread
+
+    @staticmethod
+    def _FileNo(Socket) -> int:
+        return Socket if isinstance(Socket, int) else Socket.fileno()
+
+    @classmethod
+    def _Writable(cls, fd: int) -> None:
+        callbacks = cls._Handlers.get(fd)
+        if callbacks is not None and callbacks[1] is not None:
+            callbacks[1]()
+
+    @classmethod
+    def _Start(cls) -> None:
+        if cls._Thread is not None:
+            return
+        cls._Poller = _EPoll() if hasattr(select, 'epoll') else _Selector()
+        cls._WakeReader, cls._WakeWriter = socket.socketpair()
+        cls._WakeReader.setblocking(False)
+        cls._WakeWriter.setblocking(False)
+        cls._Poller.Register(cls._WakeReader.fileno(), False)
+        cls._Thread = threading.Thread(target=cls._Run, name='extronlib.IOLoop', daemon=True)
+        cls._Thread.start()
+
+    @classmethod
+    def _Wake(cls) -> None:
+        if not cls.InLoop():
+            try:
+                cls._WakeWriter.send(b'\0')
+            except BlockingIOError:
+                pass
+
+    @classmethod
+    def _Run(cls) -> None:
+        poller = cls._Poller
+        wake = cls._WakeReader.fileno()
+        handlers = cls._Handlers
+        while True:
+            timeout = cls._RunTimers()
+            # A due entry may have queued calls; run them without waiting for the next event.
+            for fd, readable, writable in poller.Poll(0 if cls._Calls else timeout):
+                if fd == wake:
+                    try:
+                        while cls._WakeReader.recv(4096):
+                            pass
+                    except BlockingIOError:
+                        pass
+                    continue
+                callbacks = handlers.get(fd)
+                if callbacks is None:
+                    continue
+                try:
+                    if readable:
+                        callbacks[0]()
+                    if writable and callbacks[1] is not None:
+                        callbacks = handlers.get(fd)
+                        if callbacks is not None and callbacks[1] is not None:
+                            callbacks[1]()
+                except Exception:
+                    traceback.print_exc()
+            while cls._Calls:
+                function, args = cls._Calls.popleft()
+                try:
+                    function(*args)
+                except Exception:
+                    traceback.print_exc()
+
+    @classmethod
+    def _RunTimers(cls) -> float:
+        # Runs the due entries; returns the time until the next one, or None.
+        timers = cls._Timers
+        while True:
+            with cls._Lock:
+                if not timers:
+                    return None
+                delay = timers[0][0] - time.monotonic()
+                if delay > 0:
+                    return delay
+                _, _, function, args = heapq.heappop(timers)
+            if function is not None:
+                try:
+                    function(*args)
+                except Exception:
+                    traceback.print_exc()
+
+
+class _EPoll():
+
+    def __init__(self) -> None:
+        self._EPoll = select.epoll()
+        self._READ = select.EPOLLIN | select.EPOLLRDHUP | select.EPOLLET
+        self._WRITE = select.EPOLLOUT
+        self._INPUT = select.EPOLLIN | select.EPOLLERR | select.EPOLLHUP | select.EPOLLRDHUP
+        self._OUTPUT = select.EPOLLOUT | select.EPOLLERR
+
+    def Register(self, fd: int, Write: bool) -> None:
+        self._EPoll.register(fd, self._READ | (self._WRITE if Write else 0))
+
+    def Modify(self, fd: int, Write: bool) -> None:
+        self._EPoll.modify(fd, self._READ | (self._WRITE if Write else 0))
+
+    def Unregister(self, fd: int) -> None:
+        try:
+            self._EPoll.unregister(fd)
+        except (OSError, ValueError):
+            pass
+
+    def Poll(self, timeout: float=None) -> list:
+        return [(fd, bool(events & self._INPUT), bool(events & self._OUTPUT))
+                for fd, events in self._EPoll.poll(-1 if timeout is None else timeout)]
+
+
+class _Selector():
+
+    def __init__(self) -> None:
+        self._Selector = selectors.DefaultSelector()
+
+    def Register(self, fd: int, Write: bool) -> None:
+        self._Selector.register(fd, selectors.EVENT_READ | (selectors.EVENT_WRITE if Write else 0))
+
+    def Modify(self, fd: int, Write: bool) -> None:
+        self._Selector.modify(fd, selectors.EVENT_READ | (selectors.EVENT_WRITE if Write else 0))
+
+    def Unregister(self, fd: int) -> None:
+        try:
+            self._Selector.unregister(fd)
+        except (KeyError, ValueError):
+            pass
+
+    def Poll(self, timeout: float=None) -> list:
+        return [(key.fd, bool(events & selectors.EVENT_READ), bool(events & selectors.EVENT_WRITE))
+                for key, events in self._Selector.select(timeout)]
@@ -0,0 +1,74 @@
+from IntervalGroups import IntervalGroups
+import system
+
+
+class KeepAlive():
+    """ Shared keep-alive scheduler behind StartKeepAlive() of SerialInterface and EthernetClientInterface.
+
+    Interfaces with the same interval are grouped, and each group needs one entry in extronlib.system.Scheduler, however many interfaces it contains (see IntervalGroups.py). Every interval the whole group is serviced in one pass.
+
+    Note:
+        - A keep-alive is suppressed when the interface sent anything else since the previous pass.
+        - An interface joining a group sends its first keep-alive with the group's next pass, so it may be sent earlier than one interval after StartKeepAlive().
+        - Send errors (e.g. a disconnected socket) are ignored; the keep-alive is retried on the next pass.
+    """
+    _Groups = IntervalGroups(lambda interval: KeepAlive._Pass(interval))
+    _Sent: int = 0
+    _Suppressed: int = 0
+
+    @classmethod
+    def Start(cls, Interface, interval: float, data: bytes) -> None:
+        """ Start sending data over Interface every interval seconds. Replaces a keep-alive already running on Interface.
+
+        Arguments:
+            - Interface (SerialInterface or EthernetClientInterface) - interface to keep alive
+            - interval (float) - Time in seconds between transmissions
+            - data (bytes) - data bytes to send
+        """
+        with cls._Groups.Lock:
+            group = cls._Groups.Add(Interface, interval, [data, Interface._SendCount])
+            if group['Entry'] is None:
+                cls._Groups.Schedule(interval, system.Scheduler.Now() + interval)
+
+    @classmethod
+    def Stop(cls, Interface) -> None:
+        """ Stop the keep-alive running on Interface, if any.
+
+        Arguments:
+            - Interface (SerialInterface or EthernetClientInterface) - interface kept alive
+        """
+        cls._Groups.Remove(Interface)
+
+    @classmethod
+    def GetStatistics(cls) -> dict:
+        """ Returns keep-alive counters.
+
+        Returns
+            - dict with the following keys:
+                - 'Groups' (int) - distinct intervals in use
+                - 'Interfaces' (int) - interfaces kept alive
+                - 'Sent' (int) - keep-alives sent
+                - 'Suppressed' (int) - keep-alives skipped because of recent traffic
+        """
+        with cls._Groups.Lock:
+            return {'Groups': cls._Groups.Groups, 'Interfaces': cls._Groups.Members, 'Sent': cls._Sent, 'Suppressed': cls._Suppressed}
+
+    @classmethod
+    def _Pass(cls, interval: float) -> None:
+        with cls._Groups.Lock:
+            group = cls._Groups.Get(interval)
+            if group is None:
+                return
+            members = list(group['Members'].items())
+            cls._Groups.Schedule(interval, group['Deadline'] + interval)
+        for interface, member in members:
+            if interface._SendCount != member[1]:
+                member[1] = interface._SendCount
+                cls._Suppressed += 1
+                continue
+            try:
+                interface.Send(member[0], Coalesce=True)
+            except IOError:
+                continue
+            member[1] = interface._SendCount
+            cls._Sent += 1
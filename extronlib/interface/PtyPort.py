@@ -0,0 +1,180 @@
+import errno
+import os
+import threading
+import tty
+from time import monotonic
+from IOLoop import IOLoop
+import system
+
+
+class PtyPort():
+    """ Simulated serial port backed by a Linux pseudo-terminal pair.
+
+    A device emulator opens DevicePath like a real serial device, and the SerialInterface created for Port talks to the other end. Data sent by the SerialInterface is paced as it would be on the wire, from Baud, Data, Parity, Stop and CharDelay. Pacing runs on the I/O loop in real time, also when extronlib.system.Scheduler is on the virtual clock, so data is delivered without advancing the clock and SendAndWait() behaves as it would with a device.
+
+    Note:
+        - The port must be created before the SerialInterface that uses it.
+        - FlowControl 'SW' honours XON/XOFF (0x11/0x13) received from the emulator. These bytes are removed from the received data.
+        - A pseudo-terminal has no RTS/CTS lines, so FlowControl 'HW' behaves like 'Off'.
+        - Initialize() on the SerialInterface changes the timing of data not yet sent.
+
+    ---
+
+    Arguments:
+        - Port (string) - port name the SerialInterface will use (e.g. 'COM1')
+
+    ---
+
+    Parameters:
+        - DevicePath - Returns (string) - path of the terminal the device emulator opens (e.g. '/dev/pts/3')
+        - Port - Returns (string) - the port name
+    """
+    XON: int = 0x11
+    XOFF: int = 0x13
+    QUANTUM: float = 0.01
+
+    _Ports: dict = {}
+
+    def __init__(self, Port: str) -> None:
+        """ PtyPort class constructor. Use PtyPort.Create() to register the port.
+
+        Arguments:
+            - Port (string) - port name the SerialInterface will use (e.g. 'COM1')
+        """
+        self.Port = Port
+        self._Master, self._Slave = os.openpty()
+        tty.setraw(self._Slave)
+        os.set_blocking(self._Master, False)
+        self.DevicePath = os.ttyname(self._Slave)
+        self._Interface = None
+        self._Output = bytearray()
+        self._Lock = threading.RLock()
+        self._CharTime = 0.0
+        self._Free = 0.0
+        self._Entry = None
+        self._Paused = False
+
+    @classmethod
+    def Create(cls, Port: str) -> 'PtyPort':
+        """ Create a pseudo-terminal pair for Port.
+
+        Arguments:
+            - Port (string) - port name the SerialInterface will use (e.g. 'COM1')
+
+        Returns
+            - the port (PtyPort)
+
+        Raises:
+            - ValueError if Port already exists
+        """
+        if Port in cls._Ports:
+            raise ValueError('{} already exists'.format(Port))
+        port = cls._Ports[Port] = cls(Port)
+        return port
+
+    @classmethod
+    def Get(cls, Port: str) -> 'PtyPort':
+        """ Returns the pseudo-terminal created for Port, or None. """
+        return cls._Ports.get(Port)
+
+    def Attach(self, Interface) -> None:
+        """ Bind a SerialInterface to this port.
+
+        Arguments:
+            - Interface (SerialInterface) - interface using the port
+        """
+        self._Interface = Interface
+        self.Configure()
+        IOLoop.Register(self._Master, self._OnReadable)
+        system.EventDispatcher.Emit(Interface, 'Online', 'Online')
+
+    def Close(self) -> None:
+        """ Close both ends of the pseudo-terminal and forget the port. """
+        with self._Lock:
+            if self._Master is None:
+                return
+            IOLoop.Unregister(self._Master)
+            if self._Entry is not None:
+                IOLoop.Cancel(self._Entry)
+                self._Entry = None
+            os.close(self._Master)
+            os.close(self._Slave)
+            self._Master = self._Slave = None
+            self._Output.clear()
+        self._Ports.pop(self.Port, None)
+        if self._Interface is not None:
+            system.EventDispatcher.Emit(self._Interface, 'Offline', 'Offline')
+
+    def Configure(self) -> None:
+        """ Recompute wire timing from the attached SerialInterface settings. """
+        interface = self._Interface
+        bits = 1 + interface.Data + (0 if interface.Parity == 'None' else 1) + interface.Stop
+        with self._Lock:
+            self._CharTime = bits / interface.Baud + (interface.CharDelay or 0)
+            if interface.FlowControl != 'SW':
+                self._Paused = False
+
+    def Write(self, data: bytes) -> None:
+        """ Queue data for the emulator, paced at the configured line rate.
+
+        Raises:
+            - IOError if the port is closed
+        """
+        with self._Lock:
+            if self._Master is None:
+                raise IOError('{} is closed'.format(self.Port))
+            self._Output += data
+            if self._Entry is None:
+                self._Drain()
+
+    def fileno(self) -> int:
+        """ Returns the file descriptor of the controller end. """
+        return self._Master
+
+    def _Drain(self) -> None:
+        with self._Lock:
+            self._Entry = None
+            if self._Master is None or self._Paused or not self._Output:
+                return
+            now = monotonic()
+            if self._Free > now:
+                self._Entry = IOLoop.CallLater(self._Free - now, self._Drain)
+                return
+            count = 1 if self._Interface.CharDelay else max(1, int(self.QUANTUM / self._CharTime))
+            try:
+                written = os.write(self._Master, self._Output[:count])
+            except BlockingIOError:
+                written = 0
+            del self._Output[:written]
+            self._Free = now + max(written, 1) * self._CharTime
+            if self._Output:
+                self._Entry = IOLoop.CallLater(self._Free - now, self._Drain)
+
+    def _OnReadable(self) -> None:
+        while self._Master is not None:
+            try:
+                data = os.read(self._Master, IOLoop.CHUNK_SIZE)
+            except BlockingIOError:
+                return
+            except OSError as error:
+                if error.errno == errno.EIO:
+                    return
+                raise
+            if not data:
+                return
+            if self._Interface.FlowControl == 'SW' and (self.XON in data or self.XOFF in data):
+                data = self._FlowControl(data)
+                if not data:
+                    continue
+            self._Interface._Receive(data)
+
+    def _FlowControl(self, data: bytes) -> bytes:
+        with self._Lock:
+            for byte in data:
+                if byte == self.XOFF:
+                    self._Paused = True
+                elif byte == self.XON:
+                    self._Paused = False
+            if not self._Paused and self._Entry is None:
+                self._Drain()
+        return bytes(byte for byte in data if byte not in (self.XON, self.XOFF))
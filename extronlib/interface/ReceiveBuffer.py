@@ -0,0 +1,159 @@
+import threading
+from time import monotonic
+
+
+class ReceiveBuffer():
+    """ Per-connection buffer collecting the response of a pending SendAndWait().
+
+    Received chunks are appended to one bytearray instead of being concatenated, and the buffer remembers how far it has been scanned so each chunk is only checked once for the delimiter.
+
+    Note:
+        - deliLen (int) - the response is complete once that many bytes have arrived.
+        - deliTag (bytes) - only the new bytes, plus len(deliTag) - 1 bytes of overlap, are searched for the suffix.
+        - deliRex (regular expression object) - a regular expression cannot resume a partial match, so it is searched across the unconsumed buffer in place (without copying) each time data arrives.
+        - Data arriving while no SendAndWait() is pending, and data following a matched response, is returned by Feed() to be passed to ReceiveData.
+    """
+
+    def __init__(self) -> None:
+        """ ReceiveBuffer class constructor. """
+        self._Data = bytearray()
+        self._Scanned = 0
+        self._Delimiter = None
+        self._Armed = False
+        self._End = -1
+        self._Condition = threading.Condition()
+        self._Transaction = threading.Lock()
+
+    def SendAndWait(self, Send: callable, data, timeout: float, delimiter=None, Pump: callable=None) -> bytes:
+        """ Send data and wait for the response, one transaction at a time.
+
+        Arguments:
+            - Send (function) - sends data to the device
+            - data (bytes, string) - data to send
+            - timeout (float) - amount of time to wait for the response in seconds
+            - (optional) delimiter (int, bytes or regular expression object) - condition completing the response
+            - (optional) Pump (function) - reads pending data for at most the given number of seconds. Must be given on the I/O thread, which would otherwise wait on itself.
+
+        Returns
+            - the response, or empty bytes if the delimiter was not matched (bytes)
+        """
+        deadline = monotonic() + timeout
+        if Pump is None:
+            self._Transaction.acquire()
+        else:
+            # Another thread may be waiting on a response only this thread can read, so keep reading while waiting for it.
+            while not self._Transaction.acquire(blocking=False):
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    return b''
+                Pump(min(remaining, 0.01))
+        try:
+            self.Expect(delimiter)
+            try:
+                Send(data)
+            except Exception:
+                self.Cancel()
+                raise
+            return self.Wait(deadline - monotonic(), Pump)
+        finally:
+            self._Transaction.release()
+
+    def Expect(self, delimiter=None) -> None:
+        """ Start collecting a response.
+
+        Arguments:
+            - (optional) delimiter (int, bytes or regular expression object) - condition completing the response. None collects everything until the timeout.
+
+        Raises:
+            - TypeError
+        """
+        if isinstance(delimiter, str):
+            delimiter = delimiter.encode('iso-8859-1')
+        if not (delimiter is None or isinstance(delimiter, (bytes, bytearray)) or hasattr(delimiter, 'search')
+                or (isinstance(delimiter, int) and not isinstance(delimiter, bool))):
+            raise TypeError('delimiter must be an int, bytes or regular expression object')
+        with self._Condition:
+            self._Delimiter = delimiter
+            self._Data.clear()
+            self._Scanned = 0
+            self._End = -1
+            self._Armed = True
+
+    def Cancel(self) -> None:
+        """ Stop collecting and discard anything collected. """
+        with self._Condition:
+            self._Armed = False
+            self._Data.clear()
+            self._Condition.notify_all()
+
+    def Feed(self, data: bytes) -> bytes:
+        """ Offer received data to the pending response.
+
+        Arguments:
+            - data (bytes) - received data
+
+        Returns
+            - the part of data not claimed by the pending response (bytes)
+        """
+        with self._Condition:
+            if not self._Armed or self._End >= 0:
+                return data
+            self._Data += data
+            end = self._Match()
+            if end < 0:
+                return b''
+            self._End = end
+            self._Condition.notify_all()
+            if end == len(self._Data):
+                return b''
+            with memoryview(self._Data) as view:
+                return bytes(view[end:])
+
+    def Wait(self, timeout: float, Pump: callable=None) -> bytes:
+        """ Block until the response is complete or timeout expires.
+
+        Arguments:
+            - timeout (float) - amount of time to wait in seconds
+            - (optional) Pump (function) - called with the remaining time instead of sleeping. Used on the I/O thread, where nothing else can deliver data.
+
+        Returns
+            - the response, or empty bytes if the delimiter was not matched (bytes)
+        """
+        deadline = monotonic() + timeout
+        with self._Condition:
+            try:
+                while self._End < 0 and self._Armed:
+                    remaining = deadline - monotonic()
+                    if remaining <= 0:
+                        break
+                    if Pump is None:
+                        self._Condition.wait(remaining)
+                    else:
+                        self._Condition.release()
+                        try:
+                            Pump(remaining)
+                        finally:
+                            self._Condition.acquire()
+                if self._End >= 0:
+                    with memoryview(self._Data) as view:
+                        return bytes(view[:self._End])
+                if self._Delimiter is None:
+                    return bytes(self._Data)
+                return b''
+            finally:
+                self._Armed = False
+                self._Data.clear()
+
+    def _Match(self) -> int:
+        delimiter = self._Delimiter
+        data = self._Data
+        if delimiter is None:
+            return -1
+        if isinstance(delimiter, int):
+            return delimiter if len(data) >= delimiter else -1
+        if isinstance(delimiter, (bytes, bytearray)):
+            index = data.find(delimiter, max(0, self._Scanned - len(delimiter) + 1))
+            self._Scanned = len(data)
+            return index + len(delimiter) if index >= 0 else -1
+        match = delimiter.search(data)
+        return match.end() if match else -1
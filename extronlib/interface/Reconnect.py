@@ -0,0 +1,167 @@
+import random
+import threading
+from collections import deque
+import system
+
+
+class Reconnect():
+    """ Shared reconnect supervisor behind StartReconnect() of EthernetClientInterface.
+
+    A supervised interface that loses its connection is reconnected after a randomised, exponentially growing delay (full jitter). The first attempt after a drop is made within MinDelay, and each failure doubles the upper bound up to MaxDelay. Devices dropped together, e.g. by a switch reboot, therefore come back spread out instead of all at once.
+
+    Connection attempts run on a few worker threads, never on the I/O thread or the scheduler. At most MaxConcurrent attempts are in progress at a time; further due interfaces wait their turn.
+
+    Note:
+        - Delays follow extronlib.system.Scheduler.
+        - Disconnect() or StopReconnect() ends supervision of an interface.
+
+    ---
+
+    Parameters:
+        - MaxConcurrent - (int) - maximum number of connection attempts in progress at a time
+    """
+    MaxConcurrent: int = 4
+
+    _Members: dict = {}
+    _Ready: deque = deque()
+    _Workers: int = 0
+    _Lock = threading.RLock()
+    _Attempts: int = 0
+    _Failures: int = 0
+    _Reconnects: int = 0
+
+    @classmethod
+    def Start(cls, Interface, MinDelay: float=1.0, MaxDelay: float=60.0, timeout: float=5.0) -> None:
+        """ Keep Interface connected. Connects right away if it is not connected.
+
+        Arguments:
+            - Interface (EthernetClientInterface) - interface to supervise
+            - (optional) MinDelay (float) - upper bound in seconds of the delay before the first attempt after a drop
+            - (optional) MaxDelay (float) - upper bound in seconds of the delay between attempts
+            - (optional) timeout (float) - time in seconds each attempt may take
+        """
+        with cls._Lock:
+            cls.Stop(Interface)
+            member = cls._Members[Interface] = {
+                'MinDelay': MinDelay, 'MaxDelay': MaxDelay, 'Timeout': timeout,
+                'State': 'Connected', 'Failures': 0, 'LastResult': None, 'Entry': None,
+            }
+            if Interface._Stream is None:
+                cls._Due(Interface, member)
+
+    @classmethod
+    def Stop(cls, Interface) -> None:
+        """ Stop supervising Interface, if it is supervised. An attempt in progress is completed but not retried.
+
+        Arguments:
+            - Interface (EthernetClientInterface) - supervised interface
+        """
+        with cls._Lock:
+            member = cls._Members.pop(Interface, None)
+            if member is not None and member['Entry'] is not None:
+                system.Scheduler.Cancel(member['Entry'])
+                member['Entry'] = None
+
+    @classmethod
+    def GetStatistics(cls) -> dict:
+        """ Returns supervisor counters.
+
+        Returns
+            - dict with the following keys:
+                - 'Interfaces' (int) - supervised interfaces
+                - 'Connected' (int) - supervised interfaces currently connected
+                - 'Waiting' (int) - interfaces waiting for their next attempt, or for a free attempt slot
+                - 'Connecting' (int) - attempts in progress
+                - 'Attempts' (int) - connection attempts made
+                - 'Failures' (int) - connection attempts failed
+                - 'Reconnects' (int) - connections made by the supervisor
+        """
+        with cls._Lock:
+            states = [member['State'] for member in cls._Members.values()]
+            return {
+                'Interfaces': len(states),
+                'Connected': states.count('Connected'),
+                'Waiting': states.count('Waiting'),
+                'Connecting': states.count('Connecting'),
+                'Attempts': cls._Attempts,
+                'Failures': cls._Failures,
+                'Reconnects': cls._Reconnects,
+            }
+
+    @classmethod
+    def GetStatus(cls, Interface) -> dict:
+        """ Returns the supervision state of Interface.
+
+        Returns
+            - None if Interface is not supervised, else a dict with the following keys:
+                - 'State' (string) - 'Connected', 'Waiting' or 'Connecting'
+                - 'Failures' (int) - consecutive failed attempts
+                - 'LastResult' (string) - result of the last Connect() attempt, or None
+                - 'NextAttempt' (float) - time of the next attempt (see extronlib.system.Scheduler.Now()), or None
+        """
+        with cls._Lock:
+            member = cls._Members.get(Interface)
+            if member is None:
+                return None
+            entry = member['Entry']
+            return {
+                'State': member['State'],
+                'Failures': member['Failures'],
+                'LastResult': member['LastResult'],
+                'NextAttempt': entry[0] if entry is not None else None,
+            }
+
+    @classmethod
+    def _Lost(cls, Interface) -> None:
+        with cls._Lock:
+            member = cls._Members.get(Interface)
+            if member is not None and member['State'] == 'Connected':
+                cls._Retry(Interface, member)
+
+    @classmethod
+    def _Retry(cls, Interface, member: dict) -> None:
+        bound = min(member['MaxDelay'], member['MinDelay'] * 2 ** min(member['Failures'], 32))
+        member['State'] = 'Waiting'
+        member['Entry'] = system.Scheduler.Schedule(system.Scheduler.Now() + random.uniform(0, bound), cls._Due, Interface, member)
+
+    @classmethod
+    def _Due(cls, Interface, member: dict) -> None:
+        with cls._Lock:
+            if cls._Members.get(Interface) is not member:
+                return
+            member['State'] = 'Waiting'
+            member['Entry'] = None
+            cls._Ready.append((Interface, member))
+            if cls._Workers < cls.MaxConcurrent:
+                cls._Workers += 1
+                threading.Thread(target=cls._Work, name='extronlib.Reconnect', daemon=True).start()
+
+    @classmethod
+    def _Work(cls) -> None:
+        while True:
+            with cls._Lock:
+                if not cls._Ready:
+                    cls._Workers -= 1
+                    return
+                interface, member = cls._Ready.popleft()
+                if cls._Members.get(interface) is not member:
+                    continue
+                member['State'] = 'Connecting'
+                cls._Attempts += 1
+            try:
+                result = interface.Connect(member['Timeout'])
+            except Exception as error:
+                result = str(error)
+            with cls._Lock:
+                member['LastResult'] = result
+                if cls._Members.get(interface) is not member:
+                    continue
+                # The connection may already have dropped again while Connect() returned.
+                if result in ('Connected', 'ConnectedAlready') and interface._Stream is not None:
+                    cls._Reconnects += 1
+                    member['Failures'] = 0
+                    member['State'] = 'Connected'
+                else:
+                    cls._Failures += 1
+                    member['Failures'] += 1
+                    cls._Retry(interface, member)
@@ -0,0 +1,176 @@
+import socket
+import threading
+from IOLoop import IOLoop
+
+try:
+    import paramiko
+except ImportError:
+    paramiko = None
+
+
+class SSHSession():
+    """ Authenticated SSH connection shared by the EthernetClientInterface instances using Protocol 'SSH'.
+
+    The key exchange and authentication are done once per host, port and credentials. Each interface then opens its own shell channel over that session, and a reconnect only opens a new channel. A session without channels is kept for IDLE_TIME seconds before it is closed.
+
+    Note:
+        - Requires the paramiko package. Without it, Connect() returns 'ProtocolUnavailable: SSH'.
+        - The host key is not verified.
+        - Writes never wait. While the remote window is full, data is buffered as on a TCP socket and the window is checked every WINDOW_POLL seconds, because a channel has no descriptor that reports it writable.
+        - IDLE_TIME and WINDOW_POLL are real time on the I/O loop, whatever the mode of extronlib.system.Scheduler.
+
+    ---
+
+    Parameters:
+        - IDLE_TIME - (float) - time in seconds an unused session is kept open
+        - WINDOW_POLL - (float) - time in seconds between checks of a full remote window
+    """
+    IDLE_TIME: float = 60.0
+    WINDOW_POLL: float = 0.05
+
+    _Sessions: dict = {}
+    _Handshakes: dict = {}
+    _Lock = threading.RLock()
+
+    def __init__(self, Hostname: str, IPPort: int, Credentials: tuple, timeout: float=None) -> None:
+        """ SSHSession class constructor. Use SSHSession.Open() to share sessions.
+
+        Raises:
+            - OSError, socket.timeout or paramiko.SSHException if the connection or authentication fails
+        """
+        sock = socket.create_connection((Hostname, IPPort), timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        try:
+            self._Transport = paramiko.Transport(sock)
+            self._Transport.start_client(timeout=timeout)
+            self._Transport.auth_password(Credentials[0], Credentials[1])
+        except Exception:
+            sock.close()
+            raise
+        self._Key = (Hostname, IPPort, Credentials)
+        self._Channels = 0
+        self._Entry = None
+
+    @classmethod
+    def Available(cls) -> bool:
+        """ Returns True if the SSH transport can be used. """
+        return paramiko is not None
+
+    @classmethod
+    def Open(cls, Hostname: str, IPPort: int, Credentials: tuple, timeout: float=None) -> '_SSHChannel':
+        """ Open a shell channel, reusing an authenticated session when one exists.
+
+        Arguments:
+            - Hostname (string) - DNS Name of the connection. Can be IP Address
+            - IPPort (int) - IP port number of the connection
+            - Credentials (tuple) - Username and password
+            - (optional) timeout (float) - time in seconds to attempt connection before giving up
+
+        Returns
+            - socket-like channel for the shared I/O loop
+
+        Raises:
+            - OSError, socket.timeout or paramiko.SSHException if the connection or authentication fails
+        """
+        key = (Hostname, IPPort, tuple(Credentials))
+        with cls._Lock:
+            handshake = cls._Handshakes.setdefault(key, threading.Lock())
+        # Interfaces to the same host wait for one handshake; other hosts are not held up.
+        with handshake:
+            with cls._Lock:
+                session = cls._Sessions.get(key)
+                if session is not None and not session._Transport.is_active():
+                    del cls._Sessions[key]
+                    session._Transport.close()
+                    session = None
+            if session is None:
+                session = cls(Hostname, IPPort, key[2], timeout)
+            with cls._Lock:
+                cls._Sessions[key] = session
+                if session._Entry is not None:
+                    IOLoop.Cancel(session._Entry)
+                    session._Entry = None
+                session._Channels += 1
+        try:
+            channel = session._Transport.open_session(timeout=timeout)
+            channel.get_pty()
+            channel.invoke_shell()
+        except Exception:
+            session._Release()
+            raise
+        return _SSHChannel(session, channel)
+
+    def _Release(self) -> None:
+        with self._Lock:
+            self._Channels -= 1
+            if self._Channels == 0:
+                self._Entry = IOLoop.CallLater(self.IDLE_TIME, self._Expire)
+
+    def _Expire(self) -> None:
+        with self._Lock:
+            if self._Channels or self._Entry is None:
+                return
+            self._Entry = None
+            if self._Sessions.get(self._Key) is self:
+                del self._Sessions[self._Key]
+        self._Transport.close()
+
+
+class _SSHChannel():
+    # Presents a paramiko channel with the socket calls EthernetClientInterface makes.
+
+    def __init__(self, session: SSHSession, channel) -> None:
+        self._Session = session
+        self._Channel = channel
+        self._Entry = None
+
+    def fileno(self) -> int:
+        return self._Channel.fileno()
+
+    def getpeername(self) -> tuple:
+        return self._Session._Transport.getpeername()
+
+    def setblocking(self, flag: bool) -> None:
+        pass
+
+    def setsockopt(self, *args) -> None:
+        pass
+
+    def recv(self, size: int) -> bytes:
+        channel = self._Channel
+        if channel.recv_ready():
+            return channel.recv(size)
+        if channel.eof_received or channel.closed:
+            return b''
+        raise BlockingIOError
+
+    def send(self, data) -> int:
+        # Sends what the remote window takes, like a non-blocking socket; a closed channel raises OSError.
+        # Each channel.send() writes at most one packet, so keep going while the window has room.
+        channel = self._Channel
+        sent = 0
+        while sent < len(data) and channel.send_ready():
+            sent += channel.send(data[sent:sent + 65536])
+        if sent < len(data) and self._Entry is None:
+            self._Entry = IOLoop.CallLater(SSHSession.WINDOW_POLL, self._Poll)
+        if not sent and data:
+            raise BlockingIOError
+        return sent
+
+    def close(self) -> None:
+        if self._Session is not None:
+            if self._Entry is not None:
+                IOLoop.Cancel(self._Entry)
+                self._Entry = None
+            self._Channel.close()
+            self._Session._Release()
+            self._Session = None
+
+    def _Poll(self) -> None:
+        self._Entry = None
+        if self._Session is None:
+            return
+        if self._Channel.send_ready():
+            IOLoop.Ready(self)
+        else:
+            self._Entry = IOLoop.CallLater(SSHSession.WINDOW_POLL, self._Poll)
@@ -0,0 +1,162 @@
+import threading
+import traceback
+from collections import deque
+import system
+
+
+class SendQueue():
+    """ Optional outgoing command queue for SerialInterface and EthernetClientInterface.
+
+    Commands are written in priority order while honouring a minimum gap between commands and a maximum number of commands awaiting a response. Timing follows extronlib.system.Scheduler, so queues also run on the virtual clock.
+
+    ---
+
+    Arguments:
+        - Write (function) - writes one command to the device
+        - (optional) MinGap (float) - minimum time in seconds between the starts of consecutive commands
+        - (optional) MaxInFlight (int) - maximum number of commands awaiting a response (None == Unlimited)
+        - (optional) Lanes (list of strings) - priority lanes, highest priority first
+        - (optional) Timeout (float) - time in seconds after which a command without response no longer counts as in flight
+
+    Note:
+        - A command is answered when Complete() is called, which the interfaces do for each received frame, or for each received chunk when no framer is attached.
+        - A command whose write fails is dropped and counted as failed, and the error is printed. The commands behind it are still sent.
+        - A command queued with Coalesce=True is dropped if an identical command is already waiting in any lane. Use it for polling queries.
+    """
+
+    def __init__(self, Write: callable, MinGap: float=0.0, MaxInFlight: int=None, Lanes: list=('High', 'Normal', 'Low'), Timeout: float=1.0) -> None:
+        """ SendQueue class constructor.
+
+        Arguments:
+            - Write (function) - writes one command to the device
+            - (optional) MinGap (float) - minimum time in seconds between the starts of consecutive commands
+            - (optional) MaxInFlight (int) - maximum number of commands awaiting a response (None == Unlimited)
+            - (optional) Lanes (list of strings) - priority lanes, highest priority first
+            - (optional) Timeout (float) - time in seconds after which a command without response no longer counts as in flight
+        """
+        self.MinGap = MinGap
+        self.MaxInFlight = MaxInFlight
+        self.Lanes = list(Lanes)
+        self.Timeout = Timeout
+        self._Write = Write
+        self._Queues = {lane: deque() for lane in self.Lanes}
+        self._Coalescing = set()
+        self._InFlight = deque()
+        self._NextSend = 0.0
+        self._Entry = None
+        self._Lock = threading.RLock()
+        self._Sent = 0
+        self._Coalesced = 0
+        self._Failed = 0
+
+    def Put(self, data: bytes, Lane: str=None, Coalesce: bool=False) -> bool:
+        """ Queue a command.
+
+        Arguments:
+            - data (bytes) - command to send
+            - (optional) Lane (string) - priority lane. Defaults to the middle lane.
+            - (optional) Coalesce (bool) - drop the command if an identical one is already waiting
+
+        Returns
+            - False if the command was coalesced, else True (bool)
+
+        Raises:
+            - ValueError if Lane is unknown
+        """
+        if Lane is None:
+            Lane = self.Lanes[len(self.Lanes) // 2]
+        if Lane not in self._Queues:
+            raise ValueError('unknown lane {}'.format(Lane))
+        with self._Lock:
+            if Coalesce:
+                if data in self._Coalescing:
+                    self._Coalesced += 1
+                    return False
+                self._Coalescing.add(data)
+            self._Queues[Lane].append((data, Coalesce))
+            self._Pump()
+        return True
+
+    def Complete(self, count: int=1) -> None:
+        """ Mark the oldest commands in flight as answered.
+
+        Arguments:
+            - (optional) count (int) - number of responses received
+        """
+        with self._Lock:
+            inflight = self._InFlight
+            for _ in range(min(count, len(inflight))):
+                inflight.popleft()
+            self._Pump()
+
+    def Clear(self) -> None:
+        """ Drop every waiting command and forget commands in flight. """
+        with self._Lock:
+            for queue in self._Queues.values():
+                queue.clear()
+            self._Coalescing.clear()
+            self._InFlight.clear()
+            if self._Entry is not None:
+                system.Scheduler.Cancel(self._Entry)
+                self._Entry = None
+
+    def GetStatistics(self) -> dict:
+        """ Returns queue counters.
+
+        Returns
+            - dict with the following keys:
+                - 'Queued' (int) - commands waiting to be sent
+                - 'InFlight' (int) - commands awaiting a response
+                - 'Sent' (int) - commands written
+                - 'Coalesced' (int) - commands dropped as duplicates
+                - 'Failed' (int) - commands dropped because writing them failed
+        """
+        with self._Lock:
+            return {
+                'Queued': sum(len(queue) for queue in self._Queues.values()),
+                'InFlight': len(self._InFlight),
+                'Sent': self._Sent,
+                'Coalesced': self._Coalesced,
+                'Failed': self._Failed,
+            }
+
+    def _Pump(self) -> None:
+        now = system.Scheduler.Now()
+        inflight = self._InFlight
+        while inflight and inflight[0] <= now:
+            inflight.popleft()
+        while True:
+            lane = next((queue for queue in self._Queues.values() if queue), None)
+            if lane is None:
+                return
+            if self.MaxInFlight is not None and len(inflight) >= self.MaxInFlight:
+                self._WakeAt(inflight[0])
+                return
+            if now < self._NextSend:
+                self._WakeAt(self._NextSend)
+                return
+            data, coalesce = lane.popleft()
+            if coalesce:
+                self._Coalescing.discard(data)
+            self._NextSend = now + self.MinGap
+            try:
+                self._Write(data)
+            except Exception:
+                self._Failed += 1
+                traceback.print_exc()
+                continue
+            if self.MaxInFlight is not None:
+                inflight.append(now + self.Timeout)
+            self._Sent += 1
+
+    def _WakeAt(self, deadline: float) -> None:
+        if self._Entry is not None:
+            if self._Entry[0] <= deadline and self._Entry[2] is not None:
+                return
+            system.Scheduler.Cancel(self._Entry)
+        self._Entry = system.Scheduler.Schedule(deadline, self._Wake)
+
+    def _Wake(self) -> None:
+        with self._Lock:
+            self._Entry = None
+            self._Pump()
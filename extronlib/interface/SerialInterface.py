@@ -1,3 +1,12 @@
+import select
+from IOLoop import IOLoop
+from KeepAlive import KeepAlive
+from PtyPort import PtyPort
+from ReceiveBuffer import ReceiveBuffer
+from SendQueue import SendQueue
+import system
+
+
 class SerialInterface():
     """ This class provides an interface to a serial port. This class allows the user to send data over the serial port in a synchronous or asynchronous manner. This class is used for all ports capable of serial communication (e.g., Serial Ports, IR Serial Ports).
 
@@ -38,6 +47,8 @@ class SerialInterface():
         - Offline - (Event) Triggers when port goes offline. The callback takes two arguments. The first one is the extronlib.interface instance triggering the event and the second one is a string ('Offline').
         - Online - (Event) Triggers when port goes offline. The callback takes two arguments. The first one is the extronlib.interface instance triggering the event and the second one is a string ('Online'). 
         - ReceiveData - (Event) Receive Data event handler used for asynchronous transactions. The callback takes two arguments. The first one is the SerialInterface instance triggering the event and the second one is a bytes string.
+
+    Note: Off the processor, a port can be simulated with a pseudo-terminal pair created by PtyPort.Create() (see PtyPort.py) before the SerialInterface.
     """
     Host = None
     Port = ''
@@ -75,6 +86,34 @@ class SerialInterface():
         self.FlowControl = FlowControl
         self.CharDelay = CharDelay
         self.Mode = Mode
+        self._Response = ReceiveBuffer()
+        self._Queue = None
+        self._Framer = None
+        self._SendCount = 0
+        self._Transport = PtyPort.Get(Port)
+        if self._Transport is not None:
+            self._Transport.Attach(self)
+
+    def DisableSendQueue(self):
+        """ Send data immediately again, dropping any queued commands. """
+        if self._Queue is not None:
+            self._Queue.Clear()
+            self._Queue = None
+
+    def EnableSendQueue(self, MinGap=0.0, MaxInFlight=None, Lanes=('High', 'Normal', 'Low'), Timeout=1.0):
+        """ Route Send() through a command queue (see SendQueue.py).
+
+        Arguments:
+            - (optional) MinGap (float) - minimum time in seconds between the starts of consecutive commands
+            - (optional) MaxInFlight (int) - maximum number of commands awaiting a response (None == Unlimited)
+            - (optional) Lanes (list of strings) - priority lanes, highest priority first
+            - (optional) Timeout (float) - time in seconds after which a command without response no longer counts as in flight
+
+        Returns
+            - the queue (SendQueue)
+        """
+        self._Queue = SendQueue(self._Write, MinGap, MaxInFlight, Lanes, Timeout)
+        return self._Queue
 
     def Initialize(self, Baud=None, Data=None, Parity=None, Stop=None, FlowControl=None, CharDelay=None, Mode=None):
         """ Initializes Serial Port to given values. User may provide any or all of the parameters. None leaves property unmodified.
@@ -88,21 +127,38 @@ class SerialInterface():
             - (optional) CharDelay (float) - time between each character sent to the connected device
             - (optional) Mode (string) - mode of the port, 'RS232', 'RS422' or 'RS485'
         """
-        pass
-
-    def Send(self, data):
+        settings = {'Baud': Baud, 'Data': Data, 'Parity': Parity, 'Stop': Stop, 'FlowControl': FlowControl, 'CharDelay': CharDelay, 'Mode': Mode}
+        for name, value in settings.items():
+            if value is not None:
+                setattr(self, name, value)
+        if self._Transport is not None:
+            self._Transport.Configure()
+
+    def Send(self, data, Lane=None, Coalesce=False):
         """ Send string over serial port if it’s open
 
         Arguments:
             - data (bytes, string) - data to send
+            - (optional) Lane (string) - priority lane, when the send queue is enabled
+            - (optional) Coalesce (bool) - drop data if identical data is already queued, when the send queue is enabled
         
         Raises:
             - TypeError
             - IOError
         """
-        pass
-
-    def SendAndWait(self, data, timeout, delimiter):
+        if isinstance(data, str):
+            data = data.encode('iso-8859-1')
+        elif not isinstance(data, (bytes, bytearray, memoryview)):
+            raise TypeError('data must be bytes or str')
+        queue = self._Queue
+        if queue is None:
+            self._Write(data)
+        elif self._Transport is None:
+            raise IOError('{} is not open'.format(self.Port))
+        else:
+            queue.Put(bytes(data), Lane, Coalesce)
+
+    def SendAndWait(self, data, timeout, delimiter=None):
         """ Send data to the controlled device and wait (blocking) for response
 
         Note In addition to data and timeout, the method accepts an optional delimiter, which is used to compare against the received response. It supports any one of the following conditions:
@@ -122,7 +178,15 @@ class SerialInterface():
         Returns 
             - Response received data (may be empty) (bytes)
         """
-        pass
+        return self._Response.SendAndWait(self.Send, data, timeout, delimiter, self._Pump if IOLoop.InLoop() else None)
+
+    def SetFramer(self, Framer):
+        """ Deliver complete frames to ReceiveData instead of raw fragments.
+
+        Arguments:
+            - Framer (Framer) - framer for this port (see Framer.py), or None to deliver data as received
+        """
+        self._Framer = Framer
 
     def StartKeepAlive(self, interval, data):
         """ Repeatedly sends data at the given interval
@@ -131,9 +195,42 @@ class SerialInterface():
             - interval (float) - Time in seconds between transmissions
             - data (bytes) - data bytes to send
         """
-        pass
+        if isinstance(data, str):
+            data = data.encode('iso-8859-1')
+        KeepAlive.Start(self, interval, data)
 
     def StopKeepAlive(self):
         """ Stop the currently running keep alive routine
         """
-        pass
+        KeepAlive.Stop(self)
+
+    def _Write(self, data):
+        if self._Transport is None:
+            raise IOError('{} is not open'.format(self.Port))
+        self._Transport.Write(data)
+        self._SendCount += 1
+
+    def _Pump(self, timeout):
+        transport = self._Transport
+        if transport is None:
+            return
+        readable, _, _ = select.select([transport], [], [], timeout)
+        if readable:
+            transport._OnReadable()
+
+    def _Receive(self, data):
+        # A send queue counts each frame as one response; without a framer, each chunk.
+        queue = self._Queue
+        if self._Framer is None:
+            if queue is not None:
+                queue.Complete()
+            data = self._Response.Feed(data)
+            if data:
+                IOLoop.Deliver(system.EventDispatcher.Emit, self, 'ReceiveData', data)
+            return
+        data = self._Response.Feed(data)
+        frames = self._Framer.Feed(data) if data else []
+        if queue is not None and frames:
+            queue.Complete(len(frames))
+        for frame in frames:
+            IOLoop.Deliver(system.EventDispatcher.Emit, self, 'ReceiveData', frame)
@@ -0,0 +1,156 @@
+import select
+import threading
+from IOLoop import IOLoop
+
+
+class StreamTransport():
+    """ Connected stream socket on the shared IOLoop, with its output buffer.
+
+    EthernetClientInterface (TCP and SSH), ClientObject and SummitConnect hold one per connection, so reading, buffered writing and closing are implemented once. Data the socket does not take is kept in the output buffer and written as the socket drains. With a Limit, data that could take the buffer past Limit is refused as a whole: once part of it is on the wire, the rest can no longer be refused.
+
+    Note:
+        - Receive(data) is called on the I/O thread for each chunk read, at most IOLoop.CHUNK_SIZE bytes.
+        - Closed(transport) is called once, after the socket is closed, whichever side ended the connection.
+        - Call Start() once the owner can handle Receive and Closed.
+
+    ---
+
+    Arguments:
+        - Socket (socket) - connected non-blocking socket, or a socket-like object such as an SSH channel
+        - Receive (function) - called with the data read
+        - Closed (function) - called with this transport when the connection ends
+        - (optional) Limit (int) - maximum number of bytes kept in the output buffer (None == Unlimited)
+
+    ---
+
+    Parameters:
+        - Limit - (int) - maximum number of bytes kept in the output buffer (None == Unlimited)
+        - Pending - Returns (int) - number of bytes waiting in the output buffer
+    """
+
+    def __init__(self, Socket, Receive: callable, Closed: callable, Limit: int=None) -> None:
+        """ StreamTransport class constructor.
+
+        Arguments:
+            - Socket (socket) - connected non-blocking socket, or a socket-like object such as an SSH channel
+            - Receive (function) - called with the data read
+            - Closed (function) - called with this transport when the connection ends
+            - (optional) Limit (int) - maximum number of bytes kept in the output buffer (None == Unlimited)
+        """
+        self.Limit = Limit
+        self._Socket = Socket
+        self._Receive = Receive
+        self._Closed = Closed
+        self._Output = bytearray()
+        self._Lock = threading.RLock()
+        # Pending output and new data go out in one vectored write where the socket supports it.
+        self._Vectored = hasattr(Socket, 'sendmsg')
+
+    @property
+    def Pending(self) -> int:
+        return len(self._Output)
+
+    def Start(self) -> None:
+        """ Start reading from the socket. """
+        IOLoop.Register(self._Socket, self._OnReadable)
+
+    def Write(self, data: bytes) -> bool:
+        """ Write data, buffering what the socket does not take.
+
+        Arguments:
+            - data (bytes) - data to write
+
+        Returns
+            - False if the data would not fit within Limit; nothing is written then (bool)
+
+        Raises:
+            - IOError if the connection is closed or fails
+        """
+        with self._Lock:
+            sock = self._Socket
+            if sock is None:
+                raise IOError('not connected')
+            output = self._Output
+            pending = len(output)
+            if self.Limit is not None and pending + len(data) > self.Limit:
+                return False
+            try:
+                if not pending:
+                    sent = sock.send(data)
+                elif self._Vectored:
+                    sent = sock.sendmsg([output, data])
+                else:
+                    sent = 0
+            except BlockingIOError:
+                sent = 0
+            except OSError as error:
+                IOLoop.Call(self.Close)
+                raise IOError(error)
+            if sent < pending:
+                del output[:sent]
+                output += data
+            else:
+                output.clear()
+                if sent - pending < len(data):
+                    output += memoryview(data)[sent - pending:]
+            if output and not pending:
+                IOLoop.Modify(sock, self._OnReadable, self._OnWritable)
+            return True
+
+    def Close(self) -> None:
+        """ Close the connection, dropping buffered output. Does nothing if it is closed already. """
+        with self._Lock:
+            sock = self._Socket
+            if sock is None:
+                return
+            self._Socket = None
+            self._Output.clear()
+        IOLoop.Unregister(sock)
+        sock.close()
+        self._Closed(self)
+
+    def Pump(self, timeout: float) -> None:
+        """ Wait up to timeout seconds for data and read it. For code that must wait for a response on the I/O thread itself.
+
+        Arguments:
+            - timeout (float) - maximum time in seconds to wait
+        """
+        sock = self._Socket
+        if sock is None:
+            return
+        readable, _, _ = select.select([sock], [], [], timeout)
+        if readable:
+            self._OnReadable()
+
+    def _OnReadable(self) -> None:
+        sock = self._Socket
+        while sock is not None:
+            try:
+                data = sock.recv(IOLoop.CHUNK_SIZE)
+            except BlockingIOError:
+                return
+            except OSError:
+                data = b''
+            if not data:
+                self.Close()
+                return
+            self._Receive(data)
+            sock = self._Socket
+
+    def _OnWritable(self) -> None:
+        with self._Lock:
+            sock = self._Socket
+            if sock is None:
+                return
+            try:
+                while self._Output:
+                    sent = sock.send(self._Output)
+                    del self._Output[:sent]
+            except BlockingIOError:
+                return
+            except OSError:
+                pass
+            else:
+                IOLoop.Modify(sock, self._OnReadable)
+                return
+        self.Close()
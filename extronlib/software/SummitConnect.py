@@ -1,4 +1,9 @@
+import socket
+import threading
 from typing import Union
+from IOLoop import IOLoop
+from StreamTransport import StreamTransport
+import system
 
 
 class SummitConnect():
@@ -38,7 +43,27 @@ class SummitConnect():
     from extronlib.software import SummitConnect
     ConferencePC = SummitConnect('192.168.1.110')
     ```
+
+    ---
+
+    Note:
+        - All instances are served by the shared I/O loop of extronlib.interface; no thread is created per computer.
+        - The listening ports are shared by all instances. Data arriving on any of them is routed to the instance by the address of the sending computer.
+        - Data sent while the connection is lost, and until Connect() succeeds again, is queued (up to QUEUE_SIZE bytes) and sent after reconnecting. Disconnect() discards it.
     """
+    MAX_CLIENTS: int = 15
+    MAX_PORTS: int = 15
+    DEFAULT_PORTS: range = range(5001, 5009)
+    QUEUE_SIZE: int = 65536
+
+    Connected = None
+    Disconnected = None
+    ReceiveData = None
+
+    _Listeners: dict = {}
+    _Instances: dict = {}
+    _Routes: dict = {}
+    _Lock = threading.RLock()
 
     def __init__(self, Hostname: str, IPPort: int=None) -> None:
         """ SummitConnect class constructor.
@@ -46,11 +71,25 @@ class SummitConnect():
         Arguments:
             - Hostname (string) - Hostname of the host computer. Can be IP Address.
             - IPPort (int) - IP Port the software is listening on (default is 5000)
+
+        Raises:
+            - ValueError if an instance for Hostname exists or MAX_CLIENTS instances exist
         """
+        with self._Lock:
+            if Hostname in self._Instances:
+                raise ValueError('SummitConnect for {} already exists'.format(Hostname))
+            if len(self._Instances) >= self.MAX_CLIENTS:
+                raise ValueError('at most {} SummitConnect clients are allowed'.format(self.MAX_CLIENTS))
+            self._Instances[Hostname] = self
         self.Hostname = Hostname
-        self.IPPort = IPPort
+        self.IPPort = 5000 if IPPort is None else IPPort
         self.IPAddress = None
         self.ListeningPort = None
+        self._Framer = None
+        self._Stream = None
+        self._Inbound = set()
+        self._Pending = None
+        self._SendLock = threading.RLock()
 
     def Connect(self, timeout: float=None) -> str:
         """ Connect to the software.
@@ -75,14 +114,63 @@ class SummitConnect():
         ConnectToSoftware()
         ```
         """
-        ...
+        with self._Lock:
+            if not self._Listeners:
+                result = self.SetListeningPorts()
+                if result != 'Listening':
+                    return result
+        with self._SendLock:
+            if self._Stream is not None:
+                return 'ConnectedAlready'
+        try:
+            sock = socket.create_connection((self.Hostname, self.IPPort), timeout)
+        except socket.timeout:
+            return 'TimedOut'
+        except socket.gaierror:
+            return 'HostError'
+        except OSError as error:
+            return error.strerror or str(error)
+        sock.setblocking(False)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self._Lock:
+            self.IPAddress = sock.getpeername()[0]
+            self._Routes[self.IPAddress] = self
+            self.ListeningPort = self._Assign()
+        stream = StreamTransport(sock, self._Receive, self._Closed)
+        with self._SendLock:
+            if self._Stream is not None:
+                # Another Connect() finished first; keep its connection.
+                sock.close()
+                return 'ConnectedAlready'
+            self._Stream = stream
+            pending = self._Pending
+            self._Pending = None
+        stream.Start()
+        system.EventDispatcher.Emit(self, 'Connected', 'Connected')
+        if pending:
+            try:
+                self._Write(pending)
+            except IOError:
+                pass
+        return 'Connected'
 
     def Disconnect(self) -> None:
         """ Disconnect the socket
 
         >>> ConferencePC.Disconnect()
         """
-        ...
+        stream = self._Stream
+        if stream is not None:
+            stream.Close()
+        with self._SendLock:
+            self._Pending = None
+        with self._Lock:
+            if self._Routes.get(self.IPAddress) is self:
+                del self._Routes[self.IPAddress]
+            inbound = list(self._Inbound)
+            self._Inbound.clear()
+        for stream in inbound:
+            stream.Close()
 
     def Send(self, data: Union[bytes, str]) -> None:
         """ Send string to licensed software
@@ -90,9 +178,32 @@ class SummitConnect():
         Arguments:
             -    - data (bytes, string) - string to send out
 
+        Raises:
+            - TypeError
+            - IOError if not connected, or if the queue for a lost connection is full
+
         >>> ConferencePC.Send(A_MESSAGE)
         """
-        ...
+        if isinstance(data, str):
+            data = data.encode('iso-8859-1')
+        elif not isinstance(data, (bytes, bytearray, memoryview)):
+            raise TypeError('data must be bytes or str')
+        with self._SendLock:
+            pending = self._Pending
+            if self._Stream is None and pending is not None:
+                if len(pending) + len(data) > self.QUEUE_SIZE:
+                    raise IOError('send queue for {} is full'.format(self.Hostname))
+                pending += data
+                return
+            self._Write(data)
+
+    def SetFramer(self, Framer) -> None:
+        """ Deliver complete frames to ReceiveData instead of raw fragments.
+
+        Arguments:
+            - Framer (Framer) - framer for this connection (see Framer.py), or None to deliver data as received
+        """
+        self._Framer = Framer
 
     @classmethod
     def SetListeningPorts(cls, portList: list[int]=None) -> str:
@@ -118,4 +229,87 @@ class SummitConnect():
         SummitConnect.SetListeningPorts()    # Reset to default.
         ```
         """
-        ...
+        ports = list(cls.DEFAULT_PORTS if portList is None else portList)
+        if len(ports) > cls.MAX_PORTS:
+            raise ValueError('at most {} ports can be specified'.format(cls.MAX_PORTS))
+        with cls._Lock:
+            for sock in cls._Listeners.values():
+                IOLoop.Unregister(sock)
+                sock.close()
+            cls._Listeners.clear()
+            failed = []
+            for port in ports:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                try:
+                    sock.bind(('', port))
+                    sock.listen(socket.SOMAXCONN)
+                except OSError:
+                    sock.close()
+                    failed.append(str(port))
+                    continue
+                sock.setblocking(False)
+                cls._Listeners[port] = sock
+                IOLoop.Register(sock, lambda sock=sock: cls._OnAccept(sock))
+            for instance in cls._Routes.values():
+                instance.ListeningPort = cls._Assign()
+        if failed:
+            return 'PortUnavailable:{}'.format(', '.join(failed))
+        return 'Listening'
+
+    @classmethod
+    def _Assign(cls) -> int:
+        # Spread instances evenly over the listening ports.
+        if not cls._Listeners:
+            return None
+        load = dict.fromkeys(cls._Listeners, 0)
+        for instance in cls._Routes.values():
+            if instance.ListeningPort in load:
+                load[instance.ListeningPort] += 1
+        return min(load, key=load.get)
+
+    @classmethod
+    def _OnAccept(cls, listener: socket.socket) -> None:
+        while True:
+            try:
+                sock, address = listener.accept()
+            except OSError:
+                return
+            with cls._Lock:
+                instance = cls._Routes.get(address[0])
+                if instance is not None:
+                    sock.setblocking(False)
+                    stream = StreamTransport(sock, instance._Receive, instance._InboundClosed)
+                    instance._Inbound.add(stream)
+            if instance is None:
+                sock.close()
+                continue
+            stream.Start()
+
+    def _InboundClosed(self, stream: StreamTransport) -> None:
+        with self._Lock:
+            self._Inbound.discard(stream)
+
+    def _Write(self, data: bytes) -> None:
+        with self._SendLock:
+            stream = self._Stream
+            if stream is None:
+                raise IOError('{} is not connected'.format(self.Hostname))
+            stream.Write(data)
+
+    def _Closed(self, stream: StreamTransport) -> None:
+        with self._SendLock:
+            if self._Stream is not stream:
+                return
+            self._Stream = None
+            self._Pending = bytearray()
+        if self._Framer is not None:
+            self._Framer.Reset()
+        system.EventDispatcher.Emit(self, 'Disconnected', 'Disconnected')
+
+    def _Receive(self, data: bytes) -> None:
+        if self._Framer is None:
+            IOLoop.Deliver(system.EventDispatcher.Emit, self, 'ReceiveData', data)
+        else:
+            for frame in self._Framer.Feed(data):
+                IOLoop.Deliver(system.EventDispatcher.Emit, self, 'ReceiveData', frame)
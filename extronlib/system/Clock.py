@@ -1,4 +1,12 @@
+from bisect import bisect_left
+from datetime import datetime, timedelta
 from typing import Optional
+from Scheduler import Scheduler
+
+_DAY = 86400
+_WEEK = 7 * _DAY
+_DST_WINDOW = 2 * 3600
+_RECHECK = 3600
 
 
 class Clock():
@@ -7,6 +15,8 @@ class Clock():
     Note:
         - When DST causes the clock to spring forward one hour, events scheduled within the skipped hour do not fire.
         - When DST causes the clock to fall back an hour, events scheduled within the repeated hour fire twice.
+        - Times and Days are compiled into a sorted weekly table when they are set. Only the next alarm is ever scheduled, so a Clock costs nothing between alarms.
+        - Alarms wait on the monotonic clock and the calendar time is checked again before they fire, at least once an hour, so setting the system time moves alarms to the new time instead of stalling or firing them early.
     
     ---
 
@@ -31,12 +41,12 @@ class Clock():
     Function: callable = None
     State: str = ''
     WEEKDAYS: dict[str, int] = {'Monday': 0,
-            -        'Tuesday': 1,
-            -        'Wednesday': 2,
-            -        'Thursday': 3,
-            -        'Friday': 4,
-            -        'Saturday': 5,
-            -        'Sunday': 6}
+                                'Tuesday': 1,
+                                'Wednesday': 2,
+                                'Thursday': 3,
+                                'Friday': 4,
+                                'Saturday': 5,
+                                'Sunday': 6}
 
     def __init__(self, Times: list[str], Days: Optional[list[str]]=None, Function: Optional[callable]=None) -> None:
         """ Clock class constructor.
@@ -46,15 +56,24 @@ class Clock():
             - Days (list of strings) - list of weekdays to set alarm. If Days is omitted, the alarm is set for every weekday
             - Function (function) - function to execute when alarm time is up
         """
-        ...
+        self.Times = list(Times)
+        self.Days = list(Days) if Days else []
+        self.Function = Function
+        self.State = 'Disabled'
+        self._Entry = None
+        self._Table = self._Compile()
 
     def Disable(self) -> None:
         """ Disable alarm """
-        ...
+        self.State = 'Disabled'
+        if self._Entry is not None:
+            Scheduler.Cancel(self._Entry)
+            self._Entry = None
 
     def Enable(self) -> None:
         """ Enable alarm """
-        ...
+        self.State = 'Enabled'
+        self._Reschedule()
 
     def SetDays(self, Days: list[str]) -> None:
         """ Send string to licensed software
@@ -62,7 +81,9 @@ class Clock():
         Arguments:
             - Days (list of strings) - a list of Calendar days, as listed in WEEKDAYS
         """
-        ...
+        self.Days = list(Days) if Days else []
+        self._Table = self._Compile()
+        self._Reschedule()
 
     def SetTimes(self, Times: list[str]) -> None:
         """ Set new alarm times
@@ -70,5 +91,63 @@ class Clock():
         Arguments:
             - Times (list of strings) - list of times (e.g. 'HH:MM:SS') of day to call Function
         """
-        ...
+        self.Times = list(Times)
+        self._Table = self._Compile()
+        self._Reschedule()
+
+    def _Compile(self) -> list:
+        days = [self.WEEKDAYS[day] for day in self.Days] if self.Days else range(7)
+        seconds = []
+        for t in self.Times:
+            t = datetime.strptime(t, '%H:%M:%S')
+            seconds.append(t.hour * 3600 + t.minute * 60 + t.second)
+        return sorted({day * _DAY + second for day in days for second in seconds})
+
+    def _NextAlarm(self, now: float) -> tuple:
+        # Walk the weekly table in wall-clock order from shortly before the current wall time, because after a
+        # fall back the repeated hour lies behind it. Each wall time maps to zero (spring forward), one or two
+        # (fall back) instants; the earliest instant after now wins.
+        table = self._Table
+        if not table:
+            return None
+        wall = datetime.fromtimestamp(now)
+        monday = datetime.combine(wall.date() - timedelta(days=wall.weekday()), datetime.min.time())
+        start = int((wall - monday).total_seconds()) - _DST_WINDOW
+        week, offset = divmod(start, _WEEK)
+        index = bisect_left(table, offset)
+        best = None
+        for _ in range(2 * len(table) + 2):
+            if index == len(table):
+                index = 0
+                week += 1
+            alarm = monday + timedelta(seconds=week * _WEEK + table[index])
+            if best is not None and alarm > best[1] + timedelta(seconds=_DST_WINDOW):
+                break
+            for fold in (0, 1):
+                candidate = alarm.replace(fold=fold)
+                timestamp = candidate.timestamp()
+                if timestamp > now and datetime.fromtimestamp(timestamp) == alarm and (best is None or timestamp < best[0]):
+                    best = (timestamp, candidate)
+            index += 1
+        return best
+
+    def _Reschedule(self) -> None:
+        if self._Entry is not None:
+            Scheduler.Cancel(self._Entry)
+            self._Entry = None
+        if self.State != 'Enabled':
+            return
+        now = Scheduler.Time()
+        alarm = self._NextAlarm(now)
+        if alarm is not None:
+            self._Entry = Scheduler.Schedule(Scheduler.Now() + min(alarm[0] - now, _RECHECK), self._Fire, alarm)
 
+    def _Fire(self, alarm: tuple) -> None:
+        self._Entry = None
+        if Scheduler.Time() < alarm[0]:
+            # Early: the system time was set back, or the wait was capped at _RECHECK. Look again from the current time.
+            self._Reschedule()
+            return
+        self._Reschedule()
+        if self.Function is not None:
+            self.Function(self, alarm[1])
@@ -0,0 +1,105 @@
+from inspect import signature
+from types import MemberDescriptorType
+
+
+class EventDispatcher():
+    """ Handler registration behind extronlib.event. Lists of objects and event names are resolved once, when the handler is decorated, and each handler is stored in the event attribute of its object, so firing an event is a single attribute lookup.
+
+    Note:
+        - Handler signatures are validated when they are registered, never when an event fires.
+        - The event attribute is the only record of the handler: assigning it directly (e.g. `Button.Pressed = MyHandler`) replaces a handler registered through extronlib.event, and the other way round.
+        - An event is a class attribute that defaults to None, or a slot of a class using __slots__, holding None or a handler. Other attributes, such as methods and parameters, are not events.
+
+    ---
+
+    Parameters:
+        - EVENT_ARGUMENTS - (int) - number of positional arguments every event handler must accept (the object triggering the event and the event value)
+    """
+    EVENT_ARGUMENTS: int = 2
+
+    @classmethod
+    def Register(cls, Objects, EventNames, Function: callable) -> None:
+        """ Register Function as the handler of each event in EventNames for each object in Objects.
+
+        Arguments:
+            - Objects (object or list of objects) - object(s) triggering the event
+            - EventNames (string or list of strings) - name(s) of the event(s), as defined by the object's class
+            - Function (function) - event handler
+
+        Raises:
+            - AttributeError if an event is not defined by the object's class
+            - TypeError if Function does not accept exactly the arguments of the event
+        """
+        objects = Objects if isinstance(Objects, (list, tuple)) else [Objects]
+        names = [EventNames] if isinstance(EventNames, str) else list(EventNames)
+
+        for obj in objects:
+            for name in names:
+                cls._CheckEvent(obj, name)
+        cls._CheckSignature(Function)
+
+        for obj in objects:
+            for name in names:
+                setattr(obj, name, Function)
+
+    @classmethod
+    def Unregister(cls, Object, EventName: str) -> None:
+        """ Remove the handler of EventName for Object.
+
+        Arguments:
+            - Object (object) - object triggering the event
+            - EventName (string) - name of the event
+
+        Raises:
+            - AttributeError if EventName is not an event of the object's class
+        """
+        cls._CheckEvent(Object, EventName)
+        setattr(Object, EventName, None)
+
+    @classmethod
+    def Emit(cls, Object, EventName: str, Value=None) -> None:
+        """ Fire EventName for Object.
+
+        Arguments:
+            - Object (object) - object triggering the event
+            - EventName (string) - name of the event
+            - (optional) Value (any) - second argument passed to the handler
+        """
+        handler = getattr(Object, EventName, None)
+        if handler is not None:
+            handler(Object, Value)
+
+    @classmethod
+    def GetHandler(cls, Object, EventName: str) -> callable:
+        """ Return the handler of EventName for Object.
+
+        Returns
+            - the registered handler or None (function)
+        """
+        return getattr(Object, EventName, None)
+
+    @staticmethod
+    def _CheckEvent(Object, EventName: str) -> None:
+        for klass in type(Object).__mro__:
+            if EventName in vars(klass):
+                default = vars(klass)[EventName]
+                if default is None or isinstance(default, MemberDescriptorType):
+                    value = getattr(Object, EventName, None)
+                    if value is None or callable(value):
+                        return
+                break
+        raise AttributeError("'{}' object has no event '{}'".format(type(Object).__name__, EventName))
+
+    @classmethod
+    def _CheckSignature(cls, Function: callable) -> None:
+        if not callable(Function):
+            raise TypeError('event handler must be callable')
+        try:
+            sig = signature(Function)
+        except (TypeError, ValueError):
+            return
+        try:
+            sig.bind(*([None] * cls.EVENT_ARGUMENTS))
+        except TypeError:
+            raise TypeError('event handler {} must accept exactly {} arguments'.format(
+                getattr(Function, '__name__', repr(Function)), cls.EVENT_ARGUMENTS)) from None
@@ -0,0 +1,120 @@
+import threading
+from Scheduler import Scheduler
+
+
+class IntervalGroups():
+    """ Members grouped by interval, with one Scheduler entry per group.
+
+    Shared bookkeeping of the engines that serve many objects at a few distinct intervals (KeepAlive, Blink and Stream): a group costs one scheduler entry however many members it has, and the entry is cancelled when the last member leaves. What a group does when it is due is up to the engine.
+
+    A group is a dict with the following keys:
+        - 'Members' (dict) - member to the value it joined with
+        - 'Deadline' (float) - time of the scheduled entry on Scheduler.Now(), or None
+        - 'Entry' (list) - the scheduled entry, or None when nothing is scheduled
+
+    Note:
+        - Hold Lock while reading or changing groups.
+        - Function is called without Lock held, and the group may be gone by then.
+
+    ---
+
+    Arguments:
+        - Function (function) - called with the key of a group when its entry is due
+
+    ---
+
+    Parameters:
+        - Lock - (RLock) - guards the groups
+        - Groups - Returns (int) - number of groups
+        - Members - Returns (int) - number of members
+    """
+
+    def __init__(self, Function: callable) -> None:
+        """ IntervalGroups class constructor.
+
+        Arguments:
+            - Function (function) - called with the key of a group when its entry is due
+        """
+        self.Lock = threading.RLock()
+        self._Function = Function
+        self._Groups = {}
+        self._Members = {}
+
+    @property
+    def Groups(self) -> int:
+        return len(self._Groups)
+
+    @property
+    def Members(self) -> int:
+        return len(self._Members)
+
+    def Add(self, Member, key, value) -> dict:
+        """ Add Member to the group for key, creating the group if needed. Member leaves any group it is in first.
+
+        Arguments:
+            - Member (object) - member to add
+            - key (float) - interval (or rate) identifying the group
+            - value (object) - per-member data kept by the engine
+
+        Returns
+            - the group (dict)
+        """
+        with self.Lock:
+            self.Remove(Member)
+            group = self._Groups.get(key)
+            if group is None:
+                group = self._Groups[key] = {'Members': {}, 'Deadline': None, 'Entry': None}
+            group['Members'][Member] = value
+            self._Members[Member] = key
+            return group
+
+    def Remove(self, Member):
+        """ Remove Member from its group. The group and its entry go with its last member.
+
+        Arguments:
+            - Member (object) - member to remove
+
+        Returns
+            - the value Member joined with, or None if it is in no group
+        """
+        with self.Lock:
+            key = self._Members.pop(Member, None)
+            if key is None:
+                return None
+            group = self._Groups[key]
+            value = group['Members'].pop(Member)
+            if not group['Members']:
+                if group['Entry'] is not None:
+                    Scheduler.Cancel(group['Entry'])
+                del self._Groups[key]
+            return value
+
+    def Key(self, Member):
+        """ Returns the key of the group Member is in, or None. """
+        return self._Members.get(Member)
+
+    def Get(self, key) -> dict:
+        """ Returns the group for key, or None. """
+        return self._Groups.get(key)
+
+    def Schedule(self, key, deadline: float) -> None:
+        """ Schedule the group for key at deadline, replacing its entry.
+
+        Arguments:
+            - key (float) - key of an existing group
+            - deadline (float) - time on Scheduler.Now()
+        """
+        with self.Lock:
+            group = self._Groups[key]
+            if group['Entry'] is not None:
+                Scheduler.Cancel(group['Entry'])
+            group['Deadline'] = deadline
+            group['Entry'] = Scheduler.Schedule(deadline, self._Due, key)
+
+    def _Due(self, key) -> None:
+        with self.Lock:
+            group = self._Groups.get(key)
+            if group is None:
+                return
+            group['Entry'] = None
+        self._Function(key)
@@ -0,0 +1,214 @@
+import heapq
+import threading
+import time
+import traceback
+from itertools import count
+
+
+class Scheduler():
+    """ Single min-heap of deadlines shared by Wait, Timer and Clock.
+
+    The scheduler runs on either the wall clock or a virtual clock. On the wall clock, due entries are executed by one background thread. On the virtual clock nothing runs on its own: time only moves when Advance() is called, which executes every entry that falls due in deadline order.
+
+    Note:
+        - Deadlines are on the timebase of Now(): time.monotonic() on the wall clock, so setting the system time does not move them, and seconds since the epoch on the virtual clock. Time() gives the calendar time, which Clock converts its alarms from.
+        - Switch clocks before creating Wait, Timer or Clock objects. Pending entries keep their deadlines when the clock is switched.
+        - Exceptions raised by functions are printed on the wall clock and propagated out of Advance() on the virtual clock.
+        - Cancelled entries are left in the heap and skipped when they reach the top. Once they make up more than half of the heap, they are reclaimed in one pass.
+
+    ---
+
+    Parameters:
+        - Mode - Returns (string) - the current clock ('Wall', 'Virtual')
+    """
+    Mode: str = 'Wall'
+
+    COMPACT_MINIMUM: int = 64
+
+    _Heap: list = []
+    _Cancelled: int = 0
+    _Sequence = count()
+    _VirtualNow: float = 0.0
+    _Lock = threading.RLock()
+    _Wakeup = threading.Condition(_Lock)
+    _Thread: threading.Thread = None
+
+    @classmethod
+    def UseVirtualTime(cls, Start: float=None) -> None:
+        """ Switch to the virtual clock.
+
+        Arguments:
+            - (optional) Start (float) - virtual time to start at in seconds since the epoch. Defaults to the current wall time.
+        """
+        with cls._Lock:
+            cls._VirtualNow = time.time() if Start is None else float(Start)
+            cls.Mode = 'Virtual'
+            cls._Wakeup.notify()
+
+    @classmethod
+    def UseWallTime(cls) -> None:
+        """ Switch to the wall clock. """
+        with cls._Lock:
+            cls.Mode = 'Wall'
+            if cls._Heap:
+                cls._StartThread()
+            cls._Wakeup.notify()
+
+    @classmethod
+    def Now(cls) -> float:
+        """ Returns the current time of the active clock, on the timebase of deadlines.
+
+        Returns
+            - seconds; monotonic on the wall clock, since the epoch on the virtual clock (float)
+        """
+        if cls.Mode == 'Virtual':
+            return cls._VirtualNow
+        return time.monotonic()
+
+    @classmethod
+    def Time(cls) -> float:
+        """ Returns the current calendar time of the active clock.
+
+        Returns
+            - seconds since the epoch (float)
+        """
+        if cls.Mode == 'Virtual':
+            return cls._VirtualNow
+        return time.time()
+
+    @classmethod
+    def Schedule(cls, Deadline: float, Function: callable, *args) -> list:
+        """ Execute Function(*args) at Deadline.
+
+        Arguments:
+            - Deadline (float) - time in seconds on the timebase of Now()
+            - Function (function) - code to execute
+            - args - arguments passed to Function
+
+        Returns
+            - handle of the entry, to be passed to Cancel() (list)
+        """
+        entry = [Deadline, next(cls._Sequence), Function, args]
+        with cls._Lock:
+            heapq.heappush(cls._Heap, entry)
+            if cls.Mode == 'Wall':
+                cls._StartThread()
+                if cls._Heap[0] is entry:
+                    cls._Wakeup.notify()
+        return entry
+
+    @classmethod
+    def Cancel(cls, Entry: list) -> None:
+        """ Stop a scheduled entry from executing.
+
+        Arguments:
+            - Entry (list) - handle returned by Schedule()
+        """
+        with cls._Lock:
+            if Entry[2] is None:
+                return
+            Entry[2] = None
+            Entry[3] = ()
+            cls._Cancelled += 1
+            if cls._Cancelled > cls.COMPACT_MINIMUM and cls._Cancelled * 2 > len(cls._Heap):
+                cls._Compact()
+
+    @classmethod
+    def Pending(cls) -> int:
+        """ Returns the number of entries waiting to execute.
+
+        Returns
+            - number of pending entries (int)
+        """
+        with cls._Lock:
+            return len(cls._Heap) - cls._Cancelled
+
+    @classmethod
+    def Advance(cls, Seconds: float) -> int:
+        """ Move the virtual clock forward, executing every entry that falls due in deadline order.
+
+        Arguments:
+            - Seconds (float) - amount of virtual time to advance
+
+        Returns
+            - number of entries executed (int)
+
+        Raises:
+            - RuntimeError if the virtual clock is not in use
+        """
+        if cls.Mode != 'Virtual':
+            raise RuntimeError('Advance() requires the virtual clock')
+        target = cls._VirtualNow + Seconds
+        executed = 0
+        while True:
+            with cls._Lock:
+                entry = cls._PopDue(target)
+                if entry is None:
+                    cls._VirtualNow = max(cls._VirtualNow, target)
+                    return executed
+                cls._VirtualNow = max(cls._VirtualNow, entry[0])
+                function, args = cls._Release(entry)
+            function(*args)
+            executed += 1
+
+    @classmethod
+    def NextDeadline(cls) -> float:
+        """ Returns the deadline of the earliest pending entry.
+
+        Returns
+            - seconds on the timebase of Now(), or None if nothing is pending (float)
+        """
+        with cls._Lock:
+            while cls._Heap and cls._Heap[0][2] is None:
+                heapq.heappop(cls._Heap)
+                cls._Cancelled -= 1
+            return cls._Heap[0][0] if cls._Heap else None
+
+    @classmethod
+    def _PopDue(cls, now: float) -> list:
+        heap = cls._Heap
+        while heap and heap[0][0] <= now:
+            entry = heapq.heappop(heap)
+            if entry[2] is not None:
+                return entry
+            cls._Cancelled -= 1
+        return None
+
+    @classmethod
+    def _Release(cls, entry: list) -> tuple:
+        function, args = entry[2], entry[3]
+        entry[2] = None
+        entry[3] = ()
+        return function, args
+
+    @classmethod
+    def _Compact(cls) -> None:
+        cls._Heap[:] = [entry for entry in cls._Heap if entry[2] is not None]
+        heapq.heapify(cls._Heap)
+        cls._Cancelled = 0
+
+    @classmethod
+    def _StartThread(cls) -> None:
+        if cls._Thread is None or not cls._Thread.is_alive():
+            cls._Thread = threading.Thread(target=cls._Run, name='extronlib.Scheduler', daemon=True)
+            cls._Thread.start()
+
+    @classmethod
+    def _Run(cls) -> None:
+        while True:
+            with cls._Lock:
+                while True:
+                    if cls.Mode == 'Wall':
+                        now = time.monotonic()
+                        entry = cls._PopDue(now)
+                        if entry is not None:
+                            function, args = cls._Release(entry)
+                            break
+                        timeout = cls._Heap[0][0] - now if cls._Heap else None
+                    else:
+                        timeout = None
+                    cls._Wakeup.wait(timeout)
+            try:
+                function(*args)
+            except Exception:
+                traceback.print_exc()
@@ -1,11 +1,20 @@
+from collections import deque
+from time import perf_counter
+from Scheduler import Scheduler
+from EventDispatcher import EventDispatcher
+
+
 class Timer():
     """ The Timer class allows the user to execute programmed actions on a regular time differential schedule.
     
     Note:
         - The handler (Function) must accept exactly two parameters, which are the Timer that called it and the Count.
         - If the handler (Function) has not finished by the time the Interval has expired, Function will not be called and Count will not be incremented (i.e. that interval will be skipped).
+        - Handlers of all timers run one after another on the scheduler thread. Intervals lost while another handler was running are skipped too, but only count toward Skipped if they passed while this timer's own handler ran; the delay shows as Jitter in GetStatistics().
     
     In addition to being used as a decorator, Timer can be named and modified.
+
+    Ticks are scheduled against absolute deadlines (start + n * Interval), so a late tick does not delay the ones after it.
     
     ---
 
@@ -19,6 +28,7 @@ class Timer():
         - Count - Returns (int) - Number of events triggered by this timer.
         - Function - Returns (function) - Handler function to execute each Interval. Function must accept exactly two parameters, which are the Timer that called it and the Count.
         - Interval - Returns (float) - How often to call the handler in seconds.
+        - Skipped - Returns (int) - Number of intervals skipped because this timer's handler had not finished in time.
         - State - Returns (string) - Current state of Timer ('Running', 'Paused', 'Stopped')
     
     ---
@@ -29,6 +39,12 @@ class Timer():
     
     Interval = 0.0
     Function = None
+    Count = 0
+    Skipped = 0
+    State = 'Stopped'
+    StateChanged = None
+
+    SAMPLE_SIZE = 1000
 
     def __init__(self, Interval: float, Function: callable=None) -> None:
         """ Timer class constructor.
@@ -37,7 +53,25 @@ class Timer():
             - Interval (float) - How often to call the handler in seconds (minimum interval is 0.1s).
             - Function (function) - Handler function to execute each Interval.
         """
-        ...
+        self.Interval = max(Interval, 0.1)
+        self.Function = Function
+        self.Count = 0
+        self.Skipped = 0
+        self.State = 'Stopped'
+        self._Entry = None
+        self._Anchor = 0.0
+        self._Period = 0
+        self._Deadline = 0.0
+        self._Latency = deque(maxlen=self.SAMPLE_SIZE)
+        self._Lateness = deque(maxlen=self.SAMPLE_SIZE)
+        if Function is not None:
+            self.Restart()
+
+    def __call__(self, Function: callable) -> 'Timer':
+        """ Decorate Function to be the handler executed each Interval. """
+        self.Function = Function
+        self.Restart()
+        return self
 
     def Change(self, Interval: float) -> None:
         """ Set a new Interval value for future events in this instance.
@@ -46,28 +80,99 @@ class Timer():
             - Interval (float) - How often to call the handler in seconds.
         
         """
-        ...
+        self._Anchor = self._Deadline
+        self._Period = 0
+        self.Interval = max(Interval, 0.1)
 
     def Pause(self) -> None:
         """ Pause the timer (i.e. stop calling the Function).
         
         Note: Does not reset the timer or the Count.
         """
-        ...
+        self._Unschedule()
+        self._SetState('Paused')
 
     def Resume(self) -> None:
         """ Resume the timer after being paused or stopped.
         """
-        ...
+        if self._Entry is None:
+            self._Anchor = Scheduler.Now()
+            self._Period = 1
+            self._Deadline = self._Anchor + self.Interval
+            self._Entry = Scheduler.Schedule(self._Deadline, self._Tick)
+        self._SetState('Running')
 
     def Restart(self) -> None:
         """Restarts the timer – resets the Count and executes the Function in Interval seconds."""
-        ...
+        self._Unschedule()
+        self.Count = 0
+        self.Resume()
     
     def Stop(self) -> None:
         """ Stop the timer.
         
         Note: Resets the timer and the Count.
         """
-        ...
+        self._Unschedule()
+        self.Count = 0
+        self._SetState('Stopped')
+
+    def GetStatistics(self) -> dict:
+        """ Returns handler timing measured over the most recent ticks.
+
+        Returns
+            - dict with the following keys:
+                - 'Skipped' (int) - intervals skipped because the handler overran
+                - 'LatencyP50' (float) - median handler run time in seconds
+                - 'LatencyP99' (float) - 99th percentile handler run time in seconds
+                - 'Jitter' (float) - mean delay in seconds between a tick's deadline and its handler starting
+        """
+        latency = sorted(self._Latency)
+        lateness = self._Lateness
+        return {
+            'Skipped': self.Skipped,
+            'LatencyP50': latency[len(latency) // 2] if latency else 0.0,
+            'LatencyP99': latency[min(len(latency) - 1, len(latency) * 99 // 100)] if latency else 0.0,
+            'Jitter': sum(lateness) / len(lateness) if lateness else 0.0,
+        }
+
+    def _Unschedule(self) -> None:
+        if self._Entry is not None:
+            Scheduler.Cancel(self._Entry)
+            self._Entry = None
+
+    def _SetState(self, State: str) -> None:
+        if State != self.State:
+            self.State = State
+            EventDispatcher.Emit(self, 'StateChanged', State)
+
+    def _Tick(self) -> None:
+        self._Entry = None
+        now = Scheduler.Now()
+        self._Lateness.append(now - self._Deadline)
+        self.Count += 1
+        if self.Function is not None:
+            started = perf_counter()
+            try:
+                self.Function(self, self.Count)
+            finally:
+                self._Latency.append(perf_counter() - started)
+                self._Next(now)
+        else:
+            self._Next(now)
+
+    def _Next(self, started: float) -> None:
+        if self.State != 'Running' or self._Entry is not None:
+            return
+        self._Period += 1
+        now = Scheduler.Now()
+        if self._Anchor + self._Period * self.Interval <= now:
+            missed = int((now - self._Anchor) // self.Interval) + 1 - self._Period
+            # Deadlines that had passed before the handler started were lost to other work on the scheduler
+            # thread (counted in Jitter); only those passing while the handler ran are this timer's overrun.
+            first = max(self._Period, int((started - self._Anchor) // self.Interval) + 1)
+            self.Skipped += max(0, self._Period + missed - first)
+            self._Period += missed
+        self._Deadline = self._Anchor + self._Period * self.Interval
+        self._Entry = Scheduler.Schedule(self._Deadline, self._Tick)
 
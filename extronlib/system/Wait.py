@@ -1,3 +1,6 @@
+from Scheduler import Scheduler
+
+
 class Wait():
     """ The wait class allows the user to execute programmed actions after a desired delay without blocking other processor activity.
     
@@ -19,27 +22,76 @@ class Wait():
     Function: callable = None
 
     def __init__(self, Time: float, Function: callable=None) -> None:
-        """ File class constructor.
+        """ Wait class constructor.
 
         Arguments:
             - Time (float) - Expiration time of the wait in seconds
             - Function (function) - Code to execute when Time expires
         """
-        ...
+        self.Time = Time
+        self.Function = Function
+        self._Start = 0.0
+        self._Deadline = None
+        self._Entry = None
+        if Function is not None:
+            self.Restart()
+
+    def __call__(self, Function: callable) -> 'Wait':
+        """ Decorate Function to be executed when Time expires. """
+        self.Function = Function
+        self.Restart()
+        return self
 
     def Add(self, Time: float) -> None:
         """ Add time to current timer. """
-        pass
+        if self._Deadline is not None:
+            self._Arm(self._Deadline + Time)
 
     def Cancel(self) -> None:
         """ Stop wait Function from executing when the timer expires. """
-        pass
+        self._Deadline = None
+        if self._Entry is not None:
+            Scheduler.Cancel(self._Entry)
+            self._Entry = None
 
-    def Change(self) -> None:
-        """ Set a new Time value for current and future timers in this instance. """
-        pass
+    def Change(self, Time: float) -> None:
+        """ Set a new Time value for current and future timers in this instance.
+
+        Arguments:
+            - Time (float) - Expiration time of the wait in seconds
+        """
+        self.Time = Time
+        if self._Deadline is not None:
+            self._Arm(self._Start + Time)
 
     def Restart(self) -> None:
         """ Restarts the timer – executes the Function in Time seconds. If the a timer is active, cancels that timer before starting the new timer.
         """
-        pass
+        self._Start = Scheduler.Now()
+        self._Arm(self._Start + self.Time)
+
+    def _Arm(self, deadline: float) -> None:
+        # Moving the deadline later keeps the scheduled entry: it fires early and re-arms itself for the new deadline,
+        # so the common Restart() on every button press costs nothing and leaves no cancelled entries behind.
+        self._Deadline = deadline
+        entry = self._Entry
+        if entry is not None and entry[2] is not None:
+            if entry[0] <= deadline:
+                return
+            Scheduler.Cancel(entry)
+        self._Entry = Scheduler.Schedule(deadline, self._Expire)
+
+    def _Expire(self) -> None:
+        entry = self._Entry
+        if entry is not None and entry[2] is not None:
+            return
+        if self._Deadline is None:
+            self._Entry = None
+            return
+        if self._Deadline > Scheduler.Now():
+            self._Entry = Scheduler.Schedule(self._Deadline, self._Expire)
+            return
+        self._Entry = None
+        self._Deadline = None
+        if self.Function is not None:
+            self.Function()
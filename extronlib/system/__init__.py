@@ -1,9 +1,11 @@
 from typing import Optional
 from Clock import Clock
 from Email import Email
+from EventDispatcher import EventDispatcher
 from File import File
 from MESet import MESet
 from RFile import RFile
+from Scheduler import Scheduler
 from Timer import Timer
 from Wait import Wait
 
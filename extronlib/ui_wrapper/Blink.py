@@ -0,0 +1,84 @@
+import math
+from IntervalGroups import IntervalGroups
+import system
+
+
+class Blink():
+    """ Shared blink engine behind Button.SetBlinking() and Button.CustomBlink().
+
+    Buttons blinking at the same rate share one entry in extronlib.system.Scheduler, however many there are (see IntervalGroups.py). Ticks fall on whole multiples of the rate, and the state shown at a tick depends only on the tick number, so buttons with the same rate and the same number of states blink in unison wherever they started. Each tick sends one update per UIDevice covering all its blinking buttons.
+
+    ---
+
+    Parameters:
+        - RATES - (dict) - time in seconds each state is shown for the ADA compliant rates of SetBlinking()
+    """
+    RATES: dict = {'Slow': 1.0, 'Medium': 0.5, 'Fast': 0.25}
+
+    _Groups = IntervalGroups(lambda rate: Blink._Tick(rate))
+
+    @classmethod
+    def Start(cls, Button, rate: float, stateList: list) -> None:
+        """ Start cycling Button through stateList. Replaces a blink already running on Button.
+
+        Arguments:
+            - Button (extronlib.ui_wrapper.Button) - button to blink
+            - rate (float) - time in seconds each state is shown
+            - stateList (list of ints) - visual states to cycle through
+
+        Raises:
+            - ValueError if rate is not positive or stateList is empty
+        """
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+        if not stateList:
+            raise ValueError('stateList must not be empty')
+        stateList = list(stateList)
+        with cls._Groups.Lock:
+            tick = math.floor(system.Scheduler.Now() / rate)
+            group = cls._Groups.Add(Button, rate, stateList)
+            if group['Entry'] is None:
+                cls._Groups.Schedule(rate, (tick + 1) * rate)
+        # Show the state of the current phase right away instead of waiting for the next tick.
+        Button.Host._Apply([(Button.ID, 'SetState', stateList[tick % len(stateList)])])
+
+    @classmethod
+    def Stop(cls, Button) -> None:
+        """ Stop the blink running on Button, if any.
+
+        Arguments:
+            - Button (extronlib.ui_wrapper.Button) - blinking button
+        """
+        cls._Groups.Remove(Button)
+
+    @classmethod
+    def GetStatistics(cls) -> dict:
+        """ Returns blink engine counters.
+
+        Returns
+            - dict with the following keys:
+                - 'Rates' (int) - distinct rates in use, i.e. scheduler entries
+                - 'Buttons' (int) - blinking buttons
+        """
+        with cls._Groups.Lock:
+            return {'Rates': cls._Groups.Groups, 'Buttons': cls._Groups.Members}
+
+    @classmethod
+    def _Tick(cls, rate: float) -> None:
+        with cls._Groups.Lock:
+            group = cls._Groups.Get(rate)
+            if group is None:
+                return
+            now = system.Scheduler.Now()
+            tick = round(group['Deadline'] / rate)
+            deadline = group['Deadline'] + rate
+            if deadline <= now:
+                # Late: skip the missed ticks rather than replaying them.
+                tick = math.floor(now / rate)
+                deadline = (tick + 1) * rate
+            cls._Groups.Schedule(rate, deadline)
+            hosts = {}
+            for button, states in group['Members'].items():
+                hosts.setdefault(button.Host, []).append((button.ID, 'SetState', states[tick % len(states)]))
+        for host, updates in hosts.items():
+            host._Apply(updates)
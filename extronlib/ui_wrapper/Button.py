@@ -1,5 +1,7 @@
 from typing import Union
 import ui_wrapper, device
+import system
+from Blink import Blink
 
 
 class Button():
@@ -16,6 +18,10 @@ class Button():
         - (optional) `repeatTime` (float) - Time for Repeated event. After holdTime expires, the Repeated event is triggered for every additional repeatTime of button being held. If repeatTime is given, it must be a floating point number specifying time in seconds of button being held.
 
     Note: If button is released before holdTime expires, a Tapped event is triggered instead of a Released event. If the button is released after holdTime expires, there will be no Tapped event.
+
+    Note: Held and Repeated are timed on extronlib.system.Scheduler with a single pending entry per pressed button. On the virtual clock, Button.Inject() plays back presses and releases at given times for testing.
+
+    Note: Updates that would not change what the device shows are not sent. See UIDevice.FlushInterval and UIDevice.GetStatistics().
     
     ---
 
@@ -34,25 +40,12 @@ class Button():
     Events:
         - `Held` - (Event) Get/Set the callback when hold expire event is triggered. The callback function must accept exactly two parameters, which are the Button that triggers the event and the state (e.g. ‘Held’).
         - `Pressed` - (Event) Get/Set the callback when the button is pressed. The callback function must accept exactly two parameters, which are the Button that triggers the event and the state (e.g. ‘Pressed’).
-        - `Released` - (Event) Get/Set the callback when the button is released. The callback function must accept exactly two parameters, which are the Button that triggers the event and the state (e.g. ‘Held’).
+        - `Released` - (Event) Get/Set the callback when the button is released. The callback function must accept exactly two parameters, which are the Button that triggers the event and the state (e.g. ‘Released’).
         - `Repeated` - (Event) Get/Set the callback when repeat event is triggered. The callback function must accept exactly two parameters, which are the Button that triggers the event and the state (e.g. ‘Repeated’).
         - `Tapped` - (Event) Get/Set the callback when tap event is triggered. The callback function must accept exactly two parameters, which are the Button that triggers the event and the state (e.g. ‘Tapped’).
     """
-    UIHost = None
-    ID = 0
-    holdTime = 0.0
-    repeatTime = 0.0
-    BlinkState = ''
-    Enabled = True
-    Held = None
-    Name = ''
-    Pressed = None
-    PressedState = True
-    Released = None
-    Repeated = None
-    State = 0
-    Tapped = None
-    Visible = True
+    __slots__ = ('UIHost', 'Host', 'ID', 'Name', 'holdTime', 'repeatTime', 'BlinkState', 'Enabled', 'PressedState', 'State', 'Visible',
+                 'Held', 'Pressed', 'Released', 'Repeated', 'Tapped', '_Entry', '_Held')
 
     def __init__(self, UIHost: device.UIDevice, ID: Union[int, str], holdTime: float=None, repeatTime: float=None) -> None:
         """ Button class constructor.
@@ -63,7 +56,20 @@ class Button():
             - (optional) holdTime (float) - Time for Held event. Held event is triggered only once if the button is pressed and held beyond this time. If holdTime is given, it must be a floating point number specifying period of time in seconds of button being pressed and held to trigger Held event.
             - (optional) repeatTime (float) - Time for Repeated event. After holdTime expires, the Repeated event is triggered for every additional repeatTime of button being held. If repeatTime is given, it must be a floating point number specifying time in seconds of button being held.
         """
-        ...
+        self.UIHost = self.Host = UIHost
+        self.ID = ID
+        self.Name = ID if isinstance(ID, str) else ''
+        self.holdTime = holdTime
+        self.repeatTime = repeatTime
+        self.BlinkState = 'Not blinking'
+        self.Enabled = True
+        self.PressedState = False
+        self.State = 0
+        self.Visible = True
+        self._Entry = None
+        self._Held = False
+        self.Held = self.Pressed = self.Released = self.Repeated = self.Tapped = None
+        UIHost._Register(self)
 
     def CustomBlink(self, rate: float, stateList: list[int]) -> None:
         """ Make the button cycle through each of the states provided.
@@ -71,8 +77,47 @@ class Button():
         Arguments:
             - rate (float) - duration of time in seconds for one visual state to stay until replaced by the next visual state.
             - stateList (list of ints) - list of visual states that this button blinks among.
+
+        Raises:
+            - ValueError
         """
-        ...
+        Blink.Start(self, rate, stateList)
+        self.BlinkState = 'Blinking'
+
+    @staticmethod
+    def Inject(Actions: list) -> None:
+        """ Test hook: play back presses and releases on the virtual clock.
+
+        The clock is advanced to each timestamp in turn, so Held and Repeated fire between the actions exactly as they would on the device.
+
+        Arguments:
+            - Actions (list of tuples) - (timestamp, Button, 'Pressed' or 'Released') in chronological order. Timestamps are absolute times as returned by extronlib.system.Scheduler.Now().
+
+        Raises:
+            - RuntimeError if the virtual clock is not in use
+            - ValueError if an action is not 'Pressed' or 'Released', or timestamps go backwards
+
+        ---
+
+        Example:
+        ```
+        Scheduler.UseVirtualTime(0)
+        Button.Inject([(0.0, VolumeUp, 'Pressed'), (2.5, VolumeUp, 'Released')])
+        ```
+        """
+        if system.Scheduler.Mode != 'Virtual':
+            raise RuntimeError('Inject() requires the virtual clock')
+        for timestamp, button, action in Actions:
+            delay = timestamp - system.Scheduler.Now()
+            if delay < 0:
+                raise ValueError('timestamps must not go backwards')
+            system.Scheduler.Advance(delay)
+            if action == 'Pressed':
+                button._Press()
+            elif action == 'Released':
+                button._Release()
+            else:
+                raise ValueError("action must be 'Pressed' or 'Released'")
 
     def SetBlinking(self, rate: str, stateList: list[int]) -> None:
         """ Make the button cycle, at ADA compliant rates, through each of the states provided.
@@ -94,9 +139,14 @@ class Button():
         Arguments:
             - rate (string) - ADA compliant blink rate. ('Slow', 'Medium', 'Fast')
             - stateList (list of ints) - list of visual states that this button blinks among.
-        
+
+        Raises:
+            - ValueError if rate is not 'Slow', 'Medium' or 'Fast'
         """
-        ...
+        if rate not in Blink.RATES:
+            raise ValueError("rate must be 'Slow', 'Medium' or 'Fast'")
+        Blink.Start(self, Blink.RATES[rate], stateList)
+        self.BlinkState = 'Blinking'
 
     def SetEnable(self, enable: bool) -> None:
         """ Enable or disable an UI control object.
@@ -104,7 +154,8 @@ class Button():
         Arguments:
             - enable (bool) - True to enable the object or False to disable it.
         """
-        ...
+        self.Enabled = bool(enable)
+        self.Host._Update(self.ID, 'SetEnable', self.Enabled)
 
     def SetState(self, State: int) -> None:
         """ Set the current visual state
@@ -114,7 +165,11 @@ class Button():
 
         Note: Setting the current state stops button from blinking, if it is running. (SetBlinking())
         """
-        ...
+        if self.BlinkState == 'Blinking':
+            Blink.Stop(self)
+            self.BlinkState = 'Not blinking'
+        self.State = State
+        self.Host._Update(self.ID, 'SetState', State)
 
     def SetText(self, text: str) -> None:
         """ Specify text to display on the UIObject
@@ -125,7 +180,9 @@ class Button():
         Raises:
             - TypeError
         """
-        ...
+        if not isinstance(text, str):
+            raise TypeError('text must be a string')
+        self.Host._Update(self.ID, 'SetText', text)
 
     def SetVisible(self, visible: bool) -> None:
         """ Change the visibility of an UI control object.
@@ -133,4 +190,50 @@ class Button():
         Arguments:
             - visible (bool) - True to make the object visible or False to hide it.
         """
-        ...
+        self.Visible = bool(visible)
+        self.Host._Update(self.ID, 'SetVisible', self.Visible)
+
+    def _Press(self) -> None:
+        # Called when the device reports a press.
+        if self.PressedState:
+            return
+        self.PressedState = True
+        self._Held = False
+        system.EventDispatcher.Emit(self, 'Pressed', 'Pressed')
+        if self.holdTime:
+            self._Arm(self.holdTime)
+        elif self.repeatTime:
+            self._Arm(self.repeatTime)
+
+    def _Release(self) -> None:
+        # Called when the device reports a release.
+        if not self.PressedState:
+            return
+        self.PressedState = False
+        if self._Entry is not None:
+            system.Scheduler.Cancel(self._Entry)
+            self._Entry = None
+        if self.holdTime and not self._Held:
+            system.EventDispatcher.Emit(self, 'Tapped', 'Tapped')
+        else:
+            system.EventDispatcher.Emit(self, 'Released', 'Released')
+
+    def _Arm(self, delay: float) -> None:
+        entry = self._Entry
+        deadline = (entry[0] if entry is not None else system.Scheduler.Now()) + delay
+        self._Entry = system.Scheduler.Schedule(deadline, self._Expire)
+
+    def _Expire(self) -> None:
+        if not self.PressedState:
+            return
+        if self.holdTime and not self._Held:
+            self._Held = True
+            event = 'Held'
+        else:
+            event = 'Repeated'
+        # Re-arm from the previous deadline before firing so repeats do not drift with handler time.
+        if self.repeatTime:
+            self._Arm(self.repeatTime)
+        else:
+            self._Entry = None
+        system.EventDispatcher.Emit(self, event, event)
@@ -1,26 +1,30 @@
+import threading
+import system
+
+
 class Knob():
     """ Knob is a rotary control that has 36 steps for a full revolution
-    
+
     ---
 
     Arguments:
         - UIHost (extronlib.device.UIDevice) - Device object hosting this UIObject
         - ID (int) - ID of the UIObject
-    
+
     ---
-    
+
     Parameters:
         - Host - Returns (extronlib.device.UIDevice) - UIDevice object that hosts this control object
         - ID - Returns (int) - the object ID
-    
+
     ---
-    
+
     Events:
         - Turned - (Event) Get/Set callback when knob is turned. The callback takes two parameters. The first one is the Knob itself and the second one is a signed integer indicating steps that was turned. Positive values indicate clockwise rotation.
+
+    Note: By default every step reported by the device triggers Turned. SetAggregation() sums the steps turned within a window into one Turned event and can scale fast turns with an acceleration curve.
     """
-    UIHost = None
-    ID = 0
-    Turned = None
+    __slots__ = ('UIHost', 'Host', 'ID', 'Turned', '_Window', '_Acceleration', '_Steps', '_Entry', '_Lock')
 
     def __init__(self, UIHost, ID):
         """ Knob class constructor.
@@ -29,4 +33,54 @@ class Knob():
             - UIHost (extronlib.device.UIDevice) - Device object hosting this UIObject
             - ID (int) - ID of the UIObject
         """
-        ...
+        self.UIHost = self.Host = UIHost
+        self.ID = ID
+        self._Window = 0.0
+        self._Acceleration = 1.0
+        self._Steps = 0
+        self._Entry = None
+        self._Lock = threading.Lock()
+        self.Turned = None
+        UIHost._Register(self)
+
+    def SetAggregation(self, window: float, acceleration: float=1.0) -> None:
+        """ Sum the steps turned within a window into one Turned event.
+
+        The window starts with the first step and Turned is triggered when it ends. The summed steps n are then scaled to sign(n) * round(abs(n) ** acceleration), so an acceleration above 1 makes fast turns count for more.
+
+        Arguments:
+            - window (float) - time in seconds to collect steps. 0 triggers Turned for every report from the device.
+            - (optional) acceleration (float) - exponent of the acceleration curve. 1 keeps the step count unchanged.
+
+        Raises:
+            - ValueError if window is negative or acceleration is not positive
+        """
+        if window < 0:
+            raise ValueError('window must not be negative')
+        if acceleration <= 0:
+            raise ValueError('acceleration must be positive')
+        self._Window = window
+        self._Acceleration = acceleration
+
+    def _Turn(self, steps: int) -> None:
+        # Called with the signed steps reported by the device.
+        if self._Window <= 0:
+            self._Emit(steps)
+            return
+        with self._Lock:
+            self._Steps += steps
+            if self._Entry is None:
+                self._Entry = system.Scheduler.Schedule(system.Scheduler.Now() + self._Window, self._Expire)
+
+    def _Expire(self) -> None:
+        with self._Lock:
+            self._Entry = None
+            steps = self._Steps
+            self._Steps = 0
+        self._Emit(steps)
+
+    def _Emit(self, steps: int) -> None:
+        if self._Acceleration != 1.0:
+            steps = round(abs(steps) ** self._Acceleration) * (1 if steps > 0 else -1)
+        if steps:
+            system.EventDispatcher.Emit(self, 'Turned', steps)
@@ -18,10 +18,7 @@ class Label():
         - Name - Returns (string) - the object Name
         - Visible - Returns (bool) - True if the control object is visible else False
     """
-    UIHost = None
-    ID = 0
-    Name = ''
-    Visible = True
+    __slots__ = ('UIHost', 'Host', 'ID', 'Name', 'Visible')
 
     def __init__(self, UIHost: device.UIDevice, ID: Union[int, str]) -> None:
         """ Label class constructor.
@@ -30,7 +27,11 @@ class Label():
             - UIHost (extronlib.device.UIDevice) - Device object hosting this UIObject
             - ID (int,string) - ID or Name of the UIObject
         """
-        ...
+        self.UIHost = self.Host = UIHost
+        self.ID = ID
+        self.Name = ID if isinstance(ID, str) else ''
+        self.Visible = True
+        UIHost._Register(self)
 
     def SetText(self, text: str) -> None:
         """ Specify text to display on the UIObject
@@ -41,7 +42,9 @@ class Label():
         Raises:
             - TypeError
         """
-        ...
+        if not isinstance(text, str):
+            raise TypeError('text must be a string')
+        self.Host._Update(self.ID, 'SetText', text)
 
     def SetVisible(self, visible: bool) -> None:
         """ Change the visibility of an UI control object.
@@ -49,4 +52,5 @@ class Label():
         Arguments:
             - visible (bool) - True to make the object visible or False to hide it.
         """
-        ...
+        self.Visible = bool(visible)
+        self.Host._Update(self.ID, 'SetVisible', self.Visible)
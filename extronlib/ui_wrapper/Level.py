@@ -1,5 +1,6 @@
 from typing import Optional
 import device
+from Stream import Stream
 
 
 class Level():
@@ -21,14 +22,10 @@ class Level():
         - Min - Returns (int) - the lower bound of the level object
         - Name - Returns (string) - the object Name
         - Visible - Returns (bool) - True if the control object is visible else False
+
+    Note: Levels fed by fast sources such as meters should use StartStreaming(), which sends at most FrameRate updates per second and skips changes smaller than a deadband.
     """
-    UIHost = None
-    ID = 0
-    Name = ''
-    Visible = True
-    Level = 0
-    Max = 0
-    Min = 0
+    __slots__ = ('UIHost', 'Host', 'ID', 'Name', 'Visible', 'Level', 'Max', 'Min', '_Step')
 
     def __init__(self, UIHost: device.UIDevice, ID: int) -> None:
         """ Level class constructor.
@@ -37,23 +34,35 @@ class Level():
             - UIHost (extronlib.device.UIDevice) - Device object hosting this UIObject
             - ID (int) - ID of the UIObject
         """
-        ...
+        self.UIHost = self.Host = UIHost
+        self.ID = ID
+        self.Name = ID if isinstance(ID, str) else ''
+        self.Visible = True
+        self.Level = 0
+        self.Min = 0
+        self.Max = 100
+        self._Step = 1
+        UIHost._Register(self)
 
     def Dec(self) -> None:
         """ Nudge the level down a step """
-        ...
+        self.SetLevel(self.Level - self._Step)
 
     def Inc(self) -> None:
         """ Nudge the level up a step """
-        ...
+        self.SetLevel(self.Level + self._Step)
 
     def SetLevel(self, Level: int) -> None:
         """ Set the current level
 
         Arguments:
             - Level (int) - Discrete value of the level object
+
+        Note: Values outside the range are clamped to Min or Max.
         """
-        ...
+        self.Level = min(max(Level, self.Min), self.Max)
+        if not Stream.Put(self, self.Level):
+            self.Host._Update(self.ID, 'SetLevel', self.Level)
 
     def SetRange(self, Min: int, Max: int, Step: Optional[int]=1) -> None:
         """ Set level object’s allowed range and the step size
@@ -63,7 +72,12 @@ class Level():
             - Max (int) - Maximum level
             - (optional) Step (int) - Optional step size for Inc() and Dec().
         """
-        ...
+        self.Min = Min
+        self.Max = Max
+        self._Step = Step
+        self.Host._Update(self.ID, 'SetRange', (Min, Max, Step))
+        if not Min <= self.Level <= Max:
+            self.SetLevel(self.Level)
 
     def SetVisible(self, visible: bool) -> None:
         """ Change the visibility of an UI control object.
@@ -71,4 +85,21 @@ class Level():
         Arguments:
             - visible (bool) - True to make the object visible or False to hide it.
         """
-        ...
\ No newline at end of file
+        self.Visible = bool(visible)
+        self.Host._Update(self.ID, 'SetVisible', self.Visible)
+
+    def StartStreaming(self, FrameRate: float=10, Deadband: float=0) -> None:
+        """ Send level changes at a limited rate (see Stream.py). Only the latest level is sent each frame.
+
+        Arguments:
+            - (optional) FrameRate (float) - maximum number of updates per second
+            - (optional) Deadband (float) - changes smaller than this, relative to the level last sent, are not sent
+
+        Raises:
+            - ValueError if FrameRate is not positive
+        """
+        Stream.Start(self, 'SetLevel', FrameRate, Deadband)
+
+    def StopStreaming(self) -> None:
+        """ Send level changes immediately again. A level waiting for its frame is sent now. """
+        Stream.Stop(self)
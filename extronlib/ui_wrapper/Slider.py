@@ -1,2 +1,126 @@
+from typing import Optional, Union
+import device
+import system
+from Stream import Stream
+
+
 class Slider():
-  pass
\ No newline at end of file
+    """ Slider is a touch control that shows and sets a value within a range
+
+    ---
+
+    Arguments:
+        - UIHost (extronlib.device.UIDevice) - Device object hosting this UIObject
+        - ID (int,string) - ID or Name of the UIObject
+
+    ---
+
+    Parameters:
+        - Enabled - Returns (bool) - True if the control object is enabled else False
+        - Fill - Returns (float) - the current fill value
+        - Host - Returns (extronlib.device.UIDevice) - UIDevice object that hosts this control object
+        - ID - Returns (int) - the object ID
+        - Max - Returns (float) - the upper bound of the slider
+        - Min - Returns (float) - the lower bound of the slider
+        - Name - Returns (string) - the object Name
+        - Step - Returns (float) - the step size of the slider
+        - Visible - Returns (bool) - True if the control object is visible else False
+
+    ---
+
+    Events:
+        - Changed - (Event) Triggers when the user moves the slider. The callback takes two arguments. The first one is the Slider instance triggering the event and the second one is the new value as a float.
+        - Pressed - (Event) Triggers when the slider is touched. The callback takes two arguments. The first one is the Slider instance triggering the event and the second one is the value as a float.
+        - Released - (Event) Triggers when the slider is let go. The callback takes two arguments. The first one is the Slider instance triggering the event and the second one is the value as a float.
+
+    Note: Fill updates use the same rate-limited engine as Level (see StartStreaming()).
+    """
+    __slots__ = ('UIHost', 'Host', 'ID', 'Name', 'Enabled', 'Visible', 'Fill', 'Max', 'Min', 'Step', 'Changed', 'Pressed', 'Released')
+
+    def __init__(self, UIHost: device.UIDevice, ID: Union[int, str]) -> None:
+        """ Slider class constructor.
+
+        Arguments:
+            - UIHost (extronlib.device.UIDevice) - Device object hosting this UIObject
+            - ID (int,string) - ID or Name of the UIObject
+        """
+        self.UIHost = self.Host = UIHost
+        self.ID = ID
+        self.Name = ID if isinstance(ID, str) else ''
+        self.Enabled = True
+        self.Visible = True
+        self.Fill = 0.0
+        self.Min = 0.0
+        self.Max = 100.0
+        self.Step = 1.0
+        self.Changed = self.Pressed = self.Released = None
+        UIHost._Register(self)
+
+    def SetEnable(self, enable: bool) -> None:
+        """ Enable or disable an UI control object.
+
+        Arguments:
+            - enable (bool) - True to enable the object or False to disable it.
+        """
+        self.Enabled = bool(enable)
+        self.Host._Update(self.ID, 'SetEnable', self.Enabled)
+
+    def SetFill(self, Fill: float) -> None:
+        """ Set the current fill value
+
+        Arguments:
+            - Fill (float) - value of the slider
+
+        Note: Values outside the range are clamped to Min or Max.
+        """
+        self.Fill = min(max(Fill, self.Min), self.Max)
+        if not Stream.Put(self, self.Fill):
+            self.Host._Update(self.ID, 'SetFill', self.Fill)
+
+    def SetRange(self, Min: float, Max: float, Step: Optional[float]=1) -> None:
+        """ Set slider's allowed range and the step size
+
+        Arguments:
+            - Min (float) - Minimum value
+            - Max (float) - Maximum value
+            - (optional) Step (float) - step size
+        """
+        self.Min = Min
+        self.Max = Max
+        self.Step = Step
+        self.Host._Update(self.ID, 'SetRange', (Min, Max, Step))
+        if not Min <= self.Fill <= Max:
+            self.SetFill(self.Fill)
+
+    def SetVisible(self, visible: bool) -> None:
+        """ Change the visibility of an UI control object.
+
+        Arguments:
+            - visible (bool) - True to make the object visible or False to hide it.
+        """
+        self.Visible = bool(visible)
+        self.Host._Update(self.ID, 'SetVisible', self.Visible)
+
+    def StartStreaming(self, FrameRate: float=10, Deadband: float=0) -> None:
+        """ Send fill changes at a limited rate (see Stream.py). Only the latest value is sent each frame.
+
+        Arguments:
+            - (optional) FrameRate (float) - maximum number of updates per second
+            - (optional) Deadband (float) - changes smaller than this, relative to the value last sent, are not sent
+
+        Raises:
+            - ValueError if FrameRate is not positive
+        """
+        Stream.Start(self, 'SetFill', FrameRate, Deadband)
+
+    def StopStreaming(self) -> None:
+        """ Send fill changes immediately again. A value waiting for its frame is sent now. """
+        Stream.Stop(self)
+
+    def _Slide(self, Action: str, value: float=None) -> None:
+        # Called when the device reports a touch ('Pressed'), a move ('Changed') or a release ('Released').
+        if value is not None:
+            self.Fill = min(max(value, self.Min), self.Max)
+            # The device already shows the new fill, so a later SetFill() back to the old value must still be sent.
+            Stream.Reported(self, 'SetFill', self.Fill)
+        system.EventDispatcher.Emit(self, Action, self.Fill)
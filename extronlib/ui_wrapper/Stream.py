@@ -0,0 +1,134 @@
+import math
+from IntervalGroups import IntervalGroups
+import system
+
+
+class Stream():
+    """ Shared rate-limited update engine behind StartStreaming() of Level and Slider.
+
+    While streaming, a control only remembers its latest value, and the values of all controls at the same frame rate are sent together once per frame, one update per UIDevice. A value closer than Deadband to the value last sent is not sent at all. Frames fall on whole multiples of 1 / FrameRate on extronlib.system.Scheduler, and no entry is scheduled while nothing is pending.
+    """
+    _Groups = IntervalGroups(lambda rate: Stream._Frame(rate))
+    _Sent: int = 0
+    _Coalesced: int = 0
+    _Suppressed: int = 0
+
+    @classmethod
+    def Start(cls, Control, Command: str, FrameRate: float, Deadband: float=0) -> None:
+        """ Start streaming the values of Control. Replaces streaming already running on Control.
+
+        Arguments:
+            - Control (Level or Slider) - control to stream
+            - Command (string) - device update carrying the value (e.g. 'SetLevel')
+            - FrameRate (float) - maximum number of updates per second
+            - (optional) Deadband (float) - smallest change from the last sent value that is sent
+
+        Raises:
+            - ValueError if FrameRate is not positive
+        """
+        if FrameRate <= 0:
+            raise ValueError('FrameRate must be positive')
+        with cls._Groups.Lock:
+            cls.Stop(Control)
+            group = cls._Groups.Add(Control, FrameRate, {'Command': Command, 'Deadband': Deadband, 'Sent': None, 'Pending': None})
+            group.setdefault('Dirty', set())
+
+    @classmethod
+    def Stop(cls, Control) -> None:
+        """ Stop streaming Control, if it is streaming. A pending value is sent right away.
+
+        Arguments:
+            - Control (Level or Slider) - streaming control
+        """
+        with cls._Groups.Lock:
+            rate = cls._Groups.Key(Control)
+            if rate is None:
+                return
+            cls._Groups.Get(rate)['Dirty'].discard(Control)
+            member = cls._Groups.Remove(Control)
+            if member['Pending'] is not None:
+                cls._Sent += 1
+        if member['Pending'] is not None:
+            Control.Host._Apply([(Control.ID, member['Command'], member['Pending'])])
+
+    @classmethod
+    def Put(cls, Control, value) -> bool:
+        """ Offer a new value of a streaming Control.
+
+        Arguments:
+            - Control (Level or Slider) - streaming control
+            - value (int, float) - new value
+
+        Returns
+            - False if Control is not streaming, else True (bool)
+        """
+        with cls._Groups.Lock:
+            rate = cls._Groups.Key(Control)
+            if rate is None:
+                return False
+            group = cls._Groups.Get(rate)
+            member = group['Members'][Control]
+            if member['Pending'] is not None:
+                cls._Coalesced += 1
+            if member['Sent'] is not None and abs(value - member['Sent']) < member['Deadband']:
+                member['Pending'] = None
+                group['Dirty'].discard(Control)
+                cls._Suppressed += 1
+                return True
+            member['Pending'] = value
+            group['Dirty'].add(Control)
+            if group['Entry'] is None:
+                deadline = (math.floor(system.Scheduler.Now() * rate) + 1) / rate
+                cls._Groups.Schedule(rate, deadline)
+            return True
+
+    @classmethod
+    def Reported(cls, Control, Command: str, value) -> None:
+        """ Record a value the device shows already, e.g. after the user dragged a slider. A value waiting for its frame is dropped, and later values are compared with the reported one, by the deadband and by the shadow state of the UIDevice.
+
+        Arguments:
+            - Control (Level or Slider) - control the value was reported for
+            - Command (string) - device update carrying the value (e.g. 'SetFill')
+            - value (int, float) - value shown by the device
+        """
+        with cls._Groups.Lock:
+            rate = cls._Groups.Key(Control)
+            if rate is not None:
+                group = cls._Groups.Get(rate)
+                member = group['Members'][Control]
+                member['Sent'] = value
+                member['Pending'] = None
+                group['Dirty'].discard(Control)
+        Control.Host._Reported(Control.ID, Command, value)
+
+    @classmethod
+    def GetStatistics(cls) -> dict:
+        """ Returns streaming counters.
+
+        Returns
+            - dict with the following keys:
+                - 'Controls' (int) - streaming controls
+                - 'Sent' (int) - values sent
+                - 'Coalesced' (int) - values replaced by a newer value within a frame
+                - 'Suppressed' (int) - values within the deadband of the last sent value
+        """
+        with cls._Groups.Lock:
+            return {'Controls': cls._Groups.Members, 'Sent': cls._Sent, 'Coalesced': cls._Coalesced, 'Suppressed': cls._Suppressed}
+
+    @classmethod
+    def _Frame(cls, rate: float) -> None:
+        with cls._Groups.Lock:
+            group = cls._Groups.Get(rate)
+            if group is None:
+                return
+            hosts = {}
+            for control in group['Dirty']:
+                member = group['Members'][control]
+                value = member['Pending']
+                member['Pending'] = None
+                member['Sent'] = value
+                hosts.setdefault(control.Host, []).append((control.ID, member['Command'], value))
+                cls._Sent += 1
+            group['Dirty'].clear()
+        for host, updates in hosts.items():
+            host._Apply(updates)
@@ -0,0 +1,77 @@
+import glob
+import os
+import sys
+import time
+
+import pytest
+
+# extronlib modules import their siblings and the other subpackages by bare name, as they do on the processor.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, 'extronlib')] + sorted(glob.glob(os.path.join(ROOT, 'extronlib', '*', '')))
+
+from extronlib.device import UIDevice  # noqa: E402
+from extronlib.system import Scheduler  # noqa: E402
+from PanelEmulator import PanelEmulator  # noqa: E402
+
+
+@pytest.fixture
+def virtual():
+    """ Run the test on the virtual clock, starting at the epoch, with an empty scheduler. """
+    Scheduler.UseVirtualTime(0)
+    yield Scheduler
+    with Scheduler._Lock:
+        Scheduler._Heap.clear()
+        Scheduler._Cancelled = 0
+    Scheduler.UseWallTime()
+
+
+@pytest.fixture
+def timezone():
+    """ Switch the local time zone for the test; returns the function that does it. """
+    previous = os.environ.get('TZ')
+
+    def use(name):
+        os.environ['TZ'] = name
+        time.tzset()
+
+    yield use
+    if previous is None:
+        os.environ.pop('TZ', None)
+    else:
+        os.environ['TZ'] = previous
+    time.tzset()
+
+
+class Panel(list):
+    """ Stand-in for the panel behind a UIDevice, keeping each write (a list of commands). """
+
+    def Write(self, commands):
+        self.append(commands)
+
+
+@pytest.fixture
+def writes():
+    """ Writes received by the ui fixture. """
+    return Panel()
+
+
+@pytest.fixture
+def ui(writes):
+    """ UIDevice 'Panel', writing to the writes fixture. """
+    device = UIDevice('Panel')
+    device._Panel = writes
+    return device
+
+
+@pytest.fixture
+def emulator():
+    """ Panel emulator for the Device Alias 'TLP'. """
+    emulator = PanelEmulator.Create('TLP', {1: ['Audio', 'Video']})
+    yield emulator
+    emulator.Close()
+
+
+@pytest.fixture
+def tlp(emulator):
+    """ UIDevice 'TLP', writing to the emulator fixture. """
+    return UIDevice('TLP')
@@ -0,0 +1,51 @@
+from extronlib.ui_wrapper import Button
+
+
+def test_batch_is_one_write(ui, writes):
+    with ui.Batch():
+        ui.ShowPage('Main')
+        ui.ShowPopup('Audio')
+        with ui.Batch():
+            ui.ShowPopup('Lights')
+        assert writes == []
+    assert writes == [[('ShowPage', 'Main'), ('ShowPopup', 'Audio', 0), ('ShowPopup', 'Lights', 0)]]
+
+
+def test_calls_that_cancel_out_are_dropped(ui):
+    commands = [
+        ('ShowPage', 'Main'),
+        ('ShowPopup', 'Audio', 0),
+        ('HidePopupGroup', 1),
+        ('HidePopup', 'Audio'),
+        ('ShowPopup', 'Lights', 0),
+        ('ShowPage', 'Setup'),
+        ('HidePopupGroup', 1),
+        ('SetText', 3, 'Ready'),
+    ]
+    assert ui._Compact(commands) == [
+        ('HidePopup', 'Audio'),
+        ('ShowPopup', 'Lights', 0),
+        ('ShowPage', 'Setup'),
+        ('HidePopupGroup', 1),
+        ('SetText', 3, 'Ready'),
+    ]
+
+
+def test_hide_all_popups_drops_the_popup_calls_before_it(ui):
+    commands = [
+        ('ShowPopup', 'Audio', 0),
+        ('HidePopupGroup', 1),
+        ('HideAllPopups',),
+        ('ShowPopup', 'Video', 0),
+        ('HideAllPopups',),
+        ('ShowPopup', 'Lights', 0),
+    ]
+    assert ui._Compact(commands) == [('HideAllPopups',), ('ShowPopup', 'Lights', 0)]
+
+
+def test_control_updates_join_the_batch(ui, writes):
+    button = Button(ui, 1)
+    with ui.Batch():
+        ui.ShowPage('Main')
+        button.SetText('Power')
+    assert writes == [[('ShowPage', 'Main'), ('SetText', 1, 'Power')]]
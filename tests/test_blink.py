@@ -0,0 +1,54 @@
+import pytest
+
+from extronlib.ui_wrapper import Button
+from Blink import Blink
+
+
+def test_buttons_blink_in_unison(virtual, ui, writes):
+    first = Button(ui, 1)
+    second = Button(ui, 2)
+    first.SetBlinking('Medium', [0, 1])
+    virtual.Advance(0.75)
+    second.SetBlinking('Medium', [0, 1])
+    assert writes == [[('SetState', 1, 0)], [('SetState', 1, 1)], [('SetState', 2, 1)]]
+    del writes[:]
+    virtual.Advance(0.25)
+    # One update per tick covers every button of the UIDevice.
+    assert writes == [[('SetState', 1, 0), ('SetState', 2, 0)]]
+    assert Blink.GetStatistics() == {'Rates': 1, 'Buttons': 2}
+    first.SetState(0)
+    second.SetState(0)
+
+
+def test_one_scheduler_entry_per_rate(virtual, ui, writes):
+    buttons = [Button(ui, ID) for ID in range(20)]
+    for button in buttons[:10]:
+        button.SetBlinking('Fast', [0, 1])
+    for button in buttons[10:]:
+        button.CustomBlink(0.3, [1, 2, 3])
+    assert virtual.Pending() == 2
+    virtual.Advance(0.3)
+    assert writes[-1] == [('SetState', ID, 2) for ID in range(10, 20)]
+    for button in buttons:
+        button.SetState(0)
+    assert Blink.GetStatistics() == {'Rates': 0, 'Buttons': 0}
+    assert virtual.Pending() == 0
+
+
+def test_set_state_stops_the_blink(virtual, ui, writes):
+    button = Button(ui, 1)
+    button.SetBlinking('Slow', [0, 1])
+    button.SetState(3)
+    assert button.BlinkState == 'Not blinking'
+    virtual.Advance(5)
+    assert writes == [[('SetState', 1, 0)], [('SetState', 1, 3)]]
+
+
+def test_invalid_arguments(ui):
+    button = Button(ui, 1)
+    with pytest.raises(ValueError):
+        button.SetBlinking('Rapid', [0, 1])
+    with pytest.raises(ValueError):
+        button.CustomBlink(0, [0, 1])
+    with pytest.raises(ValueError):
+        button.CustomBlink(1, [])
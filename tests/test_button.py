@@ -0,0 +1,48 @@
+import pytest
+
+from extronlib import event
+from extronlib.device import UIDevice
+from extronlib.system import Scheduler
+from extronlib.ui_wrapper import Button
+
+
+def record(button):
+    log = []
+
+    @event(button, ['Pressed', 'Held', 'Repeated', 'Tapped', 'Released'])
+    def handler(button, state):
+        log.append((round(Scheduler.Now(), 3), state))
+
+    return log
+
+
+def test_tap_hold_and_repeat(virtual):
+    button = Button(UIDevice('Inject TLP'), 1, holdTime=1.0, repeatTime=0.25)
+    log = record(button)
+    Button.Inject([(0, button, 'Pressed'), (0.5, button, 'Released'), (1, button, 'Pressed'), (2.6, button, 'Released')])
+    assert log == [
+        (0, 'Pressed'), (0.5, 'Tapped'),
+        (1, 'Pressed'), (2, 'Held'), (2.25, 'Repeated'), (2.5, 'Repeated'), (2.6, 'Released'),
+    ]
+
+
+def test_plain_button_reports_released(virtual):
+    button = Button(UIDevice('Inject TLP'), 2)
+    log = record(button)
+    Button.Inject([(3, button, 'Pressed'), (3.1, button, 'Released')])
+    assert log == [(3, 'Pressed'), (3.1, 'Released')]
+    assert Scheduler.Pending() == 0
+
+
+def test_inject_rejects_bad_actions(virtual):
+    button = Button(UIDevice('Inject TLP'), 3)
+    with pytest.raises(ValueError):
+        Button.Inject([(1, button, 'Pressed'), (0.5, button, 'Released')])
+    with pytest.raises(ValueError):
+        Button.Inject([(2, button, 'Touched')])
+
+
+def test_inject_requires_virtual_clock():
+    button = Button(UIDevice('Inject TLP'), 4)
+    with pytest.raises(RuntimeError):
+        Button.Inject([(1, button, 'Pressed')])
@@ -0,0 +1,141 @@
+import socket
+import threading
+import time
+
+import pytest
+
+from extronlib.interface import EthernetClientInterface
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+@pytest.fixture
+def listener():
+    listener = socket.socket()
+    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    listener.bind(('127.0.0.1', 0))
+    listener.listen()
+    listener.settimeout(2)
+    yield listener
+    listener.close()
+
+
+@pytest.fixture
+def device():
+    """ UDP socket standing in for the device. """
+    device = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    device.bind(('127.0.0.1', 0))
+    device.settimeout(2)
+    yield device
+    device.close()
+
+
+@pytest.fixture
+def tcp(listener):
+    """ TCP interface connected to listener; the test gets (interface, peer socket). """
+    interface = EthernetClientInterface('127.0.0.1', listener.getsockname()[1])
+    assert interface.Connect(2) == 'Connected'
+    peer, _ = listener.accept()
+    peer.settimeout(2)
+    yield interface, peer
+    interface.Disconnect()
+    peer.close()
+
+
+def test_tcp_send_and_receive(tcp):
+    interface, peer = tcp
+    received = []
+    interface.ReceiveData = lambda interface, data: received.append(data)
+    interface.Send('Vol?\r')
+    assert peer.recv(64) == b'Vol?\r'
+    peer.sendall(b'Vol10\r\n')
+    assert wait_for(lambda: b''.join(received) == b'Vol10\r\n')
+
+
+def test_send_and_wait(tcp):
+    interface, peer = tcp
+    unsolicited = []
+    interface.ReceiveData = lambda interface, data: unsolicited.append(data)
+
+    def respond():
+        peer.recv(64)
+        peer.sendall(b'Vol10\r\nMut1\r\n')
+
+    threading.Thread(target=respond).start()
+    assert interface.SendAndWait(b'Vol?\r', 2, b'\r\n') == b'Vol10\r\n'
+    assert wait_for(lambda: unsolicited == [b'Mut1\r\n'])
+
+
+def test_peer_close_disconnects(tcp):
+    interface, peer = tcp
+    events = []
+    interface.Disconnected = lambda interface, state: events.append(state)
+    peer.close()
+    assert wait_for(lambda: events == ['Disconnected'])
+    with pytest.raises(IOError):
+        interface.Send(b'Vol?\r')
+    assert interface.Connect(2) == 'Connected'
+
+
+def test_connect_failure_is_reported(listener):
+    port = listener.getsockname()[1]
+    listener.close()
+    interface = EthernetClientInterface('127.0.0.1', port)
+    assert interface.Connect(2) not in ('Connected', 'ConnectedAlready')
+    with pytest.raises(IOError):
+        interface.Send(b'Vol?\r')
+
+
+def test_udp_send_and_receive(device):
+    interface = EthernetClientInterface('127.0.0.1', device.getsockname()[1], Protocol='UDP')
+    received = []
+    interface.ReceiveData = lambda interface, data: received.append(data)
+    assert interface.Connect() == 'ConnectedAlready'
+    interface.Send(b'Vol?\r')
+    data, address = device.recvfrom(64)
+    assert data == b'Vol?\r' and address[1] == interface.ServicePort
+    device.sendto(b'Vol10\r\n', address)
+    assert wait_for(lambda: received == [b'Vol10\r\n'])
+
+
+def test_raising_handler_does_not_strand_data(tcp):
+    interface, peer = tcp
+    received = []
+
+    def handler(interface, data):
+        received.append(data)
+        if len(received) == 1:
+            raise RuntimeError('handler failure')
+
+    interface.ReceiveData = handler
+    peer.sendall(b'x' * 5000)
+    assert wait_for(lambda: sum(map(len, received)) == 5000)
+
+
+def test_udp_datagrams_read_together_arrive_as_one_batch(device):
+    interface = EthernetClientInterface('127.0.0.1', device.getsockname()[1], Protocol='UDP')
+    batches = []
+    single = []
+    interface.ReceiveDataBatch = lambda interface, batch: batches.append(batch)
+    interface.ReceiveData = lambda interface, data: single.append(data)
+    address = ('127.0.0.1', interface.ServicePort)
+    for index in range(10):
+        device.sendto(b'Level %d' % index, address)
+    assert wait_for(lambda: sum(map(len, batches)) == 10)
+    assert [data for batch in batches for data in batch] == [b'Level %d' % index for index in range(10)]
+    assert single == []
+
+
+def test_udp_send_batch(device):
+    interface = EthernetClientInterface('127.0.0.1', device.getsockname()[1], Protocol='UDP')
+    interface.SendBatch([b'Vol?\r', 'Mut?\r', b'In?\r'])
+    assert [device.recv(64) for _ in range(3)] == [b'Vol?\r', b'Mut?\r', b'In?\r']
+    with pytest.raises(TypeError):
+        interface.SendBatch([b'Vol?\r', 5])
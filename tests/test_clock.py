@@ -0,0 +1,64 @@
+from datetime import datetime
+
+from extronlib.system import Clock, Scheduler
+
+
+def collect(times, days=None):
+    fired = []
+    clock = Clock(times, days, lambda clock, alarm: fired.append(alarm))
+    clock.Enable()
+    return clock, fired
+
+
+def test_alarms_fire_in_time_order(virtual, timezone):
+    timezone('UTC')
+    Scheduler.UseVirtualTime(datetime(2026, 1, 5).timestamp())  # a Monday
+    clock, fired = collect(['18:00:00', '06:30:00'], ['Monday', 'Wednesday'])
+    Scheduler.Advance(7 * 86400)
+    assert fired == [datetime(2026, 1, 5, 6, 30), datetime(2026, 1, 5, 18), datetime(2026, 1, 7, 6, 30), datetime(2026, 1, 7, 18)]
+    clock.Disable()
+    Scheduler.Advance(7 * 86400)
+    assert len(fired) == 4
+
+
+def test_spring_forward_skips_the_missing_hour(virtual, timezone):
+    timezone('America/New_York')
+    Scheduler.UseVirtualTime(datetime(2026, 3, 8).timestamp())
+    clock, fired = collect(['01:30:00', '02:30:00', '03:30:00'])
+    Scheduler.Advance(86400)
+    assert [alarm.strftime('%H:%M') for alarm in fired] == ['01:30', '03:30']
+
+
+def test_fall_back_repeats_the_hour(virtual, timezone):
+    timezone('America/New_York')
+    Scheduler.UseVirtualTime(datetime(2026, 11, 1).timestamp())
+    clock, fired = collect(['01:30:00', '07:00:00'])
+    Scheduler.Advance(86400)
+    assert [(alarm.strftime('%H:%M'), alarm.fold) for alarm in fired] == [('01:30', 0), ('01:30', 1), ('07:00', 0)]
+
+
+def test_system_time_set_back(virtual, timezone, monkeypatch):
+    timezone('UTC')
+    offset = [0]
+    monkeypatch.setattr(Scheduler, 'Time', classmethod(lambda cls: cls._VirtualNow + offset[0]))
+    clock, fired = collect(['12:00:00'])
+    Scheduler.Advance(6 * 3600)
+    offset[0] = -3 * 3600
+    Scheduler.Advance(6 * 3600)
+    assert fired == []
+    Scheduler.Advance(3 * 3600)
+    assert fired == [datetime(1970, 1, 1, 12)]
+    assert Scheduler.Now() == 15 * 3600
+
+
+def test_system_time_set_forward(virtual, timezone, monkeypatch):
+    timezone('UTC')
+    offset = [0]
+    monkeypatch.setattr(Scheduler, 'Time', classmethod(lambda cls: cls._VirtualNow + offset[0]))
+    fired = []
+    clock = Clock(['12:00:00'], None, lambda clock, alarm: fired.append((Scheduler.Now(), alarm)))
+    clock.Enable()
+    Scheduler.Advance(6 * 3600)
+    offset[0] = 4 * 3600
+    Scheduler.Advance(6 * 3600)
+    assert fired == [(8 * 3600, datetime(1970, 1, 1, 12))]
@@ -0,0 +1,41 @@
+import pytest
+
+from extronlib import event
+from extronlib.ui_wrapper import Button, Knob, Label, Level, Slider
+
+
+def test_controls_are_indexed_by_id_and_name(ui):
+    power = Button(ui, 'Power')
+    sources = [Button(ui, ID) for ID in range(101, 105)]
+    level = Level(ui, 7)
+    assert ui.GetControl('Power') is power
+    assert ui.GetControl(7) is level
+    assert ui.GetControl(999) is None
+    assert ui.GetControls(range(101, 105)) == sources
+    assert ui.GetControls() == [power] + sources + [level]
+
+
+def test_get_controls_raises_for_an_unknown_id(ui):
+    Button(ui, 1)
+    with pytest.raises(KeyError):
+        ui.GetControls([1, 2])
+
+
+def test_controls_have_no_instance_dict(ui):
+    for control in (Button(ui, 1), Label(ui, 2), Level(ui, 3), Knob(ui, 4), Slider(ui, 5)):
+        assert not hasattr(control, '__dict__')
+        with pytest.raises(AttributeError):
+            control.Undefined = 1
+
+
+def test_event_slots_take_handlers(ui):
+    button = Button(ui, 1)
+    fired = []
+
+    @event(button, 'Pressed')
+    def pressed(button, state):
+        fired.append(state)
+
+    assert button.Pressed is pressed
+    ui._Input(1, 'Pressed')
+    assert fired == ['Pressed']
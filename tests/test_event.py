@@ -0,0 +1,61 @@
+import pytest
+
+from extronlib import event
+from extronlib.device import UIDevice
+from extronlib.interface import EthernetClientInterface
+from extronlib.system import EventDispatcher
+from extronlib.ui_wrapper import Button
+
+
+def handler(obj, value):
+    pass
+
+
+def test_handler_lives_in_the_event_attribute():
+    interface = EthernetClientInterface('127.0.0.1', 1)
+    fired = []
+
+    @event(interface, 'ReceiveData')
+    def first(interface, data):
+        fired.append(('first', data))
+
+    assert interface.ReceiveData is first
+    EventDispatcher.Emit(interface, 'ReceiveData', b'a')
+    interface.ReceiveData = lambda interface, data: fired.append(('second', data))
+    EventDispatcher.Emit(interface, 'ReceiveData', b'b')
+    EventDispatcher.Unregister(interface, 'ReceiveData')
+    EventDispatcher.Emit(interface, 'ReceiveData', b'c')
+    assert fired == [('first', b'a'), ('second', b'b')]
+
+
+def test_lists_of_objects_and_events():
+    buttons = [Button(UIDevice('Panel'), ID) for ID in (1, 2)]
+    event(buttons, ['Pressed', 'Released'])(handler)
+    assert all(button.Pressed is handler and button.Released is handler for button in buttons)
+
+
+@pytest.mark.parametrize('name', ['Send', 'IPPort', 'Hostname', 'NoSuchEvent'])
+def test_attributes_that_are_not_events_are_rejected(name):
+    interface = EthernetClientInterface('127.0.0.1', 1)
+    before = getattr(interface, name, None)
+    with pytest.raises(AttributeError):
+        event(interface, name)(handler)
+    with pytest.raises(AttributeError):
+        EventDispatcher.Unregister(interface, name)
+    assert getattr(interface, name, None) == before
+
+
+def test_slots_that_are_not_events_are_rejected():
+    button = Button(UIDevice('Panel'), 1)
+    event(button, 'Pressed')(handler)
+    for name in ('ID', 'Host', 'SetState'):
+        with pytest.raises(AttributeError):
+            event(button, name)(handler)
+    assert button.ID == 1
+
+
+def test_handler_signature_is_checked_when_registered():
+    button = Button(UIDevice('Panel'), 1)
+    with pytest.raises(TypeError):
+        event(button, 'Pressed')(lambda button: None)
+    assert button.Pressed is None
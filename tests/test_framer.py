@@ -0,0 +1,39 @@
+import pytest
+
+from Framer import DelimiterFramer, FixedLengthFramer, Framer, LengthFramer
+
+
+def test_delimiter_frames_across_fragments():
+    framer = DelimiterFramer(b'\r\n')
+    assert framer.Feed(b'Vol 1') == []
+    assert framer.Feed(b'0\r') == []
+    assert framer.Feed(b'\nMut1\r\nIn') == [b'Vol 10\r\n', b'Mut1\r\n']
+    assert framer.Feed(b'2\r\n') == [b'In2\r\n']
+
+
+def test_fixed_length():
+    framer = FixedLengthFramer(3)
+    assert framer.Feed(b'abcdefg') == [b'abc', b'def']
+    assert framer.Feed(b'hi') == [b'ghi']
+
+
+def test_length_header_exclusive():
+    framer = LengthFramer(Size=2)
+    assert framer.Feed(b'\x00\x03AB') == []
+    assert framer.Feed(b'C\x00\x00\x00\x01D') == [b'\x00\x03ABC', b'\x00\x00', b'\x00\x01D']
+
+
+def test_length_header_inclusive_with_offset():
+    framer = LengthFramer(Size=1, Offset=1, Inclusive=True)
+    assert framer.Feed(b'\x7e\x04AB\x7e\x02') == [b'\x7e\x04AB', b'\x7e\x02']
+
+
+def test_inclusive_length_shorter_than_header_is_corrupt():
+    framer = LengthFramer(Size=2, Inclusive=True)
+    assert framer.Feed(b'\x00\x01ABCD') == []
+    assert framer.Feed(b'\x00\x04AB') == [b'\x00\x04AB']
+
+
+def test_base_class_is_abstract():
+    with pytest.raises(TypeError):
+        Framer()
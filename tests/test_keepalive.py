@@ -0,0 +1,68 @@
+from KeepAlive import KeepAlive
+
+
+class Interface():
+    """ Stand-in for an interface, counting its sends as the real ones do. """
+
+    def __init__(self, fail=False):
+        self.sent = []
+        self.fail = fail
+        self._SendCount = 0
+
+    def Send(self, data, Lane=None, Coalesce=False):
+        if self.fail:
+            raise IOError('not connected')
+        self.sent.append(data)
+        self._SendCount += 1
+
+
+def test_one_scheduler_entry_per_interval(virtual):
+    interfaces = [Interface() for _ in range(10)]
+    for interface in interfaces:
+        KeepAlive.Start(interface, 5, b'q')
+    other = Interface()
+    KeepAlive.Start(other, 7, b'?')
+    assert virtual.Pending() == 2
+    virtual.Advance(14)
+    assert all(interface.sent == [b'q', b'q'] for interface in interfaces)
+    assert other.sent == [b'?', b'?']
+    for interface in interfaces + [other]:
+        KeepAlive.Stop(interface)
+    assert virtual.Pending() == 0
+
+
+def test_traffic_suppresses_the_keep_alive(virtual):
+    interface = Interface()
+    KeepAlive.Start(interface, 5, b'q')
+    suppressed = KeepAlive.GetStatistics()['Suppressed']
+    virtual.Advance(4)
+    interface.Send(b'Vol10')
+    virtual.Advance(1)
+    assert interface.sent == [b'Vol10']
+    virtual.Advance(5)
+    assert interface.sent == [b'Vol10', b'q']
+    assert KeepAlive.GetStatistics()['Suppressed'] == suppressed + 1
+    KeepAlive.Stop(interface)
+
+
+def test_failed_send_is_retried_and_not_counted(virtual):
+    interface = Interface(fail=True)
+    KeepAlive.Start(interface, 5, b'q')
+    sent = KeepAlive.GetStatistics()['Sent']
+    virtual.Advance(5)
+    assert KeepAlive.GetStatistics()['Sent'] == sent
+    interface.fail = False
+    virtual.Advance(5)
+    assert interface.sent == [b'q']
+    assert KeepAlive.GetStatistics()['Sent'] == sent + 1
+    KeepAlive.Stop(interface)
+
+
+def test_restart_moves_the_interface_to_the_new_interval(virtual):
+    interface = Interface()
+    KeepAlive.Start(interface, 5, b'q')
+    KeepAlive.Start(interface, 2, b'p')
+    assert KeepAlive.GetStatistics()['Groups'] == 1
+    virtual.Advance(5)
+    assert interface.sent == [b'p', b'p']
+    KeepAlive.Stop(interface)
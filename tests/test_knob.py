@@ -0,0 +1,54 @@
+import pytest
+
+from extronlib.ui_wrapper import Knob
+
+
+def turned(knob):
+    """ Returns the list collecting the steps of each Turned event of knob. """
+    log = []
+    knob.Turned = lambda knob, steps: log.append(steps)
+    return log
+
+
+def test_every_report_triggers_turned_by_default(ui):
+    knob = Knob(ui, 9)
+    log = turned(knob)
+    for steps in (1, 1, -2):
+        ui._Input(9, 'Turned', steps)
+    assert log == [1, 1, -2]
+
+
+def test_steps_within_the_window_are_summed(virtual, ui):
+    knob = Knob(ui, 9)
+    knob.SetAggregation(0.5)
+    log = turned(knob)
+    for steps in (1, 2, 1):
+        ui._Input(9, 'Turned', steps)
+        virtual.Advance(0.125)
+    assert log == []
+    virtual.Advance(0.125)
+    assert log == [4]
+    ui._Input(9, 'Turned', 2)
+    ui._Input(9, 'Turned', -2)
+    virtual.Advance(0.5)
+    assert log == [4]
+
+
+def test_acceleration_scales_fast_turns(virtual, ui):
+    knob = Knob(ui, 9)
+    knob.SetAggregation(0.1, acceleration=2)
+    log = turned(knob)
+    ui._Input(9, 'Turned', 1)
+    virtual.Advance(0.1)
+    for _ in range(3):
+        ui._Input(9, 'Turned', -1)
+    virtual.Advance(0.1)
+    assert log == [1, -9]
+
+
+def test_invalid_aggregation(ui):
+    knob = Knob(ui, 9)
+    with pytest.raises(ValueError):
+        knob.SetAggregation(-1)
+    with pytest.raises(ValueError):
+        knob.SetAggregation(0.1, acceleration=0)
@@ -0,0 +1,50 @@
+from extronlib.ui_wrapper import Button, Knob, Slider
+
+
+def test_updates_are_recorded(tlp, emulator):
+    button = Button(tlp, 1)
+    button.SetState(2)
+    button.SetText('Power')
+    tlp.ShowPage('Main')
+    assert emulator.GetControl(1) == {'State': 2, 'Text': 'Power'}
+    assert emulator.Page == 'Main'
+
+
+def test_input_reaches_the_controls_and_the_emulator_state(tlp, emulator):
+    log = []
+    button = Button(tlp, 1)
+    button.Pressed = button.Released = lambda button, state: log.append(state)
+    slider = Slider(tlp, 5)
+    slider.Changed = lambda slider, value: log.append(value)
+    knob = Knob(tlp, 9)
+    emulator.Press(1)
+    emulator.Release(1)
+    emulator.Slide(5, 50)
+    emulator.Turn(9, 3)
+    emulator.Turn(9, -1)
+    assert log == ['Pressed', 'Released', 50]
+    assert emulator.GetControl(5)['Fill'] == 50
+    assert emulator.GetControl(9)['Turned'] == 2
+    assert emulator.GetStatistics()['Inputs'] == 5
+
+
+def test_popup_groups_and_durations(virtual, tlp, emulator):
+    tlp.ShowPopup('Audio')
+    tlp.ShowPopup('Video', 5)
+    tlp.ShowPopup('Lights')
+    tlp.HidePopupGroup(1)
+    assert emulator.Popups == ['Lights']
+    tlp.ShowPopup('Video', 5)
+    virtual.Advance(5)
+    assert emulator.Popups == ['Lights']
+
+
+def test_expiry_of_a_replaced_showing_leaves_the_popup(virtual, tlp, emulator):
+    tlp.ShowPopup('Video', 5)
+    virtual.Advance(4)
+    tlp.ShowPopup('Video', 10)
+    # The first showing's entry was already running when the popup was shown again.
+    emulator._Expire('Video', 5)
+    assert emulator.Popups == ['Video']
+    virtual.Advance(10)
+    assert emulator.Popups == []
@@ -0,0 +1,60 @@
+import os
+import threading
+import time
+import tty
+
+import pytest
+
+from extronlib.interface import SerialInterface
+from PtyPort import PtyPort
+
+
+@pytest.fixture
+def device():
+    """ Pseudo-terminal on 'COM1' with an emulator answering each b'\\r' terminated line with b'ACK <line>\\r\\n'. """
+    port = PtyPort.Create('COM1')
+    fd = os.open(port.DevicePath, os.O_RDWR | os.O_NOCTTY)
+    tty.setraw(fd)
+    received = bytearray()
+
+    def emulate():
+        line = b''
+        while True:
+            try:
+                data = os.read(fd, 4096)
+            except OSError:
+                return
+            received.extend(data)
+            line += data
+            while b'\r' in line:
+                command, line = line.split(b'\r', 1)
+                os.write(fd, b'ACK ' + command + b'\r\n')
+
+    threading.Thread(target=emulate, daemon=True).start()
+    port.received = received
+    yield port
+    port.Close()
+    os.close(fd)
+
+
+def read(received, size, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while len(received) < size and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return len(received)
+
+
+def test_pacing_follows_the_line_rate(device):
+    interface = SerialInterface(None, 'COM1', Baud=9600)
+    start = time.monotonic()
+    interface.Send(b'x' * 480)
+    assert read(device.received, 480) == 480
+    # 480 characters of 10 bits at 9600 baud take 0.5 s.
+    assert time.monotonic() - start >= 0.4
+
+
+def test_virtual_clock_does_not_hold_back_data(virtual, device):
+    interface = SerialInterface(None, 'COM1', Baud=9600)
+    command = b'x' * 99 + b'\r'
+    assert interface.SendAndWait(command, 2, b'\r\n') == b'ACK ' + command[:-1] + b'\r\n'
+    assert len(device.received) == 100
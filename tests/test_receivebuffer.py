@@ -0,0 +1,61 @@
+import re
+import threading
+
+from ReceiveBuffer import ReceiveBuffer
+
+
+def respond(buffer, *chunks):
+    """ Returns a Send function feeding chunks to buffer, as the I/O thread would, and the list of unclaimed data. """
+    unclaimed = []
+
+    def send(data):
+        for chunk in chunks:
+            unclaimed.append(buffer.Feed(chunk))
+
+    return send, unclaimed
+
+
+def test_tag_split_across_chunks():
+    buffer = ReceiveBuffer()
+    send, unclaimed = respond(buffer, b'Vol1', b'0\r', b'\nMut1\r\n')
+    assert buffer.SendAndWait(send, b'V\r', 1, b'\r\n') == b'Vol10\r\n'
+    assert unclaimed == [b'', b'', b'Mut1\r\n']
+
+
+def test_length():
+    buffer = ReceiveBuffer()
+    send, unclaimed = respond(buffer, b'ab', b'cdef')
+    assert buffer.SendAndWait(send, b'?', 1, 4) == b'abcd'
+    assert unclaimed == [b'', b'ef']
+
+
+def test_regular_expression():
+    buffer = ReceiveBuffer()
+    send, _ = respond(buffer, b'Err', b'or E13\r\n')
+    assert buffer.SendAndWait(send, b'?', 1, re.compile(rb'E\d+\r\n')) == b'Error E13\r\n'
+
+
+def test_timeout_returns_nothing_and_releases_the_data():
+    buffer = ReceiveBuffer()
+    send, _ = respond(buffer, b'partial')
+    assert buffer.SendAndWait(send, b'?', 0.05, b'\r\n') == b''
+    assert buffer.Feed(b'late\r\n') == b'late\r\n'
+
+
+def test_without_delimiter_collects_until_timeout():
+    buffer = ReceiveBuffer()
+    send, _ = respond(buffer, b'one', b'two')
+    assert buffer.SendAndWait(send, b'?', 0.05) == b'onetwo'
+
+
+def test_data_without_pending_response_is_unclaimed():
+    assert ReceiveBuffer().Feed(b'Vol10\r\n') == b'Vol10\r\n'
+
+
+def test_response_from_another_thread():
+    buffer = ReceiveBuffer()
+
+    def send(data):
+        threading.Timer(0.02, buffer.Feed, (b'OK\r\n',)).start()
+
+    assert buffer.SendAndWait(send, b'?', 2, b'\r\n') == b'OK\r\n'
@@ -0,0 +1,92 @@
+import socket
+import time
+
+import pytest
+
+from extronlib.interface import EthernetClientInterface
+from Reconnect import Reconnect
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+@pytest.fixture
+def listener():
+    listener = socket.socket()
+    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    listener.bind(('127.0.0.1', 0))
+    listener.listen()
+    yield listener
+    listener.close()
+
+
+def accept_all(listener, wait=0.2):
+    peers = []
+    listener.settimeout(wait)
+    try:
+        while True:
+            peers.append(listener.accept()[0])
+    except socket.timeout:
+        pass
+    return peers
+
+
+def closed(peer):
+    peer.settimeout(2)
+    try:
+        return peer.recv(16) == b''
+    except ConnectionResetError:
+        return True
+
+
+def test_backoff_doubles_until_the_device_answers(virtual, monkeypatch):
+    # Bound but not listening: connections are refused until listen() is called.
+    device = socket.socket()
+    device.bind(('127.0.0.1', 0))
+    monkeypatch.setattr('random.uniform', lambda low, high: high)
+    interface = EthernetClientInterface('127.0.0.1', device.getsockname()[1])
+    interface.StartReconnect(MinDelay=1, MaxDelay=4, timeout=2)
+    delays = []
+    for failures in range(1, 5):
+        assert wait_for(lambda: Reconnect.GetStatus(interface)['Failures'] == failures)
+        delays.append(Reconnect.GetStatus(interface)['NextAttempt'] - virtual.Now())
+        virtual.Advance(delays[-1])
+    assert delays == [2, 4, 4, 4]
+    device.listen()
+    assert wait_for(lambda: Reconnect.GetStatus(interface)['State'] == 'Connected')
+    peer, _ = device.accept()
+    # A drop is retried within MinDelay.
+    peer.close()
+    assert wait_for(lambda: Reconnect.GetStatus(interface)['State'] == 'Waiting')
+    assert Reconnect.GetStatus(interface)['NextAttempt'] == virtual.Now() + 1
+    interface.Disconnect()
+    assert Reconnect.GetStatus(interface) is None
+    device.close()
+
+
+def test_connect_racing_the_supervisor_opens_one_connection(listener):
+    for _ in range(5):
+        interface = EthernetClientInterface('127.0.0.1', listener.getsockname()[1])
+        received = []
+        interface.ReceiveData = lambda interface, data: received.append(data)
+        interface.StartReconnect(MinDelay=0.01, timeout=2)
+        assert interface.Connect(2) in ('Connected', 'ConnectedAlready')
+        peers = accept_all(listener)
+        for peer in peers:
+            try:
+                peer.sendall(b'ping')
+            except OSError:
+                pass
+        assert wait_for(lambda: received)
+        time.sleep(0.1)
+        assert received == [b'ping']
+        interface.Disconnect()
+        assert all(closed(peer) for peer in peers)
+        for peer in peers:
+            peer.close()
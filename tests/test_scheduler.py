@@ -0,0 +1,54 @@
+import threading
+import time
+
+import pytest
+
+from extronlib.system import Scheduler, Wait
+
+
+def test_entries_run_in_deadline_order(virtual):
+    order = []
+    for deadline in (3, 1, 2, 1):
+        Scheduler.Schedule(deadline, order.append, deadline)
+    assert Scheduler.Advance(5) == 4
+    assert order == [1, 1, 2, 3]
+
+
+def test_advance_runs_entries_scheduled_by_entries(virtual):
+    order = []
+
+    def chain(n):
+        order.append((n, Scheduler.Now()))
+        if n < 3:
+            Scheduler.Schedule(Scheduler.Now() + 1, chain, n + 1)
+
+    Scheduler.Schedule(1, chain, 1)
+    Scheduler.Advance(10)
+    assert order == [(1, 1), (2, 2), (3, 3)]
+    assert Scheduler.Now() == 10
+
+
+def test_cancelled_entries_do_not_run_and_are_reclaimed(virtual):
+    fired = []
+    entries = [Scheduler.Schedule(i, fired.append, i) for i in range(1, 201)]
+    for entry in entries[:150]:
+        Scheduler.Cancel(entry)
+    assert Scheduler.Pending() == 50
+    assert len(Scheduler._Heap) < 200
+    Scheduler.Advance(500)
+    assert fired == list(range(151, 201))
+
+
+def test_advance_requires_virtual_clock():
+    assert Scheduler.Mode == 'Wall'
+    with pytest.raises(RuntimeError):
+        Scheduler.Advance(1)
+
+
+def test_wall_deadlines_ignore_system_time_steps(monkeypatch):
+    # Setting the system time back an hour must not stall a pending Wait.
+    wall = time.time
+    monkeypatch.setattr(time, 'time', lambda: wall() - 3600)
+    fired = threading.Event()
+    Wait(0.1, fired.set)
+    assert fired.wait(2)
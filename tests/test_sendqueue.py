@@ -0,0 +1,89 @@
+from extronlib.interface import SerialInterface
+from Framer import DelimiterFramer
+from PtyPort import PtyPort
+from SendQueue import SendQueue
+
+
+def test_min_gap_spaces_commands(virtual):
+    written = []
+    queue = SendQueue(lambda data: written.append((virtual.Now(), data)), MinGap=0.1)
+    for command in (b'a', b'b', b'c'):
+        queue.Put(command)
+    virtual.Advance(1)
+    assert written == [(0, b'a'), (0.1, b'b'), (0.2, b'c')]
+
+
+def test_lanes_and_coalescing(virtual):
+    written = []
+    queue = SendQueue(written.append, MinGap=0.1)
+    queue.Put(b'first')
+    queue.Put(b'poll', Lane='Low', Coalesce=True)
+    assert not queue.Put(b'poll', Lane='Low', Coalesce=True)
+    queue.Put(b'urgent', Lane='High')
+    virtual.Advance(1)
+    assert written == [b'first', b'urgent', b'poll']
+    assert queue.GetStatistics()['Coalesced'] == 1
+
+
+def test_max_in_flight_waits_for_complete_or_timeout(virtual):
+    written = []
+    queue = SendQueue(written.append, MaxInFlight=1, Timeout=0.5)
+    for command in (b'a', b'b', b'c'):
+        queue.Put(command)
+    assert written == [b'a']
+    queue.Complete()
+    assert written == [b'a', b'b']
+    virtual.Advance(0.4)
+    assert written == [b'a', b'b']
+    virtual.Advance(0.1)
+    assert written == [b'a', b'b', b'c']
+
+
+def test_complete_counts_responses(virtual):
+    written = []
+    queue = SendQueue(written.append, MaxInFlight=2)
+    for command in (b'a', b'b', b'c', b'd', b'e'):
+        queue.Put(command)
+    queue.Complete(2)
+    assert written == [b'a', b'b', b'c', b'd']
+    assert queue.GetStatistics()['InFlight'] == 2
+
+
+def test_failed_write_does_not_stall_the_queue(virtual, capsys):
+    written = []
+
+    def write(data):
+        if data == b'bad':
+            raise IOError('not connected')
+        written.append(data)
+
+    queue = SendQueue(write, MinGap=0.1, MaxInFlight=1)
+    for command in (b'bad', b'a', b'b'):
+        queue.Put(command)
+    virtual.Advance(0.1)
+    queue.Complete()
+    virtual.Advance(1)
+    assert written == [b'a', b'b']
+    statistics = queue.GetStatistics()
+    assert statistics['Failed'] == 1 and statistics['Sent'] == 2
+    assert 'not connected' in capsys.readouterr().err
+
+
+def test_framed_port_completes_once_per_frame(virtual):
+    port = PtyPort.Create('COM9')
+    written = []
+    interface = SerialInterface(None, 'COM9')
+    interface._Write = written.append
+    interface.SetFramer(DelimiterFramer(b'\r\n'))
+    queue = interface.EnableSendQueue(MaxInFlight=1)
+    for command in (b'a\r', b'b\r', b'c\r'):
+        interface.Send(command)
+    assert written == [b'a\r']
+    interface._Receive(b'ACK ')
+    assert written == [b'a\r']
+    interface._Receive(b'a\r\nACK')
+    assert written == [b'a\r', b'b\r']
+    interface._Receive(b' b\r\n')
+    assert written == [b'a\r', b'b\r', b'c\r']
+    assert queue.GetStatistics()['InFlight'] == 1
+    port.Close()
@@ -0,0 +1,89 @@
+import socket
+import time
+
+import pytest
+
+from extronlib.interface import EthernetServerInterfaceEx
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+@pytest.fixture
+def server():
+    server = EthernetServerInterfaceEx(free_port())
+    server.ClientBufferSize = 65536
+    assert server.StartListen() == 'Listening'
+    peers = []
+
+    def connect():
+        peer = socket.create_connection(('127.0.0.1', server.IPPort))
+        peer.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+        peers.append(peer)
+        count = len(peers)
+        assert wait_for(lambda: len(server.Clients) == count)
+        return peer
+
+    server.connect = connect
+    yield server
+    server.StopListen()
+    for peer in peers:
+        peer.close()
+
+
+def test_oversized_send_is_refused(server):
+    server.connect()
+    client = server.Clients[0]
+    with pytest.raises(IOError):
+        client.Send(b'x' * (20 * 1024 * 1024))
+    assert client._Stream.Pending == 0
+
+
+def test_send_never_buffers_past_the_limit(server):
+    server.connect()
+    client = server.Clients[0]
+    with pytest.raises(IOError):
+        for _ in range(10000):
+            client.Send(b'x' * 4000)
+    assert client._Stream.Pending <= server.ClientBufferSize
+
+
+def test_broadcast_drops_oversized_data_for_idle_clients(server):
+    peers = [server.connect(), server.connect()]
+    dropped = server.Broadcast(b'x' * (server.ClientBufferSize + 1))
+    assert sorted(dropped, key=id) == sorted(server.Clients, key=id)
+    assert [client.Dropped for client in server.Clients] == [1, 1]
+    assert all(client._Stream.Pending == 0 for client in server.Clients)
+
+    assert server.Broadcast(b'Room=Occupied\r\n') == []
+    for peer in peers:
+        peer.settimeout(2)
+        assert peer.recv(64) == b'Room=Occupied\r\n'
+
+
+def test_raising_connected_handler_does_not_strand_accepts(server):
+    connected = []
+
+    def handler(client, state):
+        connected.append(client)
+        raise RuntimeError('handler failure')
+
+    server.Connected = handler
+    peers = [socket.create_connection(('127.0.0.1', server.IPPort)) for _ in range(3)]
+    try:
+        assert wait_for(lambda: len(connected) == 3)
+    finally:
+        for peer in peers:
+            peer.close()
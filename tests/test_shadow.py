@@ -0,0 +1,37 @@
+from extronlib.ui_wrapper import Button, Label
+
+
+def test_unchanged_updates_are_not_sent(ui, writes):
+    button = Button(ui, 1)
+    button.SetState(1)
+    button.SetState(1)
+    button.SetText('Power')
+    button.SetState(0)
+    assert writes == [[('SetState', 1, 1)], [('SetText', 1, 'Power')], [('SetState', 1, 0)]]
+    assert ui.GetStatistics() == {'Sent': 3, 'Suppressed': 1, 'Pending': 0}
+
+
+def test_flush_interval_sends_the_latest_value_once(virtual, ui, writes):
+    ui.FlushInterval = 0.1
+    button = Button(ui, 1)
+    label = Label(ui, 2)
+    for state in range(10):
+        button.SetState(state)
+    label.SetText('Ready')
+    assert writes == []
+    assert ui.GetStatistics()['Pending'] == 2
+    virtual.Advance(0.1)
+    assert writes == [[('SetState', 1, 9), ('SetText', 2, 'Ready')]]
+    assert ui.GetStatistics()['Suppressed'] == 9
+
+
+def test_change_reverted_within_the_interval_is_not_sent(virtual, ui, writes):
+    ui.FlushInterval = 0.1
+    button = Button(ui, 1)
+    button.SetState(1)
+    virtual.Advance(0.1)
+    button.SetState(2)
+    button.SetState(1)
+    virtual.Advance(0.1)
+    assert writes == [[('SetState', 1, 1)]]
+    assert ui.GetStatistics()['Pending'] == 0
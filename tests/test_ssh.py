@@ -0,0 +1,197 @@
+import socket
+import threading
+import time
+
+import pytest
+
+from extronlib import event
+from extronlib.interface import EthernetClientInterface
+from IOLoop import IOLoop
+from SSHSession import SSHSession, _SSHChannel
+
+
+@pytest.fixture(scope='module')
+def host():
+    """ Local SSH server. Channels echo in upper case unless the command 'hold' stops them reading. """
+    paramiko = pytest.importorskip('paramiko')
+
+    class Server(paramiko.ServerInterface):
+
+        def check_auth_password(self, username, password):
+            return paramiko.AUTH_SUCCESSFUL if password == 'secret' else paramiko.AUTH_FAILED
+
+        def get_allowed_auths(self, username):
+            return 'password'
+
+        def check_channel_request(self, kind, chanid):
+            return paramiko.OPEN_SUCCEEDED
+
+        def check_channel_pty_request(self, *args):
+            return True
+
+        def check_channel_shell_request(self, channel):
+            return True
+
+    key = paramiko.RSAKey.generate(1024)
+    listener = socket.socket()
+    listener.bind(('127.0.0.1', 0))
+    listener.listen()
+    state = {'Handshakes': 0, 'Release': threading.Event(), 'Received': 0}
+
+    def echo(channel):
+        while True:
+            data = channel.recv(65536)
+            if not data:
+                return
+            if data.startswith(b'hold'):
+                state['Release'].wait(10)
+                continue
+            state['Received'] += len(data)
+            channel.send(data.upper())
+
+    def serve(conn):
+        transport = paramiko.Transport(conn)
+        transport.add_server_key(key)
+        transport.start_server(server=Server())
+        state['Handshakes'] += 1
+        while True:
+            channel = transport.accept(None)
+            if channel is None:
+                return
+            threading.Thread(target=echo, args=(channel,), daemon=True).start()
+
+    def accept():
+        while True:
+            conn, _ = listener.accept()
+            threading.Thread(target=serve, args=(conn,), daemon=True).start()
+
+    threading.Thread(target=accept, daemon=True).start()
+    state['Port'] = listener.getsockname()[1]
+    yield state
+    listener.close()
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_interfaces_share_one_handshake(host):
+    first = EthernetClientInterface('127.0.0.1', host['Port'], 'SSH', Credentials=('admin', 'secret'))
+    second = EthernetClientInterface('127.0.0.1', host['Port'], 'SSH', Credentials=('admin', 'secret'))
+    received = []
+
+    @event(first, 'ReceiveData')
+    def handler(interface, data):
+        received.append(data)
+
+    assert first.Connect(5) == 'Connected'
+    assert second.Connect(5) == 'Connected'
+    first.Send(b'hello')
+    assert wait_for(lambda: b''.join(received) == b'HELLO')
+    first.Disconnect()
+    assert first.Connect(5) == 'Connected'
+    assert host['Handshakes'] == 1
+    first.Disconnect()
+    second.Disconnect()
+
+
+def test_bad_credentials(host):
+    interface = EthernetClientInterface('127.0.0.1', host['Port'], 'SSH', Credentials=('admin', 'wrong'))
+    assert interface.Connect(5) != 'Connected'
+
+
+def test_full_window_does_not_block_send(host):
+    interface = EthernetClientInterface('127.0.0.1', host['Port'], 'SSH', Credentials=('admin', 'secret'))
+    assert interface.Connect(5) == 'Connected'
+    interface.Send(b'hold')
+    time.sleep(0.2)
+    before = host['Received']
+    payload = b'x' * (8 * 1024 * 1024)
+    started = time.monotonic()
+    interface.Send(payload)
+    assert time.monotonic() - started < 1.0
+    assert interface._Stream.Pending > 0
+    host['Release'].set()
+    assert wait_for(lambda: host['Received'] - before == len(payload), timeout=20)
+    assert wait_for(lambda: interface._Stream.Pending == 0)
+    interface.Disconnect()
+
+
+class FakeChannel():
+    """ Stands in for a paramiko channel: takes at most Window bytes, reported by a socket pair descriptor. """
+
+    def __init__(self):
+        self.Window = 0
+        self.Data = bytearray()
+        self.closed = False
+        self.eof_received = False
+        self._Pair = socket.socketpair()
+        # Never writable to the poller, as a channel is not: only IOLoop.Ready() reports it.
+        self._Pair[0].setblocking(False)
+        try:
+            while True:
+                self._Pair[0].send(b'x' * 65536)
+        except BlockingIOError:
+            pass
+
+    def fileno(self):
+        return self._Pair[0].fileno()
+
+    def send_ready(self):
+        return self.Window > 0
+
+    def send(self, data):
+        sent = min(len(data), self.Window)
+        self.Window -= sent
+        self.Data += data[:sent]
+        return sent
+
+    def close(self):
+        self.closed = True
+        for sock in self._Pair:
+            sock.close()
+
+
+class FakeSession():
+
+    def __init__(self):
+        self.Released = 0
+
+    def _Release(self):
+        self.Released += 1
+
+
+def test_full_window_is_polled_in_real_time(virtual):
+    fake = FakeChannel()
+    channel = _SSHChannel(FakeSession(), fake)
+    fake.Window = 3
+    assert channel.send(b'hello') == 3
+    with pytest.raises(BlockingIOError):
+        channel.send(b'lo')
+    writable = threading.Event()
+    IOLoop.Register(channel, lambda: None, writable.set)
+    fake.Window = 100
+    # The virtual clock is not advanced: the window poll runs on the I/O loop.
+    assert writable.wait(1)
+    IOLoop.Unregister(channel)
+    channel.close()
+    assert fake.closed and channel._Entry is None
+
+
+def test_idle_session_expires_in_real_time(virtual, monkeypatch):
+    monkeypatch.setattr(SSHSession, 'IDLE_TIME', 0.05)
+    closed = threading.Event()
+    session = SSHSession.__new__(SSHSession)
+    session._Transport = type('Transport', (), {'close': lambda self: closed.set()})()
+    session._Key = ('127.0.0.1', 22, ('admin', 'secret'))
+    session._Channels = 1
+    session._Entry = None
+    SSHSession._Sessions[session._Key] = session
+    session._Release()
+    assert closed.wait(1)
+    assert session._Key not in SSHSession._Sessions
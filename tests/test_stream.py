@@ -0,0 +1,67 @@
+import math
+
+from extronlib.ui_wrapper import Level, Slider
+
+
+def test_drag_resets_the_deadband_reference(virtual, ui, writes):
+    slider = Slider(ui, 5)
+    slider.StartStreaming(10, Deadband=1)
+    slider.SetFill(10)
+    virtual.Advance(0.1)
+    ui._Input(5, 'Changed', 50)
+    slider.SetFill(10)
+    virtual.Advance(0.1)
+    assert writes == [[('SetFill', 5, 10)], [('SetFill', 5, 10)]]
+    slider.StopStreaming()
+
+
+def test_levels_fed_at_50_hz_are_sent_at_the_frame_rate(virtual, ui, writes):
+    levels = [Level(ui, ID) for ID in range(16)]
+    for level in levels:
+        level.StartStreaming(20)
+    for step in range(500):
+        for ID, level in enumerate(levels):
+            level.SetLevel(50 + round(40 * math.sin(step / 20 + ID)))
+        virtual.Advance(0.02)
+    # 8000 level changes over 10 seconds; at most one write per frame, each covering every level that changed.
+    assert len(writes) == 199
+    assert ui.GetStatistics()['Sent'] == sum(len(write) for write in writes)
+    for level in levels:
+        level.StopStreaming()
+
+
+def test_values_within_the_deadband_are_not_sent(virtual, ui, writes):
+    level = Level(ui, 1)
+    level.StartStreaming(10, Deadband=5)
+    level.SetLevel(50)
+    virtual.Advance(0.1)
+    level.SetLevel(53)
+    virtual.Advance(0.1)
+    level.SetLevel(40)
+    level.SetLevel(56)
+    virtual.Advance(0.1)
+    assert writes == [[('SetLevel', 1, 50)], [('SetLevel', 1, 56)]]
+    level.StopStreaming()
+
+
+def test_frames_fall_on_multiples_of_the_frame_period(virtual, ui, writes):
+    times = []
+    ui._Panel.Write = lambda commands: times.append(virtual.Now())
+    level = Level(ui, 1)
+    level.StartStreaming(4)
+    virtual.Advance(0.1)
+    level.SetLevel(10)
+    level.SetLevel(20)
+    virtual.Advance(1)
+    assert times == [0.25]
+    assert virtual.Pending() == 0
+
+
+def test_stop_sends_the_pending_value(virtual, ui, writes):
+    slider = Slider(ui, 5)
+    slider.StartStreaming(10)
+    slider.SetFill(30)
+    slider.StopStreaming()
+    assert writes == [[('SetFill', 5, 30)]]
+    slider.SetFill(40)
+    assert writes[-1] == [('SetFill', 5, 40)]
@@ -0,0 +1,115 @@
+import socket
+import time
+
+import pytest
+
+from extronlib.software import SummitConnect
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+@pytest.fixture
+def computers():
+    """ Returns a function creating a computer listening on a loopback address; the test gets (SummitConnect, listener). """
+    assert SummitConnect.SetListeningPorts([free_port(), free_port()]) == 'Listening'
+    created = []
+
+    def create(address):
+        listener = socket.socket()
+        listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        listener.bind((address, 0))
+        listener.listen()
+        listener.settimeout(2)
+        computer = SummitConnect(address, listener.getsockname()[1])
+        created.append((computer, listener))
+        return computer, listener
+
+    yield create
+    for computer, listener in created:
+        computer.Disconnect()
+        listener.close()
+    SummitConnect._Instances.clear()
+    SummitConnect.SetListeningPorts([])
+
+
+def push(source, port, data):
+    """ Connect from source to a listening port and send data, as the software does. """
+    sock = socket.socket()
+    sock.bind((source, 0))
+    sock.connect(('127.0.0.1', port))
+    sock.sendall(data)
+    return sock
+
+
+def test_inbound_data_is_routed_by_sender_address(computers):
+    first, first_listener = computers('127.0.0.1')
+    second, second_listener = computers('127.0.0.2')
+    received = []
+    for computer in (first, second):
+        computer.ReceiveData = lambda computer, data: received.append((computer.Hostname, data))
+        assert computer.Connect(2) == 'Connected'
+    # Instances are spread over the listening ports.
+    assert first.ListeningPort != second.ListeningPort
+    inbound = [push('127.0.0.2', first.ListeningPort, b'Call=Active'), push('127.0.0.1', first.ListeningPort, b'Mute=On')]
+    stranger = push('127.0.0.3', first.ListeningPort, b'Hello')
+    assert wait_for(lambda: len(received) == 2)
+    assert sorted(received) == [('127.0.0.1', b'Mute=On'), ('127.0.0.2', b'Call=Active')]
+    stranger.settimeout(2)
+    try:
+        assert stranger.recv(16) == b''
+    except ConnectionResetError:
+        pass
+    for sock in inbound + [stranger]:
+        sock.close()
+    first_listener.accept()[0].close()
+    second_listener.accept()[0].close()
+
+
+def test_data_sent_while_disconnected_is_queued(computers):
+    computer, listener = computers('127.0.0.1')
+    events = []
+    computer.Disconnected = lambda computer, state: events.append(state)
+    assert computer.Connect(2) == 'Connected'
+    peer, _ = listener.accept()
+    peer.close()
+    assert wait_for(lambda: events == ['Disconnected'])
+    computer.Send(b'Dial 100\r')
+    computer.Send('Mute\r')
+    with pytest.raises(IOError):
+        computer.Send(b'x' * SummitConnect.QUEUE_SIZE)
+    assert computer.Connect(2) == 'Connected'
+    peer, _ = listener.accept()
+    peer.settimeout(2)
+    assert peer.recv(64) == b'Dial 100\rMute\r'
+    peer.close()
+
+
+def test_disconnect_discards_the_queue(computers):
+    computer, listener = computers('127.0.0.1')
+    assert computer.Connect(2) == 'Connected'
+    peer, _ = listener.accept()
+    peer.close()
+    assert wait_for(lambda: computer._Stream is None)
+    computer.Send(b'Dial 100\r')
+    computer.Disconnect()
+    with pytest.raises(IOError):
+        computer.Send(b'Mute\r')
+
+
+def test_one_instance_per_host(computers):
+    computers('127.0.0.1')
+    with pytest.raises(ValueError):
+        SummitConnect('127.0.0.1')
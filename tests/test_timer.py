@@ -0,0 +1,52 @@
+from extronlib.system import Scheduler, Timer
+
+
+def busy(seconds):
+    # Handler run time, as seen by the virtual clock.
+    Scheduler._VirtualNow += seconds
+
+
+def test_timer_counts_on_absolute_deadlines(virtual):
+    ticks = []
+    Timer(1, lambda timer, count: ticks.append((Scheduler.Now(), count)))
+    Scheduler.Advance(3.5)
+    assert ticks == [(1, 1), (2, 2), (3, 3)]
+
+
+def test_minimum_interval():
+    assert Timer(0.01).Interval == 0.1
+
+
+def test_pause_resume_stop(virtual):
+    counts = []
+    timer = Timer(1, lambda timer, count: counts.append(count))
+    states = []
+    timer.StateChanged = lambda timer, state: states.append(state)
+    Scheduler.Advance(2)
+    timer.Pause()
+    Scheduler.Advance(5)
+    assert counts == [1, 2]
+    timer.Resume()
+    Scheduler.Advance(1)
+    assert counts == [1, 2, 3]
+    timer.Stop()
+    assert timer.Count == 0
+    assert states == ['Paused', 'Running', 'Stopped']
+
+
+def test_overrunning_handler_skips_intervals(virtual):
+    timer = Timer(1, lambda timer, count: busy(2.5))
+    Scheduler.Advance(1)
+    assert timer.Count == 1
+    assert timer.Skipped == 2
+    Scheduler.Advance(1)
+    assert timer.Count == 2
+
+
+def test_slow_neighbour_is_not_charged_as_skipped(virtual):
+    slow = Timer(1, lambda timer, count: busy(0.35))
+    fast = Timer(0.1, lambda timer, count: None)
+    Scheduler.Advance(3.05)
+    assert slow.Skipped == 0
+    assert fast.Skipped == 0
+    assert fast.GetStatistics()['Jitter'] > 0
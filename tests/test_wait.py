@@ -0,0 +1,54 @@
+from extronlib.system import Scheduler, Wait
+
+
+def test_wait_fires_once_after_time(virtual):
+    fired = []
+    Wait(10, lambda: fired.append(Scheduler.Now()))
+    Scheduler.Advance(9.9)
+    assert fired == []
+    Scheduler.Advance(100)
+    assert fired == [10]
+
+
+def test_wait_as_decorator(virtual):
+    fired = []
+
+    @Wait(5)
+    def handler():
+        fired.append(Scheduler.Now())
+
+    Scheduler.Advance(5)
+    assert fired == [5]
+
+
+def test_restart_add_change_and_cancel(virtual):
+    fired = []
+    wait = Wait(10, lambda: fired.append(Scheduler.Now()))
+    Scheduler.Advance(6)
+    wait.Restart()
+    Scheduler.Advance(9)
+    assert fired == []
+    Scheduler.Advance(1)
+    assert fired == [16]
+
+    wait.Restart()
+    wait.Add(5)
+    Scheduler.Advance(14.9)
+    assert fired == [16]
+    Scheduler.Advance(0.1)
+    assert fired == [16, 31]
+
+    wait.Change(1)
+    wait.Restart()
+    wait.Cancel()
+    Scheduler.Advance(100)
+    assert fired == [16, 31]
+
+
+def test_restarts_do_not_grow_the_heap(virtual):
+    waits = [Wait(300, lambda: None) for _ in range(100)]
+    for step in range(10000):
+        waits[step % 100].Restart()
+        Scheduler.Advance(0.01)
+    assert Scheduler.Pending() == 100
+    assert len(Scheduler._Heap) < 1000